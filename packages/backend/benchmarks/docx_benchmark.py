@@ -0,0 +1,338 @@
+"""
+Benchmarks the resume segmentation, serialization and deserialization stages of docx_functions
+against the synthetic corpus in resume_corpus.py
+
+Run from packages/backend (constants.py needs the usual .env):
+    PYTHONPATH=src uv run python benchmarks/docx_benchmark.py
+    PYTHONPATH=src uv run python benchmarks/docx_benchmark.py --update-baseline
+
+Stage times are stored relative to a calibration workload timed alongside them (loading, walking
+and saving the same resume with python-docx alone), so the baseline carries between machines.
+Stages whose relative time or memory peak regress past the tolerance against the stored baseline
+are timed again (--confirm-runs) and, if they still regress, reported and the script exits
+with a non-zero status.
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from docx import Document
+
+from docx_functions.docx_writer import save_docx_to_buffer
+from docx_functions.marshaling.deserialization import (
+    apply_section_patch,
+    update_resume_section,
+)
+from docx_functions.marshaling.serialization import serialize_sections
+from docx_functions.segmentation.segment_resume import parse_resume_for_sections
+from LLM_tailoring.resume.schema import (
+    ParagraphPatchOperation,
+    PatchOperationType,
+    SerializedParagraph,
+    SerializedRun,
+)
+
+from resume_corpus import build_corpus
+
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(__file__), "baselines", "docx_functions.json"
+)
+
+STAGES = ["segmentation", "serialization", "deserialization", "patching", "writing"]
+CALIBRATION_RUNS_PER_REPEAT = 3
+
+
+def is_bullet(para) -> bool:
+    return (para.style.name or "").startswith("List")
+
+
+def get_tailored_paragraphs(section) -> list[SerializedParagraph]:
+    """
+    Mimics an LLM response - headers are preserved and every bullet is rewritten
+    """
+    tailored = []
+    for para in section:
+        if is_bullet(para):
+            tailored.append(
+                SerializedParagraph(
+                    runs=[SerializedRun(text=f"Tailored {para.text}", styles=None)]
+                )
+            )
+        else:
+            tailored.append(
+                SerializedParagraph(
+                    runs=[SerializedRun(text=para.text, styles=None)], preserved=True
+                )
+            )
+    return tailored
+
+
+def get_patch_operations(section_name, section) -> list[ParagraphPatchOperation]:
+    """
+    Mimics a patch response - every bullet replaced, plus an insert after and a delete of each
+    job's first bullet
+    """
+    operations = []
+    prev_was_bullet = False
+    for idx, para in enumerate(section):
+        paragraph_id = f"{section_name}-{idx}"
+        if not is_bullet(para):
+            prev_was_bullet = False
+            continue
+
+        runs = [SerializedRun(text=f"Tailored {para.text}", styles=None)]
+        if not prev_was_bullet:
+            operations.append(
+                ParagraphPatchOperation(
+                    op=PatchOperationType.INSERT_AFTER, id=paragraph_id, runs=runs
+                )
+            )
+            operations.append(
+                ParagraphPatchOperation(op=PatchOperationType.DELETE, id=paragraph_id)
+            )
+        else:
+            operations.append(
+                ParagraphPatchOperation(
+                    op=PatchOperationType.REPLACE, id=paragraph_id, runs=runs
+                )
+            )
+        prev_was_bullet = True
+    return operations
+
+
+def run_pipeline(docx_bytes: bytes, measure) -> None:
+    """
+    Runs every stage once over a fresh copy of the document, measure(stage, fn) wraps each stage
+    """
+    source = io.BytesIO(docx_bytes)
+    sections, doc = measure("segmentation", lambda: parse_resume_for_sections(source))
+    measure("serialization", lambda: serialize_sections(sections))
+
+    tailored = get_tailored_paragraphs(sections["experience"])
+    measure(
+        "deserialization",
+        lambda: update_resume_section(sections["experience"], tailored),
+    )
+
+    # Patching needs an untouched copy as the experience section was just rewritten
+    patch_sections, _ = parse_resume_for_sections(io.BytesIO(docx_bytes))
+    operations = get_patch_operations("experience", patch_sections["experience"])
+    measure(
+        "patching",
+        lambda: apply_section_patch(
+            "experience", patch_sections["experience"], operations
+        ),
+    )
+
+    measure("writing", lambda: save_docx_to_buffer(doc, source))
+
+
+def run_calibration(docx_bytes: bytes):
+    """
+    A fixed python-docx workload over the document that doesn't touch docx_functions
+    """
+    doc = Document(io.BytesIO(docx_bytes))
+    for para in doc.paragraphs:
+        for run in para.runs:
+            run.text
+            run.bold
+    doc.save(io.BytesIO())
+
+
+def time_stages(docx_bytes: bytes, repeats: int) -> tuple[dict, dict]:
+    """
+    Returns each stage's median time in seconds and its median relative to the calibration
+    workload's median, which is timed in every repeat so both see the same machine load
+    """
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    calibration_timings = []
+
+    def measure(stage, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[stage].append(time.perf_counter() - start)
+        return result
+
+    for _ in range(repeats):
+        for _ in range(CALIBRATION_RUNS_PER_REPEAT):
+            start = time.perf_counter()
+            run_calibration(docx_bytes)
+            calibration_timings.append(time.perf_counter() - start)
+
+        run_pipeline(docx_bytes, measure)
+
+    medians = {stage: statistics.median(values) for stage, values in timings.items()}
+    calibration_s = statistics.median(calibration_timings)
+    return medians, {stage: median / calibration_s for stage, median in medians.items()}
+
+
+def memory_peaks(docx_bytes: bytes) -> dict[str, float]:
+    """
+    Peak traced allocation per stage in KiB, measured in a separate pass as tracing slows timings
+    """
+    peaks: dict[str, float] = {}
+
+    def measure(stage, fn):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks[stage] = (peak - baseline) / 1024
+        return result
+
+    tracemalloc.start()
+    try:
+        run_pipeline(docx_bytes, measure)
+    finally:
+        tracemalloc.stop()
+
+    return peaks
+
+
+def run_benchmarks(repeats: int) -> tuple[dict, dict]:
+    """
+    Returns the baseline comparable results (relative time and memory peak per stage)
+    and each stage's median time in seconds on this machine
+    """
+    results = {}
+    medians = {}
+    for name, docx_bytes in build_corpus().items():
+        timings, relative = time_stages(docx_bytes, repeats)
+        peaks = memory_peaks(docx_bytes)
+        results[name] = {
+            stage: {"relative_time": relative[stage], "peak_kib": peaks[stage]}
+            for stage in STAGES
+        }
+        medians[name] = timings
+    return results, medians
+
+
+def get_median_results(runs: list[dict]) -> dict:
+    """
+    Per metric median over several benchmark runs, so one unusually fast or slow run doesn't set the baseline
+    """
+    return {
+        name: {
+            stage: {
+                metric: statistics.median(run[name][stage][metric] for run in runs)
+                for metric in metrics
+            }
+            for stage, metrics in stages.items()
+        }
+        for name, stages in runs[0].items()
+    }
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> dict[str, list[str]]:
+    """
+    Regressed metrics keyed by resume
+    """
+    regressions: dict[str, list[str]] = {}
+    for name, stages in results.items():
+        for stage, metrics in stages.items():
+            baseline_metrics = baseline.get(name, {}).get(stage)
+            if baseline_metrics is None:
+                continue
+            for metric, value in metrics.items():
+                if metric not in baseline_metrics:
+                    continue
+                limit = baseline_metrics[metric] * (1 + tolerance)
+                if value > limit:
+                    regressions.setdefault(name, []).append(
+                        f"{name}/{stage} {metric}: {value:.4f} > {baseline_metrics[metric]:.4f} (+{tolerance:.0%})"
+                    )
+    return regressions
+
+
+def retime_resumes(results: dict, medians: dict, names, repeats: int):
+    """
+    Times the given resumes again and keeps each stage's faster relative time, so a burst of
+    load on the host during one measurement isn't reported as a regression
+    """
+    corpus = build_corpus()
+    for name in names:
+        timings, relative = time_stages(corpus[name], repeats)
+        for stage in STAGES:
+            if relative[stage] < results[name][stage]["relative_time"]:
+                results[name][stage]["relative_time"] = relative[stage]
+                medians[name][stage] = timings[stage]
+
+
+def print_results(results: dict, medians: dict, baseline: dict):
+    print(
+        f"{'resume':8} {'stage':16} {'median ms':>10} {'relative':>10} {'base rel':>10} {'peak KiB':>10}"
+    )
+    for name, stages in results.items():
+        for stage, metrics in stages.items():
+            baseline_relative = (
+                baseline.get(name, {}).get(stage, {}).get("relative_time")
+            )
+            baseline_text = (
+                f"{baseline_relative:10.3f}" if baseline_relative else f"{'-':>10}"
+            )
+            print(
+                f"{name:8} {stage:16} {medians[name][stage] * 1000:10.2f} {metrics['relative_time']:10.3f} {baseline_text} {metrics['peak_kib']:10.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--baseline-runs",
+        type=int,
+        default=3,
+        help="Benchmark runs the baseline is the median of",
+    )
+    parser.add_argument(
+        "--confirm-runs",
+        type=int,
+        default=2,
+        help="Times resumes with regressions are timed again before they are reported",
+    )
+    args = parser.parse_args()
+
+    results, medians = run_benchmarks(args.repeats)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r") as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        print_results(results, medians, baseline)
+        runs = [results] + [
+            run_benchmarks(args.repeats)[0] for _ in range(args.baseline_runs - 1)
+        ]
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(get_median_results(runs), f, indent=2)
+        print(f"Baseline written to {BASELINE_PATH}")
+        return
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for _ in range(args.confirm_runs):
+        if not regressions:
+            break
+        retime_resumes(results, medians, regressions, args.repeats)
+        regressions = find_regressions(results, baseline, args.tolerance)
+
+    print_results(results, medians, baseline)
+
+    if regressions:
+        print("\nRegressions:")
+        for messages in regressions.values():
+            print("\n".join(messages))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmarks fetch_job_description_markdown against the local LinkedIn fixture server
+(linkedin_fixture_server.py), so the fetch stack can be tuned without hitting LinkedIn
+
+Run from packages/backend (constants.py needs the usual .env):
+    PYTHONPATH=src uv run python benchmarks/fetch_benchmark.py
+    PYTHONPATH=src uv run python benchmarks/fetch_benchmark.py --requests 64 --concurrency 16
+
+Each scenario fetches distinct job ids concurrently through the real client (pooling, retries,
+backoff and per-host limits) and reports throughput, latency percentiles, retries (requests the
+server saw beyond one per call) and failures. The job description cache is kept in memory only,
+so nothing is read from or written to the realtime db.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from linkedin_fixture_server import LinkedInFixtureServer
+
+
+@dataclass
+class Scenario:
+    name: str
+    latency_ms: float = 0
+    rate_429: float = 0
+    rate_403: float = 0
+    # Every call asks for the same job, so all but the first are served from the cache
+    same_job: bool = False
+
+
+SCENARIOS = [
+    Scenario("clean"),
+    Scenario("latency 150ms", latency_ms=150),
+    Scenario("429 at 20%", latency_ms=50, rate_429=0.2),
+    Scenario("403 at 10%", latency_ms=50, rate_403=0.1),
+    Scenario("cached repeats", latency_ms=150, same_job=True),
+]
+
+FIRST_JOB_ID = 4_000_000_000
+
+
+def get_memory_only_cache():
+    from linkedin_fetching.job_description_cache import JobDescriptionCache
+
+    class MemoryOnlyJobDescriptionCache(JobDescriptionCache):
+        def get_from_shared_cache(self, job_id):
+            return None
+
+        def set_in_shared_cache(self, job_id, fetched_at, markdown):
+            pass
+
+    return MemoryOnlyJobDescriptionCache()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run_scenario(
+    scenario: Scenario, server: LinkedInFixtureServer, requests: int, concurrency: int
+) -> dict:
+    from linkedin_fetching import fetch_job_description
+
+    fetch_job_description.job_description_cache = get_memory_only_cache()
+    server.configure(
+        latency_ms=scenario.latency_ms,
+        rate_429=scenario.rate_429,
+        rate_403=scenario.rate_403,
+    )
+
+    def fetch(idx: int):
+        job_id = FIRST_JOB_ID if scenario.same_job else FIRST_JOB_ID + idx
+        url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+        start = time.perf_counter()
+        try:
+            fetch_job_description.fetch_job_description_markdown(url)
+            failed = False
+        except Exception:
+            failed = True
+        return time.perf_counter() - start, failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(fetch, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in outcomes]
+    server_requests = sum(server.status_counts.values())
+    fetches = requests if not scenario.same_job else 1
+    return {
+        "throughput": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "server_requests": server_requests,
+        "retries": max(0, server_requests - fetches),
+        "failures": sum(failed for _, failed in outcomes),
+    }
+
+
+def time_parsers(repeats: int) -> dict[str, float]:
+    """
+    Median ms to parse one padded fixture page, with the fragment fast path and with soup
+    """
+    from linkedin_fetching.fetch_job_description import (
+        parse_job_description,
+        parse_job_description_with_soup,
+    )
+    from linkedin_fixture_server import load_fixture_pages
+
+    html = next(iter(load_fixture_pages(300).values())).decode("utf-8")
+    timings = {}
+    for name, parse in [
+        ("fragment", parse_job_description),
+        ("soup", parse_job_description_with_soup),
+    ]:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            parse(html)
+            samples.append(time.perf_counter() - start)
+        timings[name] = statistics.median(samples) * 1000
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--parse-repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    # Must be set before constants is imported, which happens lazily in the helpers above
+    if "constants" in sys.modules:
+        sys.exit("LINKEDIN_BASE_URL must be set before constants.py is imported")
+    os.environ["LINKEDIN_BASE_URL"] = f"http://127.0.0.1:{args.port}"
+
+    # One server for every scenario, the client's pooled connections outlive a server restart
+    with LinkedInFixtureServer(port=args.port) as server:
+        results = {
+            scenario.name: run_scenario(
+                scenario, server, args.requests, args.concurrency
+            )
+            for scenario in SCENARIOS
+        }
+
+    print()
+    print(
+        f"{'scenario':16} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'sent':>6} {'retries':>8} {'failed':>7}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:16} {result['throughput']:8.1f} {result['p50_ms']:8.1f} {result['p95_ms']:8.1f}"
+            f" {result['server_requests']:6} {result['retries']:8} {result['failures']:7}"
+        )
+    print()
+    for name, ms in time_parsers(args.parse_repeats).items():
+        print(f"parse ({name}): {ms:.2f} ms per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Local stand-in for LinkedIn's guest job pages, for exercising the job fetch stack offline
+
+Serves /jobs/view/<job id>/ from tests/fixtures/linkedin/job_<job id>.html, falling back to the
+first fixture for unknown ids. Pages are padded with inline scripts to the size of a real job page
+(mostly scripts and chrome) and responses can be delayed or failed with 429s and 403s at set rates.
+
+Run standalone and point the backend at it:
+    python benchmarks/linkedin_fixture_server.py --port 8765 --rate-429 0.1
+    LINKEDIN_BASE_URL=http://127.0.0.1:8765 ...
+"""
+
+import argparse
+import glob
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+FIXTURES_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "linkedin"
+)
+JOB_PATH = re.compile(r"^/jobs/view/(\d+)/?$")
+
+
+def load_fixture_pages(padding_kb: int) -> dict[str, bytes]:
+    """
+    Returns job id -> page bytes, with padding_kb of inline script added to each page's head
+    """
+    padding = "".join(
+        f'<script type="application/json">{{"i": {idx}, "data": "{"x" * 1000}"}}</script>\n'
+        for idx in range(padding_kb)
+    )
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_PATH, "job_*.html"))):
+        job_id = os.path.basename(path)[len("job_") : -len(".html")]
+        with open(path, "r") as f:
+            page = f.read()
+        pages[job_id] = page.replace("</head>", f"{padding}</head>", 1).encode("utf-8")
+    return pages
+
+
+class LinkedInFixtureServer:
+    def __init__(
+        self,
+        port: int = 0,
+        latency_ms: float = 0,
+        rate_429: float = 0,
+        rate_403: float = 0,
+        padding_kb: int = 300,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.rate_429 = rate_429
+        self.rate_403 = rate_403
+        self.pages = load_fixture_pages(padding_kb)
+        self.default_page = next(iter(self.pages.values()))
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.status_counts: Counter = Counter()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def configure(self, latency_ms: float = 0, rate_429: float = 0, rate_403: float = 0):
+        """
+        Changes the injected faults and resets the counts, without dropping kept-alive connections
+        """
+        with self.lock:
+            self.latency_ms = latency_ms
+            self.rate_429 = rate_429
+            self.rate_403 = rate_403
+            self.status_counts = Counter()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def pick_status(self, job_id: str | None) -> int:
+        if job_id is None:
+            return 404
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.rate_403:
+            return 403
+        return 200
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        match = JOB_PATH.match(request.path.split("?")[0])
+        status = self.pick_status(match.group(1) if match else None)
+        with self.lock:
+            self.status_counts[status] += 1
+
+        body = b""
+        if status == 200:
+            body = self.pages.get(match.group(1), self.default_page)
+
+        request.send_response(status)
+        request.send_header("Content-Type", "text/html; charset=utf-8")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self) -> "LinkedInFixtureServer":
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--rate-429", type=float, default=0)
+    parser.add_argument("--rate-403", type=float, default=0)
+    parser.add_argument("--padding-kb", type=int, default=300)
+    args = parser.parse_args()
+
+    server = LinkedInFixtureServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        rate_429=args.rate_429,
+        rate_403=args.rate_403,
+        padding_kb=args.padding_kb,
+    )
+    print(f"Serving LinkedIn fixtures on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Synthetic resume corpus for the docx_functions benchmarks
+
+Resumes are generated deterministically (seeded) so timings are comparable between runs.
+They include a contact table, a skills table, built-in and hand formatted headings,
+nested bullet lists and bullets split into many differently styled runs.
+"""
+
+import io
+import random
+
+from docx import Document
+from docx.shared import Pt
+
+
+# name -> (jobs, bullets per job, runs per bullet)
+CORPUS_SIZES = {
+    "small": (2, 3, 2),
+    "medium": (5, 5, 4),
+    "large": (10, 8, 6),
+    "xlarge": (25, 10, 8),
+}
+
+WORDS = (
+    "led built designed migrated scaled automated reduced improved launched owned "
+    "python typescript react firebase pipelines latency costs revenue customers "
+    "team platform services dashboards analytics infrastructure testing deployment"
+).split()
+
+SKILLS = [
+    "Python",
+    "TypeScript",
+    "React",
+    "Firebase",
+    "GCP",
+    "Docker",
+    "PostgreSQL",
+    "Kubernetes",
+    "Scrum",
+    "GraphQL",
+]
+
+
+def add_section_heading(doc: Document, text: str, builtin_style: bool):
+    """
+    Alternates between built-in Heading styles and hand formatted (bold, caps, large) headings
+    """
+    if builtin_style:
+        return doc.add_heading(text, level=1)
+
+    para = doc.add_paragraph()
+    run = para.add_run(text.upper())
+    run.bold = True
+    run.font.size = Pt(14)
+    para.paragraph_format.space_before = Pt(12)
+    return para
+
+
+def add_bullet(doc: Document, rnd: random.Random, runs_per_bullet: int, nested: bool):
+    para = doc.add_paragraph(style="List Bullet 2" if nested else "List Bullet")
+    for _ in range(runs_per_bullet):
+        run = para.add_run(" ".join(rnd.choices(WORDS, k=rnd.randint(2, 6))) + " ")
+        run.bold = rnd.random() < 0.2
+        run.italic = rnd.random() < 0.1
+        run.font.size = Pt(10)
+    return para
+
+
+def build_resume(
+    jobs: int, bullets_per_job: int, runs_per_bullet: int, seed: int = 0
+) -> bytes:
+    """
+    Builds a synthetic resume and returns the .docx bytes
+    """
+    rnd = random.Random(seed)
+    doc = Document()
+
+    contact = doc.add_table(rows=2, cols=2)
+    contact.cell(0, 0).text = "Jordan Example"
+    contact.cell(0, 1).text = "jordan@example.com"
+    contact.cell(1, 0).text = "Austin, Texas"
+    contact.cell(1, 1).text = "linkedin.com/in/jordan-example"
+
+    add_section_heading(doc, "Summary", builtin_style=True)
+    doc.add_paragraph(" ".join(rnd.choices(WORDS, k=40)))
+
+    add_section_heading(doc, "Professional Experience", builtin_style=False)
+    for job_idx in range(jobs):
+        company = doc.add_paragraph()
+        company.add_run(f"Company {job_idx} Inc.").bold = True
+        company.add_run(" | ")
+        company.add_run(f"Senior Engineer {job_idx}").italic = True
+        company.add_run(" | Austin, TX | Jan 2020 - Present")
+
+        for bullet_idx in range(bullets_per_job):
+            # Every third bullet gets a nested sub-bullet
+            add_bullet(doc, rnd, runs_per_bullet, nested=False)
+            if bullet_idx % 3 == 2:
+                add_bullet(doc, rnd, runs_per_bullet, nested=True)
+
+    add_section_heading(doc, "Technical Skills", builtin_style=True)
+    skills = doc.add_table(rows=len(SKILLS) // 2, cols=2)
+    for idx, skill in enumerate(SKILLS):
+        cell = skills.cell(idx // 2, idx % 2)
+        cell.paragraphs[0].add_run(f"{skill}: ").bold = True
+        cell.paragraphs[0].add_run(", ".join(rnd.choices(WORDS, k=3)))
+
+    add_section_heading(doc, "Education", builtin_style=False)
+    doc.add_paragraph("University of Example - B.S. Computer Science")
+
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def build_corpus(seed: int = 0) -> dict[str, bytes]:
+    return {
+        name: build_resume(*sizes, seed=seed) for name, sizes in CORPUS_SIZES.items()
+    }
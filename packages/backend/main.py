@@ -1,25 +1,33 @@
 import json
 
-from docx_to_pdf import convert_docx_to_pdf
 from firebase import init_firebase
 from firebase.buckets import (
     get_stored_resumes,
+    list_stored_resume_metadata,
     upload_resume_from_file,
     fetch_and_download_resume,
-    get_cached_pdf_url,
-    upload_pdf_to_cache,
 )
-from firebase_functions import https_fn, options
+from firebase.object_cache import sweep_expired_cache_entries
+from firebase_functions import https_fn, options, scheduler_fn
 from functions.free_reponse.request_handler import handle_write_free_response_request
 from functions.inputs_autofill_helper.embeddings import get_stored_prototype_embeddings
 from functions.inputs_autofill_helper.request_handler import handle_autofill_request
 from functions.tailor_cover_letter.request_handler import (
     handle_cover_letter_tailor_request,
 )
+from functions.prefetch_job_description.request_handler import (
+    handle_prefetch_job_description_request,
+)
 from functions.tailor_resume.request_handler import handle_resume_tailor_request
 from functions.tailoring_questions.request_handler import (
     handle_resume_questions_request,
 )
+from pdf_cache import get_or_convert_pdf_url
+from pdf_conversion_jobs import (
+    get_pdf_conversion_status,
+    sweep_expired_pdf_conversion_jobs,
+)
+from resume_ingest import ingest_resume
 from src.functions.save_filled_values_helper.request_handler import (
     handle_save_filled_values_request,
 )
@@ -45,6 +53,22 @@ def health_check(req: https_fn.Request) -> https_fn.Response:
     )
 
 
+@scheduler_fn.on_schedule(schedule="every 1 hours")
+def sweep_object_cache(event: scheduler_fn.ScheduledEvent) -> None:
+    """
+    Deletes expired entries from the realtime db object cache, which are never read again
+    """
+    sweep_expired_cache_entries()
+
+
+@scheduler_fn.on_schedule(schedule="every 1 hours")
+def sweep_pdf_conversion_jobs(event: scheduler_fn.ScheduledEvent) -> None:
+    """
+    Deletes PDF conversion jobs that finished, or got stuck pending, long enough ago
+    """
+    sweep_expired_pdf_conversion_jobs()
+
+
 @https_fn.on_request(
     cors=options.CorsOptions(
         cors_origins=["*"],
@@ -55,6 +79,7 @@ def on_request(req: https_fn.Request) -> https_fn.Response:
     """
     Main entry point for the function. This function routes between handle_resume_questions_request and handle_resume_tailor_request.
     We could have two functions but because we have low traffic we want to prevent two cold starts
+    prefetch_job_description is routed here too, so the instance it warms is the one get_questions hits
     """
     function = req.args.get("function")
     if function == "get_questions":
@@ -67,17 +92,25 @@ def on_request(req: https_fn.Request) -> https_fn.Response:
             job_description_link=jobDescriptionLink,
         )
 
+    elif function == "prefetch_job_description":
+        jobDescriptionLink = req.args.get("jobDescriptionLink")
+        return handle_prefetch_job_description_request(
+            job_description_link=jobDescriptionLink,
+        )
+
     elif function == "tailor_resume":
         user_id = req.args.get("userId")
         file_name = req.args.get("fileName")
         chat_id = req.args.get("chatId")
         question_answers = req.args.get("questionAnswers")
+        async_pdf = req.args.get("asyncPdf") == "true"
 
         return handle_resume_tailor_request(
             user_id=user_id,
             file_name=file_name,
             chat_id=chat_id,
             question_answers=question_answers,
+            async_pdf=async_pdf,
         )
 
     else:
@@ -187,13 +220,30 @@ def upload_resume(req: https_fn.Request) -> https_fn.Response:
         public=True,
     )
 
-    pdf_url = convert_docx_to_pdf(uploaded_file)
+    # Ingest renders the PDF into the conversion cache and caches the parsed sections,
+    # so the first preview and tailoring requests are cache hits
+    uploaded_file.seek(0)
+    async_pdf = req.args.get("asyncPdf") == "true"
+    ingest_fields = ingest_resume(uploaded_file.read(), async_pdf=async_pdf)
+
+    # With asyncPdf the PDF is converted in the background and fetched from get_pdf_status
+    if async_pdf:
+        return https_fn.Response(
+            json.dumps(
+                {
+                    "message": "Resume uploaded",
+                    "docx_url": public_url,
+                    "pdf_job_id": ingest_fields["pdf_job_id"],
+                }
+            ),
+            status=200,
+        )
 
     return https_fn.Response(
         json.dumps(
             {
                 "message": "Resume uploaded",
-                "public_url": pdf_url,
+                "public_url": ingest_fields["pdf_url"],
             }
         ),
         status=200,
@@ -208,10 +258,56 @@ def upload_resume(req: https_fn.Request) -> https_fn.Response:
 )
 def get_resume_list(req: https_fn.Request) -> https_fn.Response:
     user_id = req.args.get("userId")
-    resumes = get_stored_resumes(user_id)
+    resume_metadata = list_stored_resume_metadata(user_id)
+    resumes = get_stored_resumes(user_id, resume_metadata)
+
+    return https_fn.Response(
+        json.dumps(
+            {
+                "message": "Resumes fetched",
+                "resumes": resumes,
+                "resume_metadata": resume_metadata,
+            }
+        ),
+        status=200,
+    )
+
+
+@https_fn.on_request(
+    cors=options.CorsOptions(
+        cors_origins=["*"],
+        cors_methods=["GET", "OPTIONS"],
+    )
+)
+def get_pdf_status(req: https_fn.Request) -> https_fn.Response:
+    """
+    Reports a background PDF conversion started with asyncPdf
+    waitSeconds (max 25) long polls until the conversion finishes
+    """
+    job_id = req.args.get("jobId")
+    if not job_id:
+        return https_fn.Response(
+            json.dumps({"message": "Missing jobId parameter"}),
+            status=400,
+        )
+
+    try:
+        wait_seconds = float(req.args.get("waitSeconds", 0))
+    except ValueError:
+        return https_fn.Response(
+            json.dumps({"message": "waitSeconds must be a number"}),
+            status=400,
+        )
+
+    job = get_pdf_conversion_status(job_id, wait_seconds)
+    if job is None:
+        return https_fn.Response(
+            json.dumps({"message": f"No PDF conversion job {job_id}"}),
+            status=404,
+        )
 
     return https_fn.Response(
-        json.dumps({"message": "Resumes fetched", "resumes": resumes}),
+        json.dumps({"message": "PDF conversion status", "job_id": job_id, **job}),
         status=200,
     )
 
@@ -233,48 +329,11 @@ def convert_resume_to_pdf(req: https_fn.Request) -> https_fn.Response:
         )
 
     try:
-        # Check if cached PDF already exists
-        cached_pdf_url = get_cached_pdf_url(user_id, file_name)
-        print("cached_pdf_url", cached_pdf_url)
-
-        if cached_pdf_url:
-            print(
-                "cache hit",
-                {
-                    "message": "PDF found in cache",
-                    "fileName": file_name,
-                    "public_url": cached_pdf_url,
-                },
-            )
-            return https_fn.Response(
-                json.dumps(
-                    {
-                        "message": "PDF found in cache",
-                        "fileName": file_name,
-                        "public_url": cached_pdf_url,
-                    }
-                ),
-                status=200,
-            )
-
-        # If not cached, proceed with conversion
-        print("cache miss - converting file")
-
         # Download the file from Firebase storage
         local_file_path = fetch_and_download_resume(user_id, file_name)
 
-        # Convert the downloaded file to PDF
-        pdf_url = convert_docx_to_pdf(local_file_path)
-
-        # Cache the converted PDF
-        try:
-            cached_pdf_url = upload_pdf_to_cache(pdf_url, user_id, file_name)
-            print(f"PDF cached successfully: {cached_pdf_url}")
-            # Return the cached URL instead of the original CloudConvert URL
-            pdf_url = cached_pdf_url
-        except Exception as cache_error:
-            print(f"Warning: Failed to cache PDF: {str(cache_error)}")
-            # Continue with original PDF URL if caching fails
+        # Converted PDFs are cached by the hash of the DOCX, so this only converts new versions
+        pdf_url = get_or_convert_pdf_url(local_file_path)
 
         print(
             "success",
@@ -2,7 +2,7 @@ from typing import Union
 from LLM_tailoring.resume.resume_prompt import LLM_SYSTEM_INSTRUCTIONS
 from google.genai import types
 from LLM_tailoring.resume.schema import (
-    ResumeContent,
+    ResumePatchContent,
     ResumeResponseSchema,
     ResumeTailoringQuestions,
 )
@@ -23,7 +23,7 @@ def get_content_config() -> types.GenerateContentConfig:
     return content_config
 
 
-def tailor_resume_with_llm(prompt: str, chat_history: dict):
+def tailor_resume_with_llm(prompt: str, chat_history: dict) -> ResumePatchContent:
     return execute_tailoring_with_gemini(
         prompt=prompt,
         content_config=get_content_config(),
@@ -18,7 +18,12 @@ For the experience_questions list, each question should be an object with:
 Each question should correspond to a specific intended change to a paragraph. You must have between 1-3 questions. Do not ask obvious questions or interest based questions where if the answer indicates lack of experience the user would not be applying. 
 
 ## 2: Tailor the resume - do not attempt until you have been provided with the second message containing the paragraphs and the user's answers to the questions.
-You will be provided the specific paragraphs and runs from the resume's word doc and required to output a similar structure, this time with the tailored content. 
+You will be provided the specific paragraphs and runs from the resume's word doc, each with an `id`. Do not resend the sections - instead reply with a list of edit operations for each section:
+- keep: leave the paragraph with this id exactly as it is. Any paragraph you do not mention is kept, so you never need to list unchanged paragraphs
+- replace: rewrite the paragraph with this id using the given runs (and optionally list_indent_level). The paragraph's original formatting is kept
+- insert_after: add a new paragraph with the given runs (and list_indent_level) after the paragraph with this id. Several inserts after the same id appear in the order you give them. The new paragraph copies the formatting of the paragraph with this id, so add new bullet points after an existing bullet point rather than after a heading whenever possible
+- delete: remove the paragraph with this id
+Only send runs for replace and insert_after. To reorder paragraphs, delete them and insert them again in their new position.
 
 For the experience section, you may:
 - reorder paragraphs (within each job experience)
@@ -37,16 +42,15 @@ Be extremely mindful of the job description - making sure every important keywor
 
 Keep in mind, list_indent_level = 0 is an indented bullet point, and list_indent_level = 1 is the first level of sub-bullets
 
-One element of your output, the `preserved` flag is very important. It indicates whether preserving the original formatting for this paragraph is necessary or whether it can be generically overwritten. Often things like job titles or dates are positioned or formatted differently in a way that is not displayed to you through the raw runs. These should be preserved. Things with formatting that need to be preserved are:
+Paragraphs whose formatting is positioned or styled differently in a way that is not displayed to you through the raw runs must never be replaced or deleted - leave them out of your operations so they are kept. These are:
 - titles/headers of any kind - even those that just contextualize bullet points
 - company names
 - job titles
 - projects
 - standalone dates or locations that are outside of the flow of a bullet point
-pay attention to things like bold and underline, if the text is short, prefaces some bullets and is bolded/underlined, that is a very strong indicator that it should be preserved
-The flag should be false for things like:
-- bullet points
-Be liberal in what you preserve, it is better to err on the side of preserving.
+pay attention to things like bold and underline, if the text is short, prefaces some bullets and is bolded/underlined, that is a very strong indicator that it should be kept
+Bullet points are what you should be replacing, inserting and deleting.
+Be liberal in what you keep, it is better to err on the side of keeping.
 """
 
 LLM_QUESTIONS_PROMPT_TEMPLATE = """
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Optional, Union
 from pydantic import BaseModel
 
@@ -16,9 +17,28 @@ class SerializedParagraph(BaseModel):
         return "".join(run.text for run in self.runs)
 
 
-class ResumeContent(BaseModel):
-    experienceSection: list[SerializedParagraph]
-    skillsSection: list[SerializedParagraph]
+class PatchOperationType(Enum):
+    KEEP = "keep"
+    REPLACE = "replace"
+    INSERT_AFTER = "insert_after"
+    DELETE = "delete"
+
+
+class ParagraphPatchOperation(BaseModel):
+    """
+    An edit to a single paragraph, addressed by the id given to it in serialize_sections
+    runs and list_indent_level are only used by replace and insert_after
+    """
+
+    op: PatchOperationType
+    id: str
+    runs: Optional[list[SerializedRun]] = None
+    list_indent_level: Optional[int] = None
+
+
+class ResumePatchContent(BaseModel):
+    experienceSection: list[ParagraphPatchOperation]
+    skillsSection: list[ParagraphPatchOperation]
     skillsAdded: list[str]
 
 
@@ -47,7 +67,7 @@ class CoverLetterSchema(BaseModel):
     content: list[SerializedParagraph]
 
 
-ResumeResponseSchema = Union[ResumeTailoringQuestions, ResumeContent]
+ResumeResponseSchema = Union[ResumeTailoringQuestions, ResumePatchContent]
 
 
 class AnsweredTailoringQuestion(BaseModel):
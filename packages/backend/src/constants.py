@@ -19,7 +19,9 @@ def validate_env_vars():
     optional_vars = {
         "CACHE_LLM_RESPONSES": "Controls LLM response caching (defaults to False)",
         "CLOUDCONVERT_API_KEY": "Required for DOCX to PDF conversion",
-        "PROXY_URL": "Optional proxy for LinkedIn fetching"
+        "PROXY_URL": "Optional proxy (or comma separated proxies to rotate through) for LinkedIn fetching",
+        "PDF_CONVERTER": "PDF conversion backend - 'cloudconvert' (default) or 'libreoffice'",
+        "RESUME_URL_MODE": "How resume list URLs are built - 'public' (bucket-level public read, default) or 'signed'",
     }
 
     missing_essential = []
@@ -57,6 +59,17 @@ GCP_API_KEY = os.environ.get("GCP_AI_API_KEY")
 CACHE_LLM_RESPONSES = os.environ.get("CACHE_LLM_RESPONSES")
 CLOUDCONVERT_API_KEY = os.environ.get("CLOUDCONVERT_API_KEY")
 PROXY_URL = os.environ.get("PROXY_URL")
+PROXY_URLS = [url.strip() for url in (PROXY_URL or "").split(",") if url.strip()]
+# Overridden to point job fetching at the local fixture server in benchmarks/
+LINKEDIN_BASE_URL = os.environ.get("LINKEDIN_BASE_URL") or "https://www.linkedin.com"
+RESUME_URL_MODE = os.environ.get("RESUME_URL_MODE") or "public"
+
+PDF_CONVERTER = os.environ.get("PDF_CONVERTER") or "cloudconvert"
+SOFFICE_PATH = os.environ.get("SOFFICE_PATH") or "soffice"
+UNOSERVER_PATH = os.environ.get("UNOSERVER_PATH") or "unoserver"
+LIBREOFFICE_POOL_SIZE = int(os.environ.get("LIBREOFFICE_POOL_SIZE") or 2)
+LIBREOFFICE_TIMEOUT_SECONDS = float(os.environ.get("LIBREOFFICE_TIMEOUT_SECONDS") or 30)
+LIBREOFFICE_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("LIBREOFFICE_QUEUE_TIMEOUT_SECONDS") or 60)
 
 PROJECT_ID = "jobsearchhelper-231cf"
 REGION = "us-central1"
@@ -0,0 +1,266 @@
+from collections import Counter
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+from docx_functions.general import iter_doc_paragraphs
+
+
+class ResolvedFont:
+    """
+    The effective font of a style after walking its base_style chain.
+    Attributes are None when no style in the chain defines them.
+    """
+
+    __slots__ = ("size", "bold", "italic", "underline", "all_caps")
+
+    def __init__(
+        self,
+        size: float | None = None,
+        bold: bool | None = None,
+        italic: bool | None = None,
+        underline: bool | None = None,
+        all_caps: bool | None = None,
+    ):
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self.underline = underline
+        self.all_caps = all_caps
+
+
+def get_default_font_size(doc: Document) -> float | None:
+    """
+    Reads the document wide default run size from <w:docDefaults> (in Pt)
+    """
+    doc_defaults = doc.styles.element.find(qn("w:docDefaults"))
+    if doc_defaults is None:
+        return None
+
+    sz = doc_defaults.find(f"{qn('w:rPrDefault')}/{qn('w:rPr')}/{qn('w:sz')}")
+    if sz is None:
+        return None
+
+    # w:sz is stored in half points
+    return int(sz.get(qn("w:val"))) / 2
+
+
+def resolve_style_font(style, default_size: float | None = None) -> ResolvedFont:
+    """
+    Resolves a style's font through its base_style chain, the closest style
+    defining an attribute wins
+    """
+    resolved = ResolvedFont()
+    while style is not None:
+        font = style.font
+        if resolved.size is None and font.size is not None:
+            resolved.size = font.size.pt
+        for attr in ("bold", "italic", "underline", "all_caps"):
+            if getattr(resolved, attr) is None:
+                setattr(resolved, attr, getattr(font, attr))
+        style = style.base_style
+
+    if resolved.size is None:
+        resolved.size = default_size
+
+    return resolved
+
+
+def count_letters(text: str) -> tuple[int, int]:
+    """
+    (letters, uppercase letters) in text
+    """
+    letters = uppercase = 0
+    for c in text:
+        if c.isalpha():
+            letters += 1
+            if c.isupper():
+                uppercase += 1
+
+    return letters, uppercase
+
+
+class ParagraphStats:
+    """
+    The run and letter counts heading detection needs for one paragraph
+    """
+
+    __slots__ = (
+        "run_count",
+        "bold_run_count",
+        "max_font_size",
+        "letter_count",
+        "uppercase_count",
+    )
+
+    def __init__(self):
+        self.run_count = 0
+        self.bold_run_count = 0
+        self.max_font_size: float | None = None
+        self.letter_count = 0
+        self.uppercase_count = 0
+
+    @property
+    def uppercase_ratio(self) -> float:
+        return self.uppercase_count / self.letter_count if self.letter_count else 0.0
+
+
+class DocumentStats:
+    """
+    Style statistics computed in a single pass over a document
+
+    Holds a style id -> resolved font table so heading detection and serialization
+    can look up inherited formatting in O(1) instead of re-walking styles per run,
+    per paragraph run and letter counts so heading signals don't rescan each paragraph's runs,
+    along with font size, bold and caps distributions over every paragraph (tables included)
+    """
+
+    # Fraction of a paragraph's letters that are uppercase for it to count towards caps_ratio
+    CAPS_RATIO = 0.8
+
+    def __init__(self, doc: Document):
+        self.default_size = get_default_font_size(doc)
+
+        self.fonts_by_style_id: dict[str, ResolvedFont] = {
+            style.style_id: resolve_style_font(style, self.default_size)
+            for style in doc.styles
+            if style.type in (WD_STYLE_TYPE.PARAGRAPH, WD_STYLE_TYPE.CHARACTER)
+        }
+
+        default_paragraph_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        self.default_paragraph_style_id = (
+            default_paragraph_style.style_id if default_paragraph_style else None
+        )
+        self._default_font = ResolvedFont(size=self.default_size)
+
+        self.font_size_counts: Counter[float] = Counter()
+        self.bold_run_count = 0
+        self.run_count = 0
+        self.caps_paragraph_count = 0
+        self.paragraph_count = 0
+        # Keyed by the paragraph's element, which stays alive (and so keeps its identity) while held here
+        self.paragraph_stats_by_element: dict = {}
+
+        for para in iter_doc_paragraphs(doc):
+            self._add_paragraph(para)
+
+        total_sized_runs = sum(self.font_size_counts.values())
+        self.average_font_size = (
+            sum(size * count for size, count in self.font_size_counts.items())
+            / total_sized_runs
+            if total_sized_runs
+            else None
+        )
+
+    def _add_paragraph(self, para: Paragraph):
+        self.paragraph_stats_by_element[para._p] = self._measure_paragraph(
+            para, count_towards_document=True
+        )
+
+    def _measure_paragraph(
+        self, para: Paragraph, count_towards_document: bool = False
+    ) -> ParagraphStats:
+        stats = ParagraphStats()
+        for run in para.runs:
+            stats.run_count += 1
+            size = self.run_font_size(run, para)
+            is_bold = self.run_is_bold(run, para)
+            if is_bold:
+                stats.bold_run_count += 1
+            if size is not None and (
+                stats.max_font_size is None or size > stats.max_font_size
+            ):
+                stats.max_font_size = size
+
+            if count_towards_document:
+                if size is not None:
+                    self.font_size_counts[size] += 1
+                if run.text.strip():
+                    self.run_count += 1
+                    if is_bold:
+                        self.bold_run_count += 1
+
+        text = para.text
+        stats.letter_count, stats.uppercase_count = count_letters(text)
+        if count_towards_document and text.strip():
+            self.paragraph_count += 1
+            if stats.letter_count and stats.uppercase_ratio >= self.CAPS_RATIO:
+                self.caps_paragraph_count += 1
+
+        return stats
+
+    def paragraph_stats(self, para: Paragraph) -> ParagraphStats:
+        """
+        Run and letter counts for a paragraph, measured on the spot if it wasn't in the document's pass
+        """
+        stats = self.paragraph_stats_by_element.get(para._p)
+        if stats is None:
+            stats = self._measure_paragraph(para)
+        return stats
+
+    def style_font(self, style_id: str | None) -> ResolvedFont:
+        """
+        Resolved font for a style id, falling back to the document defaults
+        """
+        if style_id is None:
+            style_id = self.default_paragraph_style_id
+
+        return self.fonts_by_style_id.get(style_id, self._default_font)
+
+    def paragraph_font(self, para: Paragraph) -> ResolvedFont:
+        return self.style_font(para._p.style)
+
+    def _run_attribute(self, run: Run, para: Paragraph, attr: str):
+        """
+        Effective value of a font attribute: direct formatting, then the
+        run's character style, then the paragraph style
+        """
+        value = getattr(run.font, attr)
+        if value is not None:
+            return value
+
+        char_style_id = run._r.style
+        if char_style_id is not None:
+            value = getattr(self.style_font(char_style_id), attr)
+            if value is not None:
+                return value
+
+        return getattr(self.paragraph_font(para), attr)
+
+    def run_font_size(self, run: Run, para: Paragraph) -> float | None:
+        if run.font.size is not None:
+            return run.font.size.pt
+
+        return self._run_attribute(run, para, "size")
+
+    def run_is_bold(self, run: Run, para: Paragraph) -> bool:
+        return bool(self._run_attribute(run, para, "bold"))
+
+    @property
+    def bold_ratio(self) -> float:
+        """Fraction of non-empty runs that are effectively bold"""
+        return self.bold_run_count / self.run_count if self.run_count else 0.0
+
+    @property
+    def caps_ratio(self) -> float:
+        """Fraction of non-empty paragraphs that are mostly uppercase"""
+        if not self.paragraph_count:
+            return 0.0
+        return self.caps_paragraph_count / self.paragraph_count
+
+
+def get_document_stats(doc: Document) -> DocumentStats:
+    """
+    Computes the document's stats once and stores them on the document part
+    (Document objects are recreated by paragraph.part.document, the part is not)
+    """
+    part = doc.part
+    stats = getattr(part, "_document_stats", None)
+    if stats is None:
+        stats = DocumentStats(doc)
+        part._document_stats = stats
+
+    return stats
@@ -0,0 +1,70 @@
+import io
+import zipfile
+from typing import IO, Union
+
+from docx import Document
+from lxml import etree
+
+
+DOCUMENT_RELS_NAME = "word/_rels/document.xml.rels"
+
+
+def get_zip_name(partname: str) -> str:
+    """
+    Converts a package part name (ie. /word/document.xml) to its zip entry name
+    """
+    return partname.lstrip("/")
+
+
+def get_relationship_targets(rels_blob: bytes) -> dict[str, str]:
+    """
+    Maps each relationship id in a .rels part to its target
+    """
+    return {rel.get("Id"): rel.get("Target") for rel in etree.fromstring(rels_blob)}
+
+
+def save_docx_to_buffer(
+    doc: Document, source_docx: Union[str, IO[bytes]]
+) -> io.BytesIO:
+    """
+    Writes the document to an in memory .docx, copying every entry of the source file
+    byte for byte and only re-serializing the main document part (the only part tailoring edits)
+
+    doc.save re-serializes every part of the package, this avoids that work along with the temp file.
+    Falls back to doc.save if the document gained parts that the source file doesn't have.
+    """
+    if not isinstance(source_docx, str):
+        source_docx.seek(0)
+
+    document_part = doc.part
+    modified_entries = {get_zip_name(document_part.partname): document_part.blob}
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(source_docx) as source_zip:
+        source_names = set(source_zip.namelist())
+        package_names = {
+            get_zip_name(part.partname) for part in document_part.package.iter_parts()
+        }
+        if not package_names <= source_names:
+            doc.save(output)
+            output.seek(0)
+            return output
+
+        # Edits that add, drop or retarget hyperlinks and images change the document part's relationships
+        document_targets = {
+            rId: rel.target_ref for rId, rel in document_part.rels.items()
+        }
+        if DOCUMENT_RELS_NAME in source_names and get_relationship_targets(
+            source_zip.read(DOCUMENT_RELS_NAME)
+        ) != document_targets:
+            modified_entries[DOCUMENT_RELS_NAME] = document_part.rels.xml
+
+        with zipfile.ZipFile(output, "w") as output_zip:
+            for info in source_zip.infolist():
+                data = modified_entries.get(info.filename)
+                if data is None:
+                    data = source_zip.read(info)
+                output_zip.writestr(info, data)
+
+    output.seek(0)
+    return output
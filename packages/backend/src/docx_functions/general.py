@@ -16,6 +16,13 @@ def iter_doc_paragraphs(doc: Document):
                         yield paragraph
 
 
+def get_paragraph_id(section: str, idx: int) -> str:
+    """
+    Stable id for the idx-th paragraph of a section, used to address paragraphs in patches
+    """
+    return f"{section}-{idx}"
+
+
 def print_sections(sections: dict[str, list[Paragraph]]):
     for section, content in sections.items():
         print(f"Section: {section}")
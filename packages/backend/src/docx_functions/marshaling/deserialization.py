@@ -1,50 +1,55 @@
+import copy
+
+from docx.oxml.shared import OxmlElement
 from docx.text.paragraph import Paragraph
 
 
+from docx_functions.general import get_paragraph_id
 from docx_functions.modifications import (
     add_runs_to_paragraph,
-    copy_paragraph_format,
-    delete_paragraph,
+    clear_runs_only,
     set_list_indent_level,
 )
-from LLM_tailoring.resume.schema import SerializedParagraph
-
-
-def is_anchor_paragraph(para: Paragraph, anchor_lookup: set[str]) -> bool:
-    """
-    Checks if the paragraph is an anchor paragraph based on whether it is in the lookup dictionary
-    """
-    return para.text in anchor_lookup
+from LLM_tailoring.resume.schema import (
+    ParagraphPatchOperation,
+    PatchOperationType,
+    SerializedParagraph,
+)
 
 
-def find_next_non_anchor(paragraphs, anchor_lookup, start_idx=0):
+def build_next_non_anchor_table(is_anchor: list[bool]) -> list[int]:
     """
-    Finds the first paragraph that does not match the lookup
+    Jump table where entry i is the index of the first non-anchor paragraph at or after i
+    (len(is_anchor) if there is none). The table has one extra entry so i can run past the end
     """
+    n = len(is_anchor)
+    next_non_anchor = [n] * (n + 1)
+    for idx in range(n - 1, -1, -1):
+        next_non_anchor[idx] = idx if not is_anchor[idx] else next_non_anchor[idx + 1]
 
-    idx = start_idx
-    for para in paragraphs[start_idx:]:
-        if not is_anchor_paragraph(para, anchor_lookup):
-            return para, idx
-        idx += 1
-
-    return paragraphs[-1], idx
+    return next_non_anchor
 
 
-def add_paragraph_before(
+def build_paragraph_like(
     src_paragraph: Paragraph, new_paragraph_data: SerializedParagraph
 ) -> Paragraph:
     """
-    Adds a new paragraph before the source paragraph
+    Builds a new detached paragraph that takes the formatting of the source paragraph
+    It is only placed into the document when the section edit is applied
     """
-    new_para = src_paragraph.insert_paragraph_before(style=src_paragraph.style)
+    new_p = OxmlElement("w:p")
+    src_pPr = src_paragraph._p.pPr
+    if src_pPr is not None:
+        # The copied pPr carries the paragraph style along with the spacing, numbering etc.
+        new_p.insert(0, copy.deepcopy(src_pPr))
 
-    copy_paragraph_format(src_paragraph, new_para)
+    new_para = Paragraph(new_p, src_paragraph._parent)
 
+    first_run = src_paragraph._p.r_lst[0] if src_paragraph._p.r_lst else None
     new_para = add_runs_to_paragraph(
         paragraph=new_para,
         runs_data=new_paragraph_data.runs,
-        run_template=src_paragraph.runs[0] if src_paragraph.runs else None,
+        run_template=first_run,
     )
 
     set_list_indent_level(
@@ -55,6 +60,52 @@ def add_paragraph_before(
     return new_para
 
 
+def plan_section_update(
+    source_texts: list[str], new_paragraphs: list[SerializedParagraph]
+) -> tuple[list[bool], list[tuple[int, SerializedParagraph]]]:
+    """
+    Works out where every new paragraph goes without touching the document
+
+    Returns which source paragraphs are anchors (kept) and a list of (source index, new paragraph)
+    inserts, in output order - each new paragraph is inserted before the source paragraph at that index
+    """
+    preserved_texts = {p.get_text() for p in new_paragraphs if p.preserved}
+    anchor_idx_by_text = {
+        text: idx
+        for idx, text in enumerate(source_texts)
+        if text in preserved_texts
+    }
+    is_anchor = [text in anchor_idx_by_text for text in source_texts]
+    next_non_anchor = build_next_non_anchor_table(is_anchor)
+    n = len(source_texts)
+
+    inserts: list[tuple[int, SerializedParagraph]] = []
+    pointer_idx = 0
+    for updated_para_raw in new_paragraphs:
+        # If the paragraph is preserved, we don't need to do anything with it
+        # Just move the pointer location to the next non-anchor
+        existing_paragraph_idx = anchor_idx_by_text.get(updated_para_raw.get_text())
+        if existing_paragraph_idx is not None:
+            pointer_idx = next_non_anchor[existing_paragraph_idx + 1]
+            continue
+
+        # Past the last non-anchor we keep inserting before the final source paragraph
+        inserts.append((min(pointer_idx, n - 1), updated_para_raw))
+
+        # Ideally, we move the pointer to the next paragraph if it is not an anchor
+        # This allows us to maximally use the styles provided by the original document
+        # However because the last paragraph before an anchor often has different styling, we avoid
+        # moving the pointer to the last paragraph before the anchor
+        if (
+            pointer_idx + 2 < n
+            and not is_anchor[pointer_idx + 1]
+            and not is_anchor[pointer_idx + 2]
+        ):
+            pointer_idx += 1
+
+    return is_anchor, inserts
+
+
 def update_resume_section(
     section_content: list[Paragraph], new_paragraphs: list[SerializedParagraph]
 ):
@@ -68,65 +119,111 @@ def update_resume_section(
         and begin adding the following new paragraphs after it
         Note: we don't actually insert directly after the anchor paragraph, we instead assign a "pointer" paragraph as the
         next non-anchor paragraph
-        The reason for this is so that we can use the insert_paragraph_before function, and insert our paragraphs in order
+        The reason for this is so that we can insert our paragraphs before the pointer, in order
         This also makes it easier to use the styles from the pointer paragraph which will tend to be closer to the style we want for the new
         paragraphs as the anchor paragraphs often are headings and have the associated different styles
+
+    Each source paragraph's text is read once and the pointer jumps use a precomputed next-non-anchor table,
+    so the whole merge is planned in linear time and then applied to the XML in a single pass
     """
+    # para.text rebuilds the string from the runs on every access, so read it once
+    source_texts = [para.text for para in section_content]
+    is_anchor, inserts = plan_section_update(source_texts, new_paragraphs)
+
+    # Build every new paragraph from its pointer paragraph's formatting before editing the tree
+    inserts_before: dict[int, list[Paragraph]] = {}
+    for pointer_idx, new_paragraph_data in inserts:
+        new_para = build_paragraph_like(section_content[pointer_idx], new_paragraph_data)
+        inserts_before.setdefault(pointer_idx, []).append(new_para)
+
+    # Apply the inserts and delete all paragraphs that are not anchors
+    # These are just the old paragraphs from the original resume
+    for idx, para in enumerate(section_content):
+        element = para._p
+        for new_para in inserts_before.get(idx, []):
+            element.addprevious(new_para._p)
 
-    preserved_paragraphs = set([p.get_text() for p in new_paragraphs if p.preserved])
-    anchor_paragraphs_lookup = {
-        para.text: idx
+        if not is_anchor[idx]:
+            element.getparent().remove(element)
+
+
+def replace_paragraph_runs(
+    paragraph: Paragraph, patch_operation: ParagraphPatchOperation
+) -> None:
+    """
+    Replaces the paragraph's runs in place, keeping its paragraph properties
+    and reusing the first run's formatting for the new runs
+    """
+    run_elements = paragraph._p.r_lst
+    run_template = copy.deepcopy(run_elements[0]) if run_elements else None
+
+    clear_runs_only(paragraph)
+    add_runs_to_paragraph(
+        paragraph=paragraph,
+        runs_data=patch_operation.runs or [],
+        run_template=run_template,
+    )
+
+    if patch_operation.list_indent_level is not None:
+        set_list_indent_level(paragraph, patch_operation.list_indent_level)
+
+
+def apply_section_patch(
+    section_name: str,
+    section_content: list[Paragraph],
+    patch_operations: list[ParagraphPatchOperation],
+):
+    """
+    Applies the LLM's patch operations to a section, the patch counterpart of update_resume_section
+
+    Paragraphs are addressed by the ids serialize_sections gave them. Paragraphs no operation mentions
+    are kept as is, so the LLM only has to send what it changes
+        keep - no change
+        replace - swap the paragraph's runs, keeping its formatting
+        insert_after - new paragraph formatted like the referenced one, multiple inserts after the same id keep their order
+        delete - remove the paragraph
+    """
+    paragraphs_by_id = {
+        get_paragraph_id(section_name, idx): para
         for idx, para in enumerate(section_content)
-        if para.text in preserved_paragraphs
     }
 
-    pointer_paragraph = section_content[0]
-    pointer_paragraph_idx = 0
-    for updated_para_raw in new_paragraphs:
-        # If the paragraph is preserved, we don't need to do anything with it
-        # Just move the pointer location to the next non-anchor
-        if updated_para_raw.get_text() in anchor_paragraphs_lookup:
-            existing_paragraph_idx = anchor_paragraphs_lookup.get(
-                updated_para_raw.get_text()
-            )
-            # Pointer paragraph is a paragraph in the ORIGINAL resume
-            # And so the pointer_paragraph_idx should be used to index section_content
-            pointer_paragraph, pointer_paragraph_idx = find_next_non_anchor(
-                section_content,
-                anchor_paragraphs_lookup,
-                start_idx=existing_paragraph_idx + 1,
-            )
+    replacements: list[tuple[Paragraph, ParagraphPatchOperation]] = []
+    inserts_after: dict[str, list[Paragraph]] = {}
+    deleted_ids: set[str] = set()
+    for patch_operation in patch_operations:
+        paragraph = paragraphs_by_id.get(patch_operation.id)
+        if paragraph is None:
+            print(f"Skipping patch operation for unknown paragraph id {patch_operation.id}")
             continue
 
-        # Otherwise, we need to insert a new paragraph
-        new_para = add_paragraph_before(
-            src_paragraph=pointer_paragraph,
-            new_paragraph_data=updated_para_raw,
-        )
-
-        # Ideally, we move the pointer to the next paragraph if it is not an anchor
-        # This allows us to maximally use the styles provided by the original document
-        # However because the last paragraph before an anchor often has different styling, we avoid
-        # moving the pointer to the last paragraph before the anchor
-        try:
-            next_source_para_is_anchor = is_anchor_paragraph(
-                section_content[pointer_paragraph_idx + 1], anchor_paragraphs_lookup
-            )
-            next_next_source_para_is_anchor = is_anchor_paragraph(
-                section_content[pointer_paragraph_idx + 2], anchor_paragraphs_lookup
-            )
-            if not (next_source_para_is_anchor or next_next_source_para_is_anchor):
-                pointer_paragraph, pointer_paragraph_idx = (
-                    section_content[pointer_paragraph_idx + 1],
-                    pointer_paragraph_idx + 1,
+        match patch_operation.op:
+            case PatchOperationType.KEEP:
+                continue
+            case PatchOperationType.REPLACE:
+                replacements.append((paragraph, patch_operation))
+            case PatchOperationType.INSERT_AFTER:
+                # Built before any replacements so the new paragraph copies the original formatting
+                new_para = build_paragraph_like(
+                    paragraph,
+                    SerializedParagraph(
+                        runs=patch_operation.runs or [],
+                        list_indent_level=patch_operation.list_indent_level,
+                    ),
                 )
-        except IndexError:
-            # We are at the end of the section, so we just keep the pointer where it is
-            pass
-
-    # Delete all paragraphs that are not in the new paragraphs
-    # These are just the old paragraphs from the original resume
-    # So we delete them
-    for para in section_content:
-        if para.text not in anchor_paragraphs_lookup:
-            delete_paragraph(para)
+                inserts_after.setdefault(patch_operation.id, []).append(new_para)
+            case PatchOperationType.DELETE:
+                deleted_ids.add(patch_operation.id)
+
+    for paragraph, patch_operation in replacements:
+        replace_paragraph_runs(paragraph, patch_operation)
+
+    for paragraph_id, new_paragraphs in inserts_after.items():
+        element = paragraphs_by_id[paragraph_id]._p
+        for new_para in new_paragraphs:
+            element.addnext(new_para._p)
+            element = new_para._p
+
+    for paragraph_id in deleted_ids:
+        element = paragraphs_by_id[paragraph_id]._p
+        element.getparent().remove(element)
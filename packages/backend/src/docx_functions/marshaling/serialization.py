@@ -1,8 +1,10 @@
 import os
+import tempfile
+from docx_functions.document_stats import DocumentStats, get_document_stats
+from docx_functions.general import get_paragraph_id
 from docx_functions.paragraph_info import get_list_indent_level
 from md2docx_python.src.docx2md_python import word_to_markdown
 
-from constants import RESUMES_PATH
 from docx.text.paragraph import Paragraph
 
 
@@ -17,8 +19,14 @@ def add_font_styles(styleSet: set, styles):
     return styleSet
 
 
-def json_serialize_paragraph(paragraph: Paragraph):
-    paragraph_styles = add_font_styles(set(), paragraph.style.font)
+def json_serialize_paragraph(
+    paragraph: Paragraph, doc_stats: DocumentStats | None = None
+):
+    if doc_stats is None:
+        doc_stats = get_document_stats(paragraph.part.document)
+
+    # Paragraph style formatting (including inherited styles) from the precomputed table
+    paragraph_styles = add_font_styles(set(), doc_stats.paragraph_font(paragraph))
 
     serialized_runs = []
     for run in paragraph.runs:
@@ -53,13 +61,16 @@ def json_serialize_paragraphs(paragraphs: list[Paragraph]) -> list[dict]:
 def serialize_sections(sections) -> dict:
     """
     Format the sections for the LLM.
+    Every paragraph gets an id so the LLM can reply with patch operations instead of full sections
     """
 
     formatted_sections = {}
     for section, paragraphs in sections.items():
         formatted_paragraphs = []
-        for paragraph in paragraphs:
-            formatted_paragraphs.append(json_serialize_paragraph(paragraph))
+        for idx, paragraph in enumerate(paragraphs):
+            serialized_paragraph = {"id": get_paragraph_id(section, idx)}
+            serialized_paragraph.update(json_serialize_paragraph(paragraph))
+            formatted_paragraphs.append(serialized_paragraph)
         formatted_sections[section] = formatted_paragraphs
 
     return formatted_sections
@@ -71,12 +82,13 @@ def serialize_raw_docx(doc_path):
     Serialize the raw resume to markdown.
     """
     # Roundabout way to get the markdown text, but the library offers no other APIs
-    markdown_path = f"{RESUMES_PATH}/temp.md"
-    os.makedirs(RESUMES_PATH, exist_ok=True)
-
-    word_to_markdown(doc_path, markdown_path)
-    with open(markdown_path, "r") as f:
-        markdown_text = f.read()
-    # os.remove(markdown_path)
-
-    return markdown_text
+    # Each call gets its own file, resumes and cover letters are serialized concurrently
+    with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as markdown_file:
+        markdown_path = markdown_file.name
+
+    try:
+        word_to_markdown(doc_path, markdown_path)
+        with open(markdown_path, "r", encoding="utf-8") as f:
+            return f.read()
+    finally:
+        os.remove(markdown_path)
@@ -7,6 +7,8 @@ from docx.oxml.ns import qn
 from docx.text.paragraph import Paragraph
 from docx.table import Table
 from docx.oxml.shared import OxmlElement
+from docx.oxml.text.run import CT_R
+from docx.text.run import Run
 from docx.shared import Inches
 
 from LLM_tailoring.resume.schema import SerializedRun
@@ -107,13 +109,14 @@ def merge_identical_runs(para: Paragraph) -> None:
     def run_format_key(run):
         """
         Create a key that uniquely identifies a run's full styling:
-          - run.style.name
+          - the run's character style id, which groups runs the same as run.style.name as the id
+            is part of <w:rPr> too, without looking the style up in styles.xml per run
           - the raw <w:rPr> XML (empty string if none)
         """
-        style_name = run.style.name or ""
+        style_id = run._r.style or ""
         rPr = run._element.rPr  # the <w:rPr> element or None
         rPr_xml = rPr.xml if rPr is not None else ""
-        return (style_name, rPr_xml)
+        return (style_id, rPr_xml)
 
     runs = para.runs
     if not runs:
@@ -176,13 +179,19 @@ def delete_paragraph(paragraph: Paragraph):
 def add_runs_to_paragraph(
     paragraph: Paragraph,
     runs_data: list[SerializedRun],
-    run_template=None,
+    run_template: CT_R | None = None,
 ):
+    """
+    Appends the serialized runs to the paragraph, cloning the run_template <w:r> element
+    (and so its run properties) for each run when one is given
+    """
     for run in runs_data:
-        if run_template:
-            new_run = copy.deepcopy(run_template)
+        if run_template is not None:
+            # Copy only the run element - deep copying a Run object would also copy its parents
+            new_r = copy.deepcopy(run_template)
+            paragraph._p.append(new_r)
+            new_run = Run(new_r, paragraph)
             new_run.text = run.text
-            paragraph._p.append(new_run._element)
 
         else:
             new_run = paragraph.add_run(run.text)
@@ -1,5 +1,13 @@
 import copy
 import re
+
+from docx.text.paragraph import Paragraph
+
+from docx_functions.document_stats import (
+    DocumentStats,
+    count_letters,
+    get_document_stats,
+)
 from docx_functions.modifications import (
     clean_paragraph_whitespace,
 )
@@ -19,17 +27,20 @@ SECTION_HEADER_KEYWORDS = {
 }
 
 
-def is_mostly_uppercase(para, caps_ratio=0.8):
+def is_mostly_uppercase(para, caps_ratio=0.8, doc_stats: DocumentStats | None = None):
     """
     True if more than caps_ratio of total letters are uppercase.
     caps_ratio is the fraction of total letters that need to be uppercase for the paragraph to be considered uppercase.
+    With doc_stats, the letter counts from the document's single pass are used.
     """
+    if doc_stats is None:
+        letters, uppercase = count_letters(para.text)
+    else:
+        para_stats = doc_stats.paragraph_stats(para)
+        letters, uppercase = para_stats.letter_count, para_stats.uppercase_count
 
-    text = para.text.strip()
-    letters = [c for c in text if c.isalpha()]
     if letters:
-        capital_letter_ratio = sum(1 for c in letters if c.isupper()) / len(letters)
-        return capital_letter_ratio >= caps_ratio
+        return uppercase / letters >= caps_ratio
 
     return False
 
@@ -44,23 +55,32 @@ def is_title_case(para):
     return all(w[0].isupper() and w[1:].islower() for w in words if len(w) > 1)
 
 
-def is_title_or_upper_case(para, caps_ratio=0.8):
+def is_title_or_upper_case(
+    para, caps_ratio=0.8, doc_stats: DocumentStats | None = None
+):
     title_case = is_title_case(para)
-    uppercase = is_mostly_uppercase(para, caps_ratio)
+    uppercase = is_mostly_uppercase(para, caps_ratio, doc_stats)
     return title_case or uppercase
 
 
 # TODO: Perhaps change this to any emphasized text (bold, underline)
-def is_primarily_bold(para, bold_ratio=0.6):
+def is_primarily_bold(para, bold_ratio=0.6, doc_stats: DocumentStats | None = None):
     """
     True if more than bold_ratio of runs are bold.
-    """
-    runs = para.runs
-    if not runs:
+    With doc_stats, bold inherited from the run or paragraph style also counts.
+    """
+    if doc_stats is None:
+        runs = para.runs
+        run_count = len(runs)
+        bold_runs = sum(1 for r in runs if r.bold)
+    else:
+        para_stats = doc_stats.paragraph_stats(para)
+        run_count = para_stats.run_count
+        bold_runs = para_stats.bold_run_count
+
+    if not run_count:
         return False
-
-    bold_runs = sum(1 for r in runs if r.bold)
-    if bold_runs / len(runs) >= bold_ratio:
+    if bold_runs / run_count >= bold_ratio:
         return True
 
     return False
@@ -68,19 +88,15 @@ def is_primarily_bold(para, bold_ratio=0.6):
 
 def is_above_average_font_size(para, doc, multiplier=1.0):
     """
-    True if any run in para has font.size > avg_size * multiplier.
+    True if any run in para has an effective font size > avg_size * multiplier.
     """
+    doc_stats = get_document_stats(doc)
 
-    # Compute avg font size once per doc
-    avg_size = getattr(doc, "_avg_font_size", None)
-    if avg_size is None:
-        avg_size = compute_average_font_size(doc)
-        doc._avg_font_size = avg_size
-
+    avg_size = doc_stats.average_font_size
     if avg_size is None:
         return False
-    threshold = avg_size * multiplier
-    return any(run.font.size and run.font.size.pt > threshold for run in para.runs)
+    max_size = doc_stats.paragraph_stats(para).max_font_size
+    return max_size is not None and max_size > avg_size * multiplier
 
 
 def has_few_distinct_words(para, max_words=4):
@@ -93,19 +109,6 @@ def has_few_distinct_words(para, max_words=4):
     return len(set(words)) <= max_words
 
 
-def compute_average_font_size(doc):
-    """
-    Scan all runs with a defined font size and return the average in Pt.
-    """
-    sizes = [
-        run.font.size.pt
-        for para in doc.paragraphs
-        for run in para.runs
-        if run.font.size
-    ]
-    return sum(sizes) / len(sizes) if sizes else None
-
-
 def preprocess_paragraph(para):
     """
     Preprocess the text by removing extra whitespace.
@@ -138,17 +141,23 @@ def is_likely_heading(para, doc):
     if not para.text.strip():
         return False
 
-    processed_para = copy.deepcopy(para)
+    # Only copy the paragraph element, deep copying the Paragraph itself also copies its parents (the whole document)
+    processed_para = Paragraph(copy.deepcopy(para._p), para._parent)
     preprocess_paragraph(processed_para)
 
+    # Whitespace cleaning only changes run text, so run formatting and letter counts are read for the
+    # original paragraph from the document stats rather than rescanning the copy's runs. Title case
+    # is still checked on the copy, as joining spaced out letters changes its words
+    doc_stats = get_document_stats(doc)
     signals = [
         is_builtin_heading_style(para),
         has_keyword(para),
-        is_above_average_font_size(processed_para, doc),
-        is_primarily_bold(processed_para),
+        is_above_average_font_size(para, doc),
+        is_primarily_bold(para, doc_stats=doc_stats),
         has_spacing(processed_para),
         has_border(processed_para),
-        is_title_or_upper_case(processed_para),
+        is_title_case(processed_para)
+        or is_mostly_uppercase(para, doc_stats=doc_stats),
     ]
 
     # The number of things making it likely a paragraph is a heading
@@ -77,7 +77,14 @@ def convert_docx_to_pdf(docx_input: Union[str, IOBase]):
                 )
             }
         else:
-            files = {"file": docx_input}
+            # In memory buffers (ie. tailored documents) have no name, so give them one with the extension
+            files = {
+                "file": (
+                    "document.docx",
+                    docx_input,
+                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                )
+            }
 
         response = requests.post(upload_url, data=upload_parameters, files=files)
 
@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from firebase.realtime_db import (
+    get_user_autofill_data_if_changed,
+    get_user_autofill_data_with_etag,
+)
+from utils import SingleFlight
+
+
+MAX_CACHED_PROFILES = 256
+
+# Refreshes after saves run off the request
+REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="profile-refresh")
+
+
+class CachedProfile:
+    __slots__ = ("etag", "data")
+
+    def __init__(self, etag: str, data: dict):
+        self.etag = etag
+        self.data = data
+
+
+class AutofillProfileCache:
+    """
+    Keeps users' autofill data in memory, keyed by user id
+
+    Every read is validated against the database's ETag, so an unchanged profile costs a
+    304 response instead of a download, and saves from other instances are still seen.
+    Profiles are evicted least recently used first past max_entries.
+    The returned data is shared between requests and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_PROFILES):
+        self.max_entries = max_entries
+        self.profiles: OrderedDict[str, CachedProfile] = OrderedDict()
+        self.lock = threading.Lock()
+        self.loads = SingleFlight()
+
+    def get_cached(self, user_id: str) -> CachedProfile | None:
+        with self.lock:
+            profile = self.profiles.get(user_id)
+            if profile is not None:
+                self.profiles.move_to_end(user_id)
+            return profile
+
+    def store(self, user_id: str, etag: str, data) -> dict:
+        # Missing or cleared profiles are stored as None or [] in the db
+        data = data or {}
+        with self.lock:
+            self.profiles[user_id] = CachedProfile(etag, data)
+            self.profiles.move_to_end(user_id)
+            while len(self.profiles) > self.max_entries:
+                self.profiles.popitem(last=False)
+        return data
+
+    def load(self, user_id: str) -> dict:
+        cached = self.get_cached(user_id)
+        if cached is None:
+            data, etag = get_user_autofill_data_with_etag(user_id)
+            return self.store(user_id, etag, data)
+
+        changed, data, etag = get_user_autofill_data_if_changed(user_id, cached.etag)
+        if not changed:
+            return cached.data
+        return self.store(user_id, etag, data)
+
+    def get(self, user_id: str) -> dict:
+        """
+        Returns the user's autofill data, an empty dict if they have none
+        Concurrent requests for one user share a single read
+        """
+        return self.loads.do(user_id, lambda: self.load(user_id))
+
+    def refresh(self, user_id: str):
+        try:
+            self.get(user_id)
+        except Exception as e:
+            print(f"Warning: Failed to refresh autofill profile: {e}")
+
+    def refresh_after_save(self, user_id: str) -> Future | None:
+        """
+        Re-reads a cached user's profile in the background after they save values,
+        so their next autofill validates against the new etag
+        Users who aren't cached in this instance are left alone
+        """
+        if self.get_cached(user_id) is None:
+            return None
+        return REFRESH_EXECUTOR.submit(self.refresh, user_id)
+
+    def invalidate(self, user_id: str):
+        with self.lock:
+            self.profiles.pop(user_id, None)
+
+
+autofill_profile_cache = AutofillProfileCache()
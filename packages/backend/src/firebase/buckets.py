@@ -2,11 +2,15 @@ import requests
 import datetime
 import os
 import pickle
+import threading
+import time
+from typing import IO, Union
 
 from firebase import init_firebase
+from firebase.file_cache import LocalFileCache
 from firebase_admin import storage
 
-from constants import COVER_LETTERS_PATH, RESUMES_PATH
+from constants import COVER_LETTERS_PATH, RESUME_URL_MODE, RESUMES_PATH
 from utils import get_time_string
 
 
@@ -14,6 +18,21 @@ DOCX_FILE_FORMAT = (
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 )
 
+# Only the fields the listing uses are requested from the Storage API
+RESUME_LIST_FIELDS = "items(name,size,updated,generation),nextPageToken"
+RESUME_LIST_CACHE_TTL_SECONDS = 30
+SIGNED_URL_EXPIRATION = datetime.timedelta(hours=1)
+
+# Resumable uploads need a multiple of 256 KiB
+PDF_UPLOAD_CHUNK_SIZE = 4 * 256 * 1024
+SOURCE_DOCX_HASH_METADATA_KEY = "source_docx_sha256"
+
+# userId -> (expires_at, resume metadata list)
+_resume_list_cache: dict[str, tuple[float, list[dict]]] = {}
+_resume_list_cache_lock = threading.Lock()
+
+local_file_cache = LocalFileCache()
+
 
 def get_user_bucket_path(userId: str, tailored: bool = False) -> str:
     """
@@ -27,49 +46,82 @@ def get_user_bucket_path(userId: str, tailored: bool = False) -> str:
         return base
 
 
-def get_pdf_cache_path(userId: str) -> str:
+def get_pdf_cache_path(docx_hash: str) -> str:
     """
-    Returns the path to the user's PDF cache bucket
+    Returns the path of the converted PDF for a DOCX in the shared PDF cache
+    The cache is keyed by the SHA-256 of the DOCX bytes, so it is shared across users and endpoints
     """
-    return f"resumes/{userId}/pdf_cache"
+    return f"pdf_cache/{docx_hash}.pdf"
 
 
-def get_cached_pdf_url(userId: str, file_name: str) -> str | None:
+class ResponseStreamReader:
     """
-    Check if a cached PDF exists for the given file and return its public URL
+    Minimal read only file object over a streamed requests response
+    Resumable uploads need reads that fill the whole chunk until the body ends and a tell()
+    that counts decoded bytes, which response.raw doesn't guarantee
+    """
+
+    def __init__(self, response: requests.Response, chunk_size: int):
+        self.chunks = response.iter_content(chunk_size=chunk_size)
+        self.buffer = bytearray()
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer.extend(chunk)
+
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        self.position += len(data)
+        return data
+
+    def tell(self) -> int:
+        return self.position
+
+
+def get_cached_pdf_url(docx_hash: str) -> str | None:
+    """
+    Check if a converted PDF is cached for the DOCX hash and return its public URL
     Returns None if no cached PDF exists
     """
     bucket = storage.bucket()
-    # Convert file name to PDF name (replace extension with .pdf)
-    pdf_name = os.path.splitext(file_name)[0] + ".pdf"
-    blob_path = f"{get_pdf_cache_path(userId)}/{pdf_name}"
-    blob = bucket.blob(blob_path)
+    # get_blob checks the blob exists and fetches it in one request,
+    # cached PDFs are made public when uploaded so nothing else is needed
+    blob = bucket.get_blob(get_pdf_cache_path(docx_hash))
 
-    if blob.exists():
-        blob.make_public()
-        return blob.public_url
+    if blob is None:
+        return None
 
-    return None
+    return blob.public_url
 
 
-def upload_pdf_to_cache(pdf_url: str, userId: str, file_name: str) -> str:
+def upload_pdf_to_cache(pdf: Union[str, bytes], docx_hash: str) -> str:
     """
-    Downloads PDF from URL and uploads it to the user's PDF cache
+    Uploads a converted PDF to the shared PDF cache, either from its bytes or from a URL
+    PDFs at a URL are streamed with a chunked resumable upload, so the whole PDF is never held in memory
     Returns the public URL of the cached PDF
     """
 
     bucket = storage.bucket()
-    # Convert file name to PDF name (replace extension with .pdf)
-    pdf_name = os.path.splitext(file_name)[0] + ".pdf"
-    blob_path = f"{get_pdf_cache_path(userId)}/{pdf_name}"
-    blob = bucket.blob(blob_path)
+    # Setting a chunk size makes the upload resumable and sent chunk by chunk
+    blob = bucket.blob(get_pdf_cache_path(docx_hash), chunk_size=PDF_UPLOAD_CHUNK_SIZE)
+    blob.metadata = {SOURCE_DOCX_HASH_METADATA_KEY: docx_hash}
 
-    # Download the PDF from the URL
-    response = requests.get(pdf_url)
-    response.raise_for_status()
+    if isinstance(pdf, bytes):
+        blob.upload_from_string(pdf, content_type="application/pdf")
+    else:
+        with requests.get(pdf, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            blob.upload_from_file(
+                ResponseStreamReader(response, PDF_UPLOAD_CHUNK_SIZE),
+                content_type="application/pdf",
+            )
 
-    # Upload to Firebase storage
-    blob.upload_from_string(response.content, content_type="application/pdf")
     blob.make_public()
 
     return blob.public_url
@@ -87,73 +139,171 @@ def upload_resume_from_file(file, userId: str, file_name: str, public: bool = Fa
     fileLocation.upload_from_file(file, content_type=DOCX_FILE_FORMAT)
     if public:
         fileLocation.make_public()
+    invalidate_resume_list_cache(userId)
+    local_file_cache.invalidate(get_local_resume_path(userId, file_name))
 
     return fileLocation.public_url
 
 
-def get_stored_resumes(userId: str):
+def invalidate_resume_list_cache(userId: str):
+    with _resume_list_cache_lock:
+        _resume_list_cache.pop(userId, None)
+
+
+def get_resume_url(blob) -> str:
+    """
+    Builds the URL for a listed resume without any extra requests
+    public: relies on bucket-level public read access rather than per object ACLs
+    signed: signs a v4 URL locally with the service account credentials
+    """
+    if RESUME_URL_MODE == "signed":
+        return blob.generate_signed_url(
+            version="v4", expiration=SIGNED_URL_EXPIRATION, method="GET"
+        )
+    return blob.public_url
+
+
+def list_stored_resume_metadata(userId: str) -> list[dict]:
     """
-    Gets the list of resumes stored in the user's bucket with their public URLs
+    Lists the resumes in the user's bucket with a single (paged) list call
+    Returns name, size, updated, generation and url for each resume
+    Results are cached per user for RESUME_LIST_CACHE_TTL_SECONDS, uploads invalidate the cache
     """
+    with _resume_list_cache_lock:
+        cached = _resume_list_cache.get(userId)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     bucket = storage.bucket()
-    resume_dict = {}
     blobs = bucket.list_blobs(
         prefix=get_user_bucket_path(userId=userId, tailored=False) + "/",
         delimiter="/",
+        fields=RESUME_LIST_FIELDS,
     )
+
+    resumes = []
     for blob in blobs:
         resume_name = os.path.basename(blob.name)
-        blob.make_public()
-        resume_dict[resume_name] = blob.public_url
+        # Skip the folder placeholder object, if there is one
+        if not resume_name:
+            continue
+        resumes.append(
+            {
+                "name": resume_name,
+                "size": blob.size,
+                "updated": blob.updated.isoformat() if blob.updated else None,
+                "generation": blob.generation,
+                "url": get_resume_url(blob),
+            }
+        )
+
+    with _resume_list_cache_lock:
+        _resume_list_cache[userId] = (
+            time.monotonic() + RESUME_LIST_CACHE_TTL_SECONDS,
+            resumes,
+        )
+
+    return resumes
+
+
+def get_stored_resumes(userId: str, resume_metadata: list[dict] | None = None):
+    """
+    Gets the resumes stored in the user's bucket as a map of name to URL
+    Pass resume_metadata when the bucket has already been listed to avoid listing it again
+    """
+    if resume_metadata is None:
+        resume_metadata = list_stored_resume_metadata(userId)
+    return {resume["name"]: resume["url"] for resume in resume_metadata}
+
 
-    return resume_dict
+def get_tailored_resume_blob_path(userId: str, file_name: str, extension: str) -> str:
+    """
+    Returns a new, timestamped path for a tailored resume in the user's bucket
+    """
+    return f"{get_user_bucket_path(userId=userId, tailored=True)}/{file_name}_{get_time_string()}{extension}"
 
 
-def upload_tailored_resume(
-    resume_path: str, userId: str, file_name: str, extension: str, public: bool = False
-):
+def upload_resume_to_blob_path(
+    resume: Union[str, IO[bytes]], userId: str, blob_path: str, public: bool = False
+) -> str:
     """
-    Uploads resume to the user's bucket
-    returns download url
+    Uploads a resume from a file path or an in memory file
+    returns public url
     """
     bucket = storage.bucket()
-    fileLocation = bucket.blob(
-        f"{get_user_bucket_path(userId=userId, tailored=True)}/{file_name}_{get_time_string()}{extension}"
-    )
-    fileLocation.upload_from_filename(resume_path)
+    fileLocation = bucket.blob(blob_path)
+    if isinstance(resume, str):
+        fileLocation.upload_from_filename(resume)
+    else:
+        fileLocation.upload_from_file(resume, rewind=True, content_type=DOCX_FILE_FORMAT)
     if public:
         fileLocation.make_public()
+    invalidate_resume_list_cache(userId)
+
+    return fileLocation.public_url
 
-    public_url = fileLocation.public_url
 
-    download_url = fileLocation.generate_signed_url(
+def get_signed_download_url(blob_path: str) -> str:
+    """
+    Signs a day long download url, the blob doesn't need to exist yet
+    """
+    bucket = storage.bucket()
+    return bucket.blob(blob_path).generate_signed_url(
         version="v4",
         expiration=datetime.datetime.now() + datetime.timedelta(days=1),
         method="GET",
     )
 
+
+def upload_tailored_resume(
+    resume: Union[str, IO[bytes]],
+    userId: str,
+    file_name: str,
+    extension: str,
+    public: bool = False,
+):
+    """
+    Uploads resume to the user's bucket, either from a file path or an in memory file
+    returns download url
+    """
+    blob_path = get_tailored_resume_blob_path(userId, file_name, extension)
+    public_url = upload_resume_to_blob_path(resume, userId, blob_path, public=public)
+    download_url = get_signed_download_url(blob_path)
+
     return download_url, public_url
 
 
+def upload_tailored_cover_letter(cover_letter: IO[bytes], userId: str, file_name: str):
+    """
+    Uploads an in memory cover letter to the user's tailored cover letters
+    returns download url
+    """
+    blob_path = f"cover_letters/{userId}/tailored/{file_name}_{get_time_string()}.docx"
+    bucket = storage.bucket()
+    bucket.blob(blob_path).upload_from_file(
+        cover_letter, rewind=True, content_type=DOCX_FILE_FORMAT
+    )
+    return get_signed_download_url(blob_path)
+
+
 def fetch_and_download_file(blob_path: str, output_path: str):
     """
     Fetches and downloads a file from the bucket
+    Repeat fetches are served from the local file cache, revalidated by object generation
     """
     bucket = storage.bucket()
     blob = bucket.blob(blob_path)
-    if not blob.exists():
-        raise FileNotFoundError(f"File {blob_path} not found")
+    return local_file_cache.fetch(blob, output_path)
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    blob.download_to_filename(output_path)
 
-    return output_path
+def get_local_resume_path(userId: str, resumeName: str) -> str:
+    return f"{RESUMES_PATH}/{userId}/{resumeName}"
 
 
 def fetch_and_download_resume(userId: str, resumeName: str):
     return fetch_and_download_file(
         blob_path=f"resumes/{userId}/{resumeName}",
-        output_path=f"{RESUMES_PATH}/{userId}/{resumeName}",
+        output_path=get_local_resume_path(userId, resumeName),
     )
 
 
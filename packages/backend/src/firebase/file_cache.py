@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from google.api_core.exceptions import NotFound, NotModified
+
+
+# A file handed out within this window may still be being read by its caller, so it isn't evicted
+IN_USE_SECONDS = 60
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Paths share a fixed pool of locks rather than each getting its own, so the locks don't grow with the cache
+LOCK_STRIPES = 64
+
+
+class CachedFile:
+    __slots__ = ("generation", "size", "returned_at")
+
+    def __init__(self, generation: str | None, size: int, returned_at: float):
+        self.generation = generation
+        self.size = size
+        # When fetch last handed the path to a caller, who may still be reading the file
+        self.returned_at = returned_at
+
+
+class LocalFileCache:
+    """
+    Keeps downloaded bucket files on local disk, keyed by their output path
+
+    Every fetch revalidates the cached file against the object generation, so an unchanged file
+    costs one 304 response instead of an exists() call plus a download, and a file overwritten by
+    any instance is downloaded again. Entries are evicted least recently used first once the cache
+    grows past max_bytes, skipping files returned within IN_USE_SECONDS as their callers may still
+    be reading them. Each path
+    maps to one of a fixed set of locks so concurrent requests for one file download it once.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = MAX_CACHE_BYTES,
+        in_use_seconds: float = IN_USE_SECONDS,
+        lock_stripes: int = LOCK_STRIPES,
+    ):
+        self.max_bytes = max_bytes
+        self.in_use_seconds = in_use_seconds
+        self.entries: OrderedDict[str, CachedFile] = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        # Reentrant, so eviction can take a lock its own fetch already holds through a shared stripe
+        self.path_locks = [threading.RLock() for _ in range(lock_stripes)]
+
+    def get_path_lock(self, path: str) -> threading.RLock:
+        return self.path_locks[hash(path) % len(self.path_locks)]
+
+    def fetch(self, blob, output_path: str) -> str:
+        """
+        Returns output_path once it holds the current contents of the blob
+        Raises FileNotFoundError if the blob doesn't exist
+        """
+        with self.get_path_lock(output_path):
+            with self.lock:
+                entry = self.entries.get(output_path)
+            if entry is not None and not os.path.exists(output_path):
+                self.forget(output_path)
+                entry = None
+
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # Download beside the cached copy so readers never see a partial file
+            temp_path = f"{output_path}.download"
+            try:
+                if entry is not None and entry.generation is not None:
+                    blob.download_to_filename(
+                        temp_path, if_generation_not_match=int(entry.generation)
+                    )
+                else:
+                    blob.download_to_filename(temp_path)
+            except NotModified:
+                self.remove_file(temp_path)
+                self.touch(output_path)
+                return output_path
+            except NotFound:
+                self.remove_file(temp_path)
+                self.forget(output_path)
+                raise FileNotFoundError(f"File {blob.name} not found")
+
+            os.replace(temp_path, output_path)
+            self.store(
+                output_path,
+                CachedFile(
+                    generation=blob.generation,
+                    size=os.path.getsize(output_path),
+                    returned_at=time.monotonic(),
+                ),
+            )
+            return output_path
+
+    def invalidate(self, output_path: str):
+        """
+        Drops a cached file, used when the bucket copy is overwritten
+        """
+        with self.get_path_lock(output_path):
+            self.forget(output_path)
+            self.remove_file(output_path)
+
+    def touch(self, path: str):
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None:
+                entry.returned_at = time.monotonic()
+                self.entries.move_to_end(path)
+
+    def forget(self, path: str):
+        with self.lock:
+            entry = self.entries.pop(path, None)
+            if entry is not None:
+                self.total_bytes -= entry.size
+
+    def store(self, path: str, entry: CachedFile):
+        with self.lock:
+            previous = self.entries.pop(path, None)
+            if previous is not None:
+                self.total_bytes -= previous.size
+            self.entries[path] = entry
+            self.total_bytes += entry.size
+
+            # Oldest first, skipping the new entry, files handed out recently and any file another
+            # request is fetching, the cache can stay over max_bytes until those are evictable
+            now = time.monotonic()
+            for candidate in list(self.entries):
+                if self.total_bytes <= self.max_bytes:
+                    break
+                if (
+                    candidate == path
+                    or now - self.entries[candidate].returned_at < self.in_use_seconds
+                ):
+                    continue
+                candidate_lock = self.get_path_lock(candidate)
+                if not candidate_lock.acquire(blocking=False):
+                    continue
+                try:
+                    self.total_bytes -= self.entries.pop(candidate).size
+                    self.remove_file(candidate)
+                finally:
+                    candidate_lock.release()
+
+    @staticmethod
+    def remove_file(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,126 @@
+import base64
+import pickle
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from firebase_admin import db
+
+
+CACHE_ROOT_PATH = "cache"
+# Payloads written before compression have no encoding field and are plain pickles
+ZLIB_ENCODING = "zlib"
+
+SWEEP_BATCH_SIZE = 200
+MAX_SWEEP_BATCHES = 50
+
+
+def get_cache_path(id: str) -> str:
+    return f"{CACHE_ROOT_PATH}/{id}"
+
+
+def get_expiry_string(moment: datetime) -> str:
+    """
+    Naive UTC ISO timestamps, the format expiresAt has always been written in,
+    so they sort chronologically as strings and older entries can be swept with the same query
+    """
+    return moment.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def encode_object(obj: object) -> str:
+    return base64.b64encode(zlib.compress(pickle.dumps(obj))).decode("utf-8")
+
+
+def decode_object(payload: dict) -> object:
+    data = base64.b64decode(payload["object"].encode("utf-8"))
+    if payload.get("encoding") == ZLIB_ENCODING:
+        data = zlib.decompress(data)
+    return pickle.loads(data)
+
+
+def is_expired(payload: dict) -> bool:
+    expires_at = payload.get("expiresAt")
+    if expires_at is None:
+        return False
+    return expires_at <= get_expiry_string(utc_now())
+
+
+def cache_set_object(id: str, obj: object, expiry_length_seconds: int = 3600):
+    """
+    Cache an object at a given ID in Firebase.
+    """
+    payload = {
+        "object": encode_object(obj),
+        "encoding": ZLIB_ENCODING,
+        "expiresAt": get_expiry_string(
+            utc_now() + timedelta(seconds=expiry_length_seconds)
+        ),
+    }
+
+    ref = db.reference(get_cache_path(id))
+    ref.set(payload)
+
+
+def cache_get_object(id: str) -> object:
+    """
+    Get an object from the cache.
+    Raises ValueError if there is no entry or it has expired
+    """
+    ref = db.reference(get_cache_path(id))
+    payload = ref.get()
+
+    if not isinstance(payload, dict) or "object" not in payload:
+        raise ValueError("Object not found in cache")
+    if is_expired(payload):
+        raise ValueError("Cached object has expired")
+
+    return decode_object(payload)
+
+
+def get_expired_ids(root_path: str, limit: int) -> list[str]:
+    """
+    Ids of up to limit expired children of root_path, using the expiresAt index on that node
+    """
+    query = (
+        db.reference(root_path)
+        .order_by_child("expiresAt")
+        # Skips entries without a (string) expiresAt, which sort before strings
+        .start_at("0")
+        .end_at(get_expiry_string(utc_now()))
+        .limit_to_first(limit)
+    )
+    return list((query.get() or {}).keys())
+
+
+def sweep_expired_entries(
+    root_path: str,
+    batch_size: int = SWEEP_BATCH_SIZE,
+    max_batches: int = MAX_SWEEP_BATCHES,
+) -> int:
+    """
+    Deletes root_path's expired children in batches, each batch is one multi-path update
+    Returns the number of entries deleted
+    """
+    deleted = 0
+    for _ in range(max_batches):
+        expired_ids = get_expired_ids(root_path, batch_size)
+        if not expired_ids:
+            break
+
+        db.reference(root_path).update({id: None for id in expired_ids})
+        deleted += len(expired_ids)
+
+        if len(expired_ids) < batch_size:
+            break
+
+    print(f"Swept {deleted} expired entries from {root_path}")
+    return deleted
+
+
+def sweep_expired_cache_entries(
+    batch_size: int = SWEEP_BATCH_SIZE, max_batches: int = MAX_SWEEP_BATCHES
+) -> int:
+    return sweep_expired_entries(CACHE_ROOT_PATH, batch_size, max_batches)
@@ -1,74 +1,76 @@
-from datetime import timedelta, datetime
 from LLM_tailoring.resume.schema import AnsweredResumeTailoringQuestions
 from functions.inputs_autofill_helper.input_prototype_strings import InputType
-from utils import pickle_object
 from firebase import init_firebase
+from firebase.object_cache import cache_get_object, cache_set_object
 from firebase_admin import db
-import pickle
-import base64
 import numpy as np
 
 
-def unpickle_object(obj: str) -> object:
-    """
-    Unpickle an object from a string.
-    """
+def get_user_values_path(user_id):
+    return f"users/{user_id}"
 
-    pickled_obj = base64.b64decode(obj.encode("utf-8"))
-    return pickle.loads(pickled_obj)
 
+def get_user_autofill_values_path(user_id):
+    return f"{get_user_values_path(user_id)}/autofill"
 
-def get_cache_path(id: str) -> str:
-    return f"cache/{id}"
 
+def get_user_autofill_data(user_id):
+    ref = db.reference(get_user_autofill_values_path(user_id))
+    return ref.get()
 
-def cache_set_object(id: str, obj: object, expiry_length_seconds: int = 3600):
+
+def get_user_autofill_data_with_etag(user_id) -> tuple[object, str]:
+    ref = db.reference(get_user_autofill_values_path(user_id))
+    return ref.get(etag=True)
+
+
+def get_user_autofill_data_if_changed(user_id, etag: str) -> tuple[bool, object, str]:
     """
-    Cache an object at a given ID in Firebase.
+    Returns (changed, data, etag), data and etag are None if the stored etag still matches
     """
-    payload = {
-        "object": pickle_object(obj),
-        "expiresAt": (
-            datetime.utcnow() + timedelta(seconds=expiry_length_seconds)
-        ).isoformat(),
-    }
+    ref = db.reference(get_user_autofill_values_path(user_id))
+    return ref.get_if_changed(etag)
 
-    ref = db.reference(get_cache_path(id))
-    ref.set(payload)
+
+def save_user_autofill_data(user_id, data):
+    ref = db.reference(get_user_autofill_values_path(user_id))
+    ref.set(data)
 
 
-def cache_get_object(id: str) -> object:
+def update_user_autofill_values(user_id, values: dict):
     """
-    Get an object from the cache.
+    Writes several leaves of the user's autofill data in one multi-path update
+    Keys are paths relative to the autofill data, ie. "name/first_name"
     """
-    ref = db.reference(get_cache_path(id))
-    print("path", ref.path)
-    payload = ref.get()
+    ref = db.reference(get_user_autofill_values_path(user_id))
+    ref.update(values)
 
-    try:
-        obj = payload["object"]
-    except TypeError:
-        raise ValueError("Object not found in cache")
 
-    return unpickle_object(obj)
+def set_user_autofill_value_if_missing(user_id, path: str, value):
+    """
+    Writes the value only if nothing is stored at the path yet, in a transaction so a value saved
+    concurrently isn't overwritten
+    Returns the value stored at the path afterwards
+    """
+    ref = db.reference(f"{get_user_autofill_values_path(user_id)}/{path}")
+    return ref.transaction(lambda current: value if current is None else current)
 
 
-def get_user_values_path(user_id):
-    return f"users/{user_id}"
+PDF_CONVERSION_JOBS_PATH = "pdf_conversion_jobs"
 
 
-def get_user_autofill_values_path(user_id):
-    return f"{get_user_values_path(user_id)}/autofill"
+def get_pdf_conversion_job_path(job_id: str) -> str:
+    return f"{PDF_CONVERSION_JOBS_PATH}/{job_id}"
 
 
-def get_user_autofill_data(user_id):
-    ref = db.reference(get_user_autofill_values_path(user_id))
-    return ref.get()
+def set_pdf_conversion_job(job_id: str, job: dict):
+    ref = db.reference(get_pdf_conversion_job_path(job_id))
+    ref.set(job)
 
 
-def save_user_autofill_data(user_id, data):
-    ref = db.reference(get_user_autofill_values_path(user_id))
-    ref.set(data)
+def get_pdf_conversion_job(job_id: str) -> dict | None:
+    ref = db.reference(get_pdf_conversion_job_path(job_id))
+    return ref.get()
 
 
 def get_autofill_prototype_cache_path():
@@ -1,10 +1,7 @@
 from LLM_tailoring.claude import execute_generation_with_claude
 from LLM_tailoring.free_response.text_based_prompt import generate_free_response_prompt
 
-from docx_functions.marshaling.serialization import serialize_raw_docx
-
-from firebase.buckets import fetch_and_download_resume
-from linkedin_fetching.fetch_job_description import fetch_job_description_markdown
+from tailoring_context import gather_tailoring_context
 
 
 def write_response(
@@ -14,18 +11,16 @@ def write_response(
     job_description_link: str,
     resume_name: str | None,
 ) -> str:
-    resume_rawtext = None
-    if not ((resume_name is None) or (resume_name == "")):
-        resume_path = fetch_and_download_resume(user_id, resume_name)
-        resume_rawtext = serialize_raw_docx(resume_path)
-
-    job_description = fetch_job_description_markdown(job_description_link)
+    # The resume is optional here, an empty name skips it
+    context = gather_tailoring_context(
+        user_id, job_description_link=job_description_link, resume_name=resume_name
+    )
 
     prompt = generate_free_response_prompt(
-        job_description=job_description,
+        job_description=context.job_description,
         user_answer_suggestion=user_answer_suggestion,
         prompt_question=prompt_question,
-        resume_text=resume_rawtext,
+        resume_text=context.resume_markdown,
     )
     print("PROMPT", prompt)
 
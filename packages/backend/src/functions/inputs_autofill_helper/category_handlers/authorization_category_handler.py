@@ -19,13 +19,9 @@ class AuthorizationHandler(EnumBasedCategoryHandler):
         else:
             raise ValueError("Authorization value incorrect")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "us_authorized": ["Yes", "I am authorized to work"],
-            "no_authorization": ["No", "I am not authorized"],
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "us_authorized": ["Yes", "I am authorized to work"],
+        "no_authorization": ["No", "I am not authorized"],
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "authorization"
+    VALUE_PATH = "authorization"
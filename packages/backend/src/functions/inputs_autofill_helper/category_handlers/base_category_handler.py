@@ -8,10 +8,11 @@ from functions.inputs_autofill_helper.autofill_schema import (
     SaveInstruction,
 )
 
-from dictor import dictor
-
-from functions.inputs_autofill_helper.option_selection import (
-    get_most_similar_canonical_option,
+from functions.inputs_autofill_helper.option_selection import CanonicalMatcher
+from functions.inputs_autofill_helper.profile_values import (
+    ProfileValues,
+    compile_value_path,
+    flatten_autofill_data,
 )
 
 
@@ -27,8 +28,26 @@ def get_decline_answer_canonicals():
 
 
 class BaseCategoryHandler(ABC):
-    def __init__(self, user_autofill_data):
+    # Handlers that read one value set VALUE_PATH as a class constant, it's compiled into VALUE_KEYS once
+    VALUE_PATH: str
+    VALUE_KEYS: tuple[str, ...]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "VALUE_PATH" in cls.__dict__:
+            cls.VALUE_KEYS = compile_value_path(cls.VALUE_PATH)
+
+    def __init__(
+        self, user_autofill_data, profile_values: ProfileValues | None = None
+    ):
         self.user_autofill_data = user_autofill_data
+        # CategoryHandlers flattens the profile once per request and shares it between its handlers
+        if profile_values is None:
+            profile_values = flatten_autofill_data(user_autofill_data)
+        self.profile_values = profile_values
+
+    def get_profile_value(self, value_keys: tuple[str, ...]):
+        return self.profile_values.get(value_keys)
 
     def is_text_field(self, fieldType: FieldType):
         return fieldType in [
@@ -139,7 +158,7 @@ class TextOnlyCategoryHandler(BaseCategoryHandler, ABC):
 
 class SimpleTextOnlyCategoryHandler(TextOnlyCategoryHandler, ABC):
     def _get_text(self) -> str | None:
-        value = dictor(self.user_autofill_data, self.VALUE_PATH.replace("/", "."))
+        value = self.get_profile_value(self.VALUE_KEYS)
         return str(value) if value is not None else None
 
     @override
@@ -164,22 +183,26 @@ class SimpleTextOnlyCategoryHandler(TextOnlyCategoryHandler, ABC):
             "path": self.VALUE_PATH,
         }
 
-    @property
-    @abstractmethod
-    def VALUE_PATH(self) -> str:
-        # ie "name/first_name"
-        pass
-
 
 class EnumBasedCategoryHandler(BaseCategoryHandler, ABC):
     """
     For input categories whose autofill value in the schema is represented by an enum - ie. disability status is represented by an enum with values "disabled" or "enabled".
     These input fields could be either a select dropdown or a radio button, or sometimes even a raw text box.
+
+    Subclasses set CANONICALS as a class constant, it's compiled into CANONICAL_MATCHER once when the class is defined
     """
 
+    CANONICALS: dict[str, list[str]]
+    CANONICAL_MATCHER: CanonicalMatcher
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "CANONICALS" in cls.__dict__:
+            cls.CANONICAL_MATCHER = CanonicalMatcher(cls.CANONICALS)
+
     @property
     def _autofill_value(self):
-        return dictor(self.user_autofill_data, self.VALUE_PATH.replace("/", "."))
+        return self.get_profile_value(self.VALUE_KEYS)
 
     def can_autofill_category(self) -> bool:
         return self._autofill_value is not None
@@ -194,7 +217,7 @@ class EnumBasedCategoryHandler(BaseCategoryHandler, ABC):
         self, classified_input: ClassifiedInput, other_inputs: ClassifiedInputList
     ) -> bool | None:
         label = classified_input.label
-        best_canonical = get_most_similar_canonical_option(label, self.CANONICALS)
+        best_canonical = self.CANONICAL_MATCHER.get_most_similar(label)
         print(f"label: {label} best_canonical {best_canonical}")
 
         if best_canonical == self._autofill_value:
@@ -206,7 +229,7 @@ class EnumBasedCategoryHandler(BaseCategoryHandler, ABC):
         self, classified_input: ClassifiedInput
     ) -> SaveInstruction | list[SaveInstruction]:
         value = classified_input.value
-        best_canonical = get_most_similar_canonical_option(value, self.CANONICALS)
+        best_canonical = self.CANONICAL_MATCHER.get_most_similar(value)
         # print(
         #     f"{self.__class__.__name__} - value: {value} best_canonical: {best_canonical}"
         # )
@@ -214,7 +237,7 @@ class EnumBasedCategoryHandler(BaseCategoryHandler, ABC):
         return {
             "path": self.VALUE_PATH,
             "value": best_canonical,
-            "dont_overwrite_existing": True,
+            "dont_overwrite_existing": False,
         }
 
     def save_checkable_input(
@@ -222,7 +245,7 @@ class EnumBasedCategoryHandler(BaseCategoryHandler, ABC):
     ) -> SaveInstruction | list[SaveInstruction]:
         label = classified_input.label
         checked = classified_input.value == True
-        best_canonical = get_most_similar_canonical_option(label, self.CANONICALS)
+        best_canonical = self.CANONICAL_MATCHER.get_most_similar(label)
 
         if not checked:
             # We only save when the box is checked as we can be absolutely certain the user has intended this
@@ -233,14 +256,3 @@ class EnumBasedCategoryHandler(BaseCategoryHandler, ABC):
             "value": best_canonical,
             "dont_overwrite_existing": False,
         }
-
-    @property
-    @abstractmethod
-    def CANONICALS(self) -> dict[str, list[str]]:
-        pass
-
-    @property
-    @abstractmethod
-    def VALUE_PATH(self) -> str:
-        # ie. sponsorship/yesNoAnswer
-        pass
@@ -19,23 +19,19 @@ class DisabilityHandler(EnumBasedCategoryHandler):
         else:
             return "I prefer not to say"
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "disabled": [
-                "Yes",
-                "Yes, I have a disability",
-                "I am disabled",
-            ],
-            "enabled": [
-                "No",
-                "No, I do not have a disability",
-                "I am not disabled",
-                "nope",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "disabled": [
+            "Yes",
+            "Yes, I have a disability",
+            "I am disabled",
+        ],
+        "enabled": [
+            "No",
+            "No, I do not have a disability",
+            "I am not disabled",
+            "nope",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "disability"
+    VALUE_PATH = "disability"
@@ -4,6 +4,4 @@ from functions.inputs_autofill_helper.category_handlers.base_category_handler im
 
 
 class DisciplineHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "education/discipline"
+    VALUE_PATH = "education/discipline"
@@ -22,41 +22,37 @@ class GenderIdentityHandler(EnumBasedCategoryHandler):
 
         return gender_mapping.get(self._autofill_value, "I prefer not to say")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "man": [
-                "Male",
-                "Man",
-                "M",
-                "male",
-                "man",
-            ],
-            "woman": [
-                "Female",
-                "Woman",
-                "F",
-                "female",
-                "woman",
-            ],
-            "non_binary": [
-                "Non-binary",
-                "Nonbinary",
-                "Non binary",
-                "Enby",
-                "Gender neutral",
-                "Genderqueer",
-                "Neither",
-            ],
-            "other": [
-                "Other",
-                "Self-describe",
-                "Different identity",
-                "Another option",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "man": [
+            "Male",
+            "Man",
+            "M",
+            "male",
+            "man",
+        ],
+        "woman": [
+            "Female",
+            "Woman",
+            "F",
+            "female",
+            "woman",
+        ],
+        "non_binary": [
+            "Non-binary",
+            "Nonbinary",
+            "Non binary",
+            "Enby",
+            "Gender neutral",
+            "Genderqueer",
+            "Neither",
+        ],
+        "other": [
+            "Other",
+            "Self-describe",
+            "Different identity",
+            "Another option",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "identity/gender"
+    VALUE_PATH = "identity/gender"
@@ -4,6 +4,4 @@ from functions.inputs_autofill_helper.category_handlers.base_category_handler im
 
 
 class GitHubUrlHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "github_url"
+    VALUE_PATH = "github_url"
@@ -20,30 +20,26 @@ class HispanicLatinoHandler(EnumBasedCategoryHandler):
 
         return hispanic_mapping.get(self._autofill_value, "I prefer not to say")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "yes": [
-                "Yes",
-                "Yes, I am Hispanic or Latino",
-                "Hispanic",
-                "Latino",
-                "Latina",
-                "Latinx",
-                "Si",
-                "Sí",
-            ],
-            "no": [
-                "No",
-                "No, I am not Hispanic or Latino",
-                "Not Hispanic",
-                "Not Latino",
-                "Non-Hispanic",
-                "Non-Latino",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "yes": [
+            "Yes",
+            "Yes, I am Hispanic or Latino",
+            "Hispanic",
+            "Latino",
+            "Latina",
+            "Latinx",
+            "Si",
+            "Sí",
+        ],
+        "no": [
+            "No",
+            "No, I am not Hispanic or Latino",
+            "Not Hispanic",
+            "Not Latino",
+            "Non-Hispanic",
+            "Non-Latino",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "race/hispanic_latino"
+    VALUE_PATH = "race/hispanic_latino"
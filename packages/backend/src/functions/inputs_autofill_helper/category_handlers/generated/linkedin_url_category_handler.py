@@ -4,6 +4,4 @@ from functions.inputs_autofill_helper.category_handlers.base_category_handler im
 
 
 class LinkedInUrlHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "linkedin_profile"
+    VALUE_PATH = "linkedin_profile"
@@ -23,57 +23,53 @@ class PronounsHandler(EnumBasedCategoryHandler):
 
         return pronoun_mapping.get(self._autofill_value, "I prefer not to say")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "he/him": [
-                "he/him",
-                "He/Him",
-                "he",
-                "him",
-                "He",
-                "Him",
-                "masculine",
-                "male pronouns",
-            ],
-            "she/her": [
-                "she/her",
-                "She/Her",
-                "she",
-                "her",
-                "She",
-                "Her",
-                "feminine",
-                "female pronouns",
-            ],
-            "they/them": [
-                "they/them",
-                "They/Them",
-                "they",
-                "them",
-                "They",
-                "Them",
-                "neutral",
-                "gender neutral",
-            ],
-            "ze/zir": [
-                "ze/zir",
-                "Ze/Zir",
-                "ze",
-                "zir",
-                "Ze",
-                "Zir",
-            ],
-            "other": [
-                "Other",
-                "other",
-                "Custom",
-                "Different",
-                "Self-describe",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "he/him": [
+            "he/him",
+            "He/Him",
+            "he",
+            "him",
+            "He",
+            "Him",
+            "masculine",
+            "male pronouns",
+        ],
+        "she/her": [
+            "she/her",
+            "She/Her",
+            "she",
+            "her",
+            "She",
+            "Her",
+            "feminine",
+            "female pronouns",
+        ],
+        "they/them": [
+            "they/them",
+            "They/Them",
+            "they",
+            "them",
+            "They",
+            "Them",
+            "neutral",
+            "gender neutral",
+        ],
+        "ze/zir": [
+            "ze/zir",
+            "Ze/Zir",
+            "ze",
+            "zir",
+            "Ze",
+            "Zir",
+        ],
+        "other": [
+            "Other",
+            "other",
+            "Custom",
+            "Different",
+            "Self-describe",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "identity/pronouns"
+    VALUE_PATH = "identity/pronouns"
@@ -23,52 +23,48 @@ class SexualOrientationHandler(EnumBasedCategoryHandler):
 
         return orientation_mapping.get(self._autofill_value, "I prefer not to say")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "heterosexual": [
-                "Heterosexual",
-                "heterosexual",
-                "Straight",
-                "straight",
-                "Hetero",
-                "hetero",
-            ],
-            "homosexual": [
-                "Homosexual",
-                "homosexual",
-                "Gay",
-                "gay",
-                "Lesbian",
-                "lesbian",
-            ],
-            "pansexual": [
-                "Pansexual",
-                "pansexual",
-                "Pan",
-                "pan",
-                "Omnisexual",
-                "omnisexual",
-            ],
-            "asexual": [
-                "Asexual",
-                "asexual",
-                "Ace",
-                "ace",
-                "Aromantic",
-                "aromantic",
-            ],
-            "queer": [
-                "Queer",
-                "queer",
-                "LGBTQ+",
-                "LGBT",
-                "Questioning",
-                "questioning",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "heterosexual": [
+            "Heterosexual",
+            "heterosexual",
+            "Straight",
+            "straight",
+            "Hetero",
+            "hetero",
+        ],
+        "homosexual": [
+            "Homosexual",
+            "homosexual",
+            "Gay",
+            "gay",
+            "Lesbian",
+            "lesbian",
+        ],
+        "pansexual": [
+            "Pansexual",
+            "pansexual",
+            "Pan",
+            "pan",
+            "Omnisexual",
+            "omnisexual",
+        ],
+        "asexual": [
+            "Asexual",
+            "asexual",
+            "Ace",
+            "ace",
+            "Aromantic",
+            "aromantic",
+        ],
+        "queer": [
+            "Queer",
+            "queer",
+            "LGBTQ+",
+            "LGBT",
+            "Questioning",
+            "questioning",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "identity/sexual_orientation"
+    VALUE_PATH = "identity/sexual_orientation"
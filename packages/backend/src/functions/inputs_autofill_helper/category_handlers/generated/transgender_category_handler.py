@@ -20,28 +20,24 @@ class TransgenderHandler(EnumBasedCategoryHandler):
 
         return transgender_mapping.get(self._autofill_value, "I prefer not to say")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "yes": [
-                "Yes",
-                "Yes, I am transgender",
-                "Transgender",
-                "Trans",
-                "I am transgender",
-                "I identify as transgender",
-            ],
-            "no": [
-                "No",
-                "No, I am not transgender",
-                "Not transgender",
-                "Cisgender",
-                "Cis",
-                "I am not transgender",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "yes": [
+            "Yes",
+            "Yes, I am transgender",
+            "Transgender",
+            "Trans",
+            "I am transgender",
+            "I identify as transgender",
+        ],
+        "no": [
+            "No",
+            "No, I am not transgender",
+            "Not transgender",
+            "Cisgender",
+            "Cis",
+            "I am not transgender",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "identity/transgender"
+    VALUE_PATH = "identity/transgender"
@@ -20,30 +20,26 @@ class VeteranHandler(EnumBasedCategoryHandler):
 
         return veteran_mapping.get(self._autofill_value, "I prefer not to say")
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "protected_veteran": [
-                "Yes",
-                "Yes, I am a protected veteran",
-                "Protected veteran",
-                "Veteran",
-                "I am a veteran",
-                "Military veteran",
-                "Armed forces veteran",
-                "Disabled veteran",
-            ],
-            "not_veteran": [
-                "No",
-                "No, I am not a veteran",
-                "Not a veteran",
-                "Non-veteran",
-                "I am not a veteran",
-                "Civilian",
-            ],
-            "prefer_not_to_say": get_decline_answer_canonicals(),
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "protected_veteran": [
+            "Yes",
+            "Yes, I am a protected veteran",
+            "Protected veteran",
+            "Veteran",
+            "I am a veteran",
+            "Military veteran",
+            "Armed forces veteran",
+            "Disabled veteran",
+        ],
+        "not_veteran": [
+            "No",
+            "No, I am not a veteran",
+            "Not a veteran",
+            "Non-veteran",
+            "I am not a veteran",
+            "Civilian",
+        ],
+        "prefer_not_to_say": get_decline_answer_canonicals(),
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "veteran"
+    VALUE_PATH = "veteran"
@@ -1,4 +1,7 @@
 from functions.inputs_autofill_helper.autofill_schema import InputType
+from functions.inputs_autofill_helper.category_handlers.base_category_handler import (
+    BaseCategoryHandler,
+)
 from functions.inputs_autofill_helper.category_handlers.authorization_category_handler import (
     AuthorizationHandler,
 )
@@ -79,116 +82,109 @@ from functions.inputs_autofill_helper.category_handlers.generated.discipline_cat
 from functions.inputs_autofill_helper.category_handlers.generated.race_ethnicity_category_handler import (
     RaceEthnicityHandler,
 )
+from functions.inputs_autofill_helper.profile_values import (
+    ProfileValues,
+    flatten_autofill_data,
+)
+
+
+CATEGORY_HANDLERS: dict[InputType, type[BaseCategoryHandler]] = {
+    # Basic Fields
+    InputType.FIRST_NAME: FirstNameHandler,
+    InputType.LAST_NAME: LastNameHandler,
+    InputType.FULL_NAME: FullNameHandler,
+    InputType.PHONE_NUMBER: PhoneNumberHandler,
+    InputType.EMAIL: EmailHandler,
+    # Profiles
+    InputType.LINKEDIN_URL: LinkedInUrlHandler,
+    InputType.GITHUB_URL: GitHubUrlHandler,
+    InputType.PERSONAL_WEBSITE: PersonalWebsiteHandler,
+    InputType.JOB_DISCOVERY: JobDiscoveryHandler,
+    # Location
+    InputType.GENERAL_LOCATION: GeneralLocationHandler,
+    InputType.MAILING_ADDRESS: AddressHandler,
+    InputType.LOCATION_CITY: CityHandler,
+    InputType.STATE_PROVINCE: StateHandler,
+    InputType.COUNTRY: CountryHandler,
+    InputType.POSTAL_CODE: PostalCodeHandler,
+    # Work Authorization
+    InputType.SPONSORSHIP_REQUIRED: SponsorshipYesNoHandler,
+    InputType.SPONSORSHIP_EXPLANATION: SponsorshipExplanationHandler,
+    InputType.AUTHORIZATION: AuthorizationHandler,
+    # Self Identification
+    InputType.DISABILITY: DisabilityHandler,
+    InputType.VETERAN: VeteranHandler,
+    InputType.TRANSGENDER: TransgenderHandler,
+    InputType.GENDER_IDENTITY: GenderIdentityHandler,
+    InputType.PRONOUNS: PronounsHandler,
+    InputType.SEXUAL_ORIENTATION: SexualOrientationHandler,
+    InputType.HISPANIC_LATINO: HispanicLatinoHandler,
+    InputType.ETHNICITY: RaceEthnicityHandler,
+    # Education
+    InputType.SCHOOL: UniversityHandler,
+    InputType.ENROLLED_STUDENT: EnrolledHandler,
+    InputType.EDUCATION_START_DATE: StartYearHandler,
+    InputType.EDUCATION_END_DATE: EndYearHandler,
+    InputType.DEGREE: DegreeHandler,
+    InputType.DISCIPLINE: DisciplineHandler,
+    InputType.FREE_RESPONSE: FreeResponseHandler,
+    # Default Cases
+    InputType.UNKNOWN: UnknownCategoryHandler,
+}
 
+# Categories that can be classified but have no handler yet, with the name used in the error
+UNIMPLEMENTED_CATEGORIES: dict[InputType, str] = {
+    InputType.PREFERRED_FIRST_NAME: "Preferred First Name",
+    InputType.OTHER_WEBSITE: "Other Website",
+    InputType.AVAILABLE_MONTHS: "Available Months",
+    InputType.START_TIME: "Start Time",
+    InputType.FULL_TIME_AVAILABILITY: "Full Time Availability",
+    InputType.USING_WORK_VISA: "Using Work Visa",
+    InputType.CURRENT_COMPANY: "Current Company",
+    InputType.YEARS_EXPERIENCE: "Years Experience",
+    InputType.DESIRED_SALARY: "Desired Salary",
+    InputType.REPORT_REQUIRED: "Report Required",
+}
 
-def get_category_handler(category_name: str, user_autofill_data):
-    match category_name:
-        # Basic Fields
-        case InputType.FIRST_NAME:
-            return FirstNameHandler(user_autofill_data)
-        case InputType.LAST_NAME:
-            return LastNameHandler(user_autofill_data)
-        case InputType.FULL_NAME:
-            return FullNameHandler(user_autofill_data)
-        case InputType.PHONE_NUMBER:
-            return PhoneNumberHandler(user_autofill_data)
-        case InputType.EMAIL:
-            return EmailHandler(user_autofill_data)
-        case InputType.PREFERRED_FIRST_NAME:
-            raise NotImplementedError("No Preferred First Name Handler Implemented")
 
-        # Profiles
-        case InputType.LINKEDIN_URL:
-            return LinkedInUrlHandler(user_autofill_data)
-        case InputType.GITHUB_URL:
-            return GitHubUrlHandler(user_autofill_data)
-        case InputType.PERSONAL_WEBSITE:
-            return PersonalWebsiteHandler(user_autofill_data)
-        case InputType.OTHER_WEBSITE:
-            raise NotImplementedError("No Other Website Handler Implemented")
-        case InputType.JOB_DISCOVERY:
-            return JobDiscoveryHandler(user_autofill_data)
+def get_category_handler_class(category_name: InputType) -> type[BaseCategoryHandler]:
+    handler_class = CATEGORY_HANDLERS.get(category_name)
+    if handler_class is not None:
+        return handler_class
 
-        # Location
-        case InputType.GENERAL_LOCATION:
-            return GeneralLocationHandler(user_autofill_data)
-        case InputType.MAILING_ADDRESS:
-            return AddressHandler(user_autofill_data)
-        case InputType.LOCATION_CITY:
-            return CityHandler(user_autofill_data)
-        case InputType.STATE_PROVINCE:
-            return StateHandler(user_autofill_data)
-        case InputType.COUNTRY:
-            return CountryHandler(user_autofill_data)
-        case InputType.POSTAL_CODE:
-            return PostalCodeHandler(user_autofill_data)
+    if category_name in UNIMPLEMENTED_CATEGORIES:
+        raise NotImplementedError(
+            f"No {UNIMPLEMENTED_CATEGORIES[category_name]} Handler Implemented"
+        )
+    raise ValueError(f"Category handler not found for category: {category_name}")
 
-        # Availability
-        case InputType.AVAILABLE_MONTHS:
-            raise NotImplementedError("No Available Months Handler Implemented")
-        case InputType.START_TIME:
-            raise NotImplementedError("No Start Time Handler Implemented")
-        case InputType.FULL_TIME_AVAILABILITY:
-            raise NotImplementedError("No Full Time Availability Handler Implemented")
 
-        # Work Authorization
-        case InputType.SPONSORSHIP_REQUIRED:
-            return SponsorshipYesNoHandler(user_autofill_data)
-        case InputType.SPONSORSHIP_EXPLANATION:
-            return SponsorshipExplanationHandler(user_autofill_data)
-        case InputType.AUTHORIZATION:
-            return AuthorizationHandler(user_autofill_data)
-        case InputType.USING_WORK_VISA:
-            raise NotImplementedError("No Using Work Visa Handler Implemented")
+def get_category_handler(
+    category_name: InputType,
+    user_autofill_data,
+    profile_values: ProfileValues | None = None,
+):
+    return get_category_handler_class(category_name)(
+        user_autofill_data, profile_values
+    )
 
-        # Previous Job
-        case InputType.CURRENT_COMPANY:
-            raise NotImplementedError("No Current Company Handler Implemented")
-        case InputType.YEARS_EXPERIENCE:
-            raise NotImplementedError("No Years Experience Handler Implemented")
 
-        # Self Identification
-        case InputType.DISABILITY:
-            return DisabilityHandler(user_autofill_data)
-        case InputType.VETERAN:
-            return VeteranHandler(user_autofill_data)
-        case InputType.TRANSGENDER:
-            return TransgenderHandler(user_autofill_data)
-        case InputType.GENDER_IDENTITY:
-            return GenderIdentityHandler(user_autofill_data)
-        case InputType.PRONOUNS:
-            return PronounsHandler(user_autofill_data)
-        case InputType.SEXUAL_ORIENTATION:
-            return SexualOrientationHandler(user_autofill_data)
-        case InputType.HISPANIC_LATINO:
-            return HispanicLatinoHandler(user_autofill_data)
-        case InputType.ETHNICITY:
-            return RaceEthnicityHandler(user_autofill_data)
-        case InputType.DESIRED_SALARY:
-            raise NotImplementedError("No Desired Salary Handler Implemented")
+class CategoryHandlers:
+    """
+    Handlers for one request's autofill data, each category's handler is created the first time it's asked for
+    The data is flattened once here and every handler reads from the same flattened values
+    """
 
-        # Education
-        case InputType.SCHOOL:
-            return UniversityHandler(user_autofill_data)
-        case InputType.ENROLLED_STUDENT:
-            return EnrolledHandler(user_autofill_data)
-        case InputType.REPORT_REQUIRED:
-            raise NotImplementedError("No Report Required Handler Implemented")
-        case InputType.EDUCATION_START_DATE:
-            return StartYearHandler(user_autofill_data)
-        case InputType.EDUCATION_END_DATE:
-            return EndYearHandler(user_autofill_data)
-        case InputType.DEGREE:
-            return DegreeHandler(user_autofill_data)
-        case InputType.DISCIPLINE:
-            return DisciplineHandler(user_autofill_data)
-        case InputType.FREE_RESPONSE:
-            return FreeResponseHandler(user_autofill_data)
+    def __init__(self, user_autofill_data):
+        self.user_autofill_data = user_autofill_data
+        self.profile_values = flatten_autofill_data(user_autofill_data)
+        self.handlers: dict[InputType, BaseCategoryHandler] = {}
 
-        # Default Cases
-        case InputType.UNKNOWN:
-            return UnknownCategoryHandler(user_autofill_data)
-        case _:
-            raise ValueError(
-                f"Category handler not found for category: {category_name}"
+    def get(self, category_name: InputType) -> BaseCategoryHandler:
+        handler = self.handlers.get(category_name)
+        if handler is None:
+            handler = get_category_handler(
+                category_name, self.user_autofill_data, self.profile_values
             )
+            self.handlers[category_name] = handler
+        return handler
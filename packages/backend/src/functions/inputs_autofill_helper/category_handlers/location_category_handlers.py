@@ -8,24 +8,19 @@ from functions.inputs_autofill_helper.category_handlers.base_category_handler im
     SimpleTextOnlyCategoryHandler,
     TextOnlyCategoryHandler,
 )
-
-from dictor import dictor
+from functions.inputs_autofill_helper.profile_values import compile_value_path
 
 
 class GeneralLocationHandler(TextOnlyCategoryHandler):
-    def _get_values(self):
-        address = dictor(self.user_autofill_data, "location.address")
-        city = dictor(self.user_autofill_data, "location.city")
-        state = dictor(self.user_autofill_data, "location.state")
-        postal_code = dictor(self.user_autofill_data, "location.postal_code")
-        country = dictor(self.user_autofill_data, "location.country")
+    LOCATION_KEYS = {
+        name: compile_value_path(f"location/{name}")
+        for name in ["address", "city", "state", "postal_code", "country"]
+    }
 
+    def _get_values(self):
         return {
-            "address": address,
-            "city": city,
-            "state": state,
-            "postal_code": postal_code,
-            "country": country,
+            name: self.get_profile_value(keys)
+            for name, keys in self.LOCATION_KEYS.items()
         }
 
     def can_autofill_category(self) -> bool:
@@ -54,27 +49,19 @@ class GeneralLocationHandler(TextOnlyCategoryHandler):
 
 
 class AddressHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "location/address"
+    VALUE_PATH = "location/address"
 
 
 class CityHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "location/city"
+    VALUE_PATH = "location/city"
 
 
 class StateHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "location/state"
+    VALUE_PATH = "location/state"
 
 
 class PostalCodeHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "location/postal_code"
+    VALUE_PATH = "location/postal_code"
 
 
 class CountryHandler(EnumBasedCategoryHandler):
@@ -84,14 +71,10 @@ class CountryHandler(EnumBasedCategoryHandler):
         value = self._autofill_value
         return self.CANONICALS[value][0].title()
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "usa": ["United States", "United States of America", "USA", "US"],
-            "canada": ["Canada", "CA"],
-            "other": ["Other", "OTHER"],
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "usa": ["United States", "United States of America", "USA", "US"],
+        "canada": ["Canada", "CA"],
+        "other": ["Other", "OTHER"],
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "location/country"
+    VALUE_PATH = "location/country"
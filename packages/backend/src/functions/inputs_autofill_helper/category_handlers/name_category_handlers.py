@@ -7,26 +7,24 @@ from functions.inputs_autofill_helper.category_handlers.base_category_handler im
     SimpleTextOnlyCategoryHandler,
     TextOnlyCategoryHandler,
 )
-
-from dictor import dictor
+from functions.inputs_autofill_helper.profile_values import compile_value_path
 
 
 class FirstNameHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "name/first_name"
+    VALUE_PATH = "name/first_name"
 
 
 class LastNameHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "name/last_name"
+    VALUE_PATH = "name/last_name"
 
 
 class FullNameHandler(TextOnlyCategoryHandler):
+    FIRST_NAME_KEYS = compile_value_path("name/first_name")
+    LAST_NAME_KEYS = compile_value_path("name/last_name")
+
     def get_names(self):
-        first_name = dictor(self.user_autofill_data, "name.first_name")
-        last_name = dictor(self.user_autofill_data, "name.last_name")
+        first_name = self.get_profile_value(self.FIRST_NAME_KEYS)
+        last_name = self.get_profile_value(self.LAST_NAME_KEYS)
         return first_name, last_name
 
     def can_autofill_category(self) -> bool:
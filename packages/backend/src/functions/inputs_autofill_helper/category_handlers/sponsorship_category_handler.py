@@ -18,19 +18,13 @@ class SponsorshipYesNoHandler(EnumBasedCategoryHandler):
         else:
             return "No, I do not require sponsorship to work"
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "require_sponsorship": ["yes", "Yes, I require sponsorship"],
-            "no_sponsorship": ["No", "No, I do not require sponsorship"],
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "require_sponsorship": ["yes", "Yes, I require sponsorship"],
+        "no_sponsorship": ["No", "No, I do not require sponsorship"],
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "sponsorship/yesNoAnswer"
+    VALUE_PATH = "sponsorship/yesNoAnswer"
 
 
 class SponsorshipExplanationHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "sponsorship/textAnswer"
+    VALUE_PATH = "sponsorship/textAnswer"
@@ -19,31 +19,21 @@ class EnrolledHandler(EnumBasedCategoryHandler):
         else:
             raise ValueError()
 
-    @property
-    def CANONICALS(self) -> dict[str, list[str]]:
-        return {
-            "enrolled": ["Yes", "I am enrolled"],
-            "not_enrolled": ["No", "I am not enrolled"],
-        }
+    CANONICALS: dict[str, list[str]] = {
+        "enrolled": ["Yes", "I am enrolled"],
+        "not_enrolled": ["No", "I am not enrolled"],
+    }
 
-    @property
-    def VALUE_PATH(self) -> str:
-        return "education/currently_enrolled"
+    VALUE_PATH = "education/currently_enrolled"
 
 
 class UniversityHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "education/school"
+    VALUE_PATH = "education/school"
 
 
 class StartYearHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "education/start_date_year"
+    VALUE_PATH = "education/start_date_year"
 
 
 class EndYearHandler(SimpleTextOnlyCategoryHandler):
-    @property
-    def VALUE_PATH(self) -> str:
-        return "education/end_date_year"
+    VALUE_PATH = "education/end_date_year"
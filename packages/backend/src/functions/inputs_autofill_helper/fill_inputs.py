@@ -1,27 +1,24 @@
 import json
-from firebase.realtime_db import get_user_autofill_data
+from firebase.autofill_profile_cache import autofill_profile_cache
 from functions.inputs_autofill_helper.autofill_schema import InputList
 from functions.inputs_autofill_helper.category_handlers.get_handler import (
-    get_category_handler,
+    CategoryHandlers,
 )
 from functions.inputs_autofill_helper.embeddings import get_input_classifications
 
 
 def get_filled_inputs(user_id, inputs: InputList):
-    user_autofill_data = get_user_autofill_data(user_id)
+    user_autofill_data = autofill_profile_cache.get(user_id)
     print("user_autofill_data\n", user_autofill_data)
-    if not user_autofill_data:
-        user_autofill_data = {}
 
     classified_inputs = get_input_classifications(inputs)
     print("classified\n", classified_inputs.model_dump_json(), "\n\n")
 
+    category_handlers = CategoryHandlers(user_autofill_data)
     filled_inputs = []
     for classified_input in classified_inputs:
         try:
-            category_handler = get_category_handler(
-                classified_input.category, user_autofill_data
-            )
+            category_handler = category_handlers.get(classified_input.category)
             value = category_handler.get_autofill_value(
                 classified_input, classified_inputs
             )
@@ -15,6 +15,9 @@ class CanonicalOptions(RootModel):
 # ie. a string with the word "not" and a string without it
 INCORRECT_NEGATION_PENALTY = 0.4
 
+# Below this no canonical option is considered a match
+MIN_CANONICAL_SIMILARITY = 0.3
+
 NEGATION_TOKENS = {"not", "can't", "cannot", "isn't", "aren't"}
 
 
@@ -32,31 +35,74 @@ def count_negations(tokenized_string: list[str]):
     return sum([s in NEGATION_TOKENS for s in tokenized_string])
 
 
+def is_negated(tokenized_string: list[str]) -> bool:
+    return count_negations(tokenized_string) > 0
+
+
+def get_tokenized_similarity(
+    tokenized1: list[str], negated1: bool, tokenized2: list[str], negated2: bool
+):
+    # Sorensen similarity metric - does a decent job
+    score = sorensen.normalized_similarity(tokenized1, tokenized2)
+    if negated1 != negated2:
+        return score * INCORRECT_NEGATION_PENALTY
+
+    return score
+
+
 def get_similarity(value1: str, value2: str):
     """Gets sorensen similarity but also handles negations (ie not) so that we only say options are similar
     if they're both positive or negative - like "I am authorized" vs "I am not authorized"
     should register as very non-similar"""
 
     tokenized1, tokenized2 = tokenize_string(value1), tokenize_string(value2)
-    negation_equality = (count_negations(tokenized1) > 0) == (
-        count_negations(tokenized2) > 0
+    return get_tokenized_similarity(
+        tokenized1, is_negated(tokenized1), tokenized2, is_negated(tokenized2)
     )
 
-    # Sorensen similarity metric - does a decent job
-    score = sorensen.normalized_similarity(tokenized1, tokenized2)
-    # print(
-    #     f"\t {value2} - Score: {score}, negated: {negation_equality} - {count_negations(tokenized1) > 0}, {count_negations(tokenized2) > 0}"
-    # )
-    if not negation_equality:
-        return score * 0.4
-
-    return score
-
 
 def get_max_similarity(value, comparason_strings):
     return max([get_similarity(value, s) for s in comparason_strings])
 
 
+class CanonicalMatcher:
+    """
+    Canonical options validated and tokenized once, so each lookup only tokenizes the value
+    """
+
+    __slots__ = ("canonical_options", "tokenized_options")
+
+    def __init__(self, canonical_options: dict[str, list[str]]):
+        CanonicalOptions.model_validate(canonical_options)
+        self.canonical_options = canonical_options
+        self.tokenized_options: list[tuple[str, list[tuple[list[str], bool]]]] = []
+        for canonical_label, canonical_strings in canonical_options.items():
+            tokenized_strings = [tokenize_string(s) for s in canonical_strings]
+            self.tokenized_options.append(
+                (canonical_label, [(t, is_negated(t)) for t in tokenized_strings])
+            )
+
+    def get_most_similar(self, value: str) -> str | None:
+        tokenized_value = tokenize_string(value)
+        value_negated = is_negated(tokenized_value)
+
+        max_similarity = -1
+        max_similarity_option = None
+        for canonical_label, tokenized_strings in self.tokenized_options:
+            similarity = max(
+                get_tokenized_similarity(tokenized_value, value_negated, t, negated)
+                for t, negated in tokenized_strings
+            )
+            if similarity > max_similarity:
+                max_similarity = similarity
+                max_similarity_option = canonical_label
+
+        if max_similarity < MIN_CANONICAL_SIMILARITY:
+            return None
+
+        return max_similarity_option
+
+
 def get_most_similar_canonical_option(value: str, canonical_options: dict):
     """
     Essentially we're trying to figure out which enum value from the schema the field's label maps to. So we
@@ -64,26 +110,11 @@ def get_most_similar_canonical_option(value: str, canonical_options: dict):
 
     Should be used by category handlers for seeing how close a radio button's label is to the
     canonical options (these are just the enum values for the user autofill data)
+    Handlers match against their CANONICAL_MATCHER instead, this compiles the options on every call
 
     "value" should be the label on a radio button or checkbox
     """
-    CanonicalOptions.model_validate(canonical_options)
-
-    max_similarity = -1
-    max_similarity_option = None
-    # print("Finding best canonical for: ", value)
-    for canonical_label, canonical_strings in canonical_options.items():
-        # print("Label: ", canonical_label)
-        similarity = get_max_similarity(value, canonical_strings)
-        # print(f"Max Similarity: {similarity}\n")
-        if similarity > max_similarity:
-            max_similarity = similarity
-            max_similarity_option = canonical_label
-
-    if max_similarity < 0.3:
-        return None
-
-    return max_similarity_option
+    return CanonicalMatcher(canonical_options).get_most_similar(value)
 
 
 if __name__ == "__main__":
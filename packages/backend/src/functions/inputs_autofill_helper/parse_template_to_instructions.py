@@ -1,8 +1,18 @@
 import re
+from functools import lru_cache
+
 from functions.inputs_autofill_helper.gemini_generation import (
     AutofillResponseSchema,
     IfExpression,
 )
+from functions.inputs_autofill_helper.profile_values import (
+    ProfileValues,
+    compile_value_path,
+    flatten_autofill_data,
+)
+
+
+VALUE_PATH_SEGMENT_PATTERN = re.compile(r"(\{[^}]*\}|[^{]+)")
 
 
 def get_dict_value_by_path(path: str, nested_dict: dict):
@@ -27,9 +37,7 @@ def extract_value_path_segments(path: str):
     if not path:
         return []
 
-    pattern = r"(\{[^}]*\}|[^{]+)"
-    segments = re.findall(pattern, path)
-    return segments
+    return VALUE_PATH_SEGMENT_PATTERN.findall(path)
 
 
 def get_special_value_path_value(value: str):
@@ -45,17 +53,60 @@ def get_special_value_path_value(value: str):
         return None
 
 
-def get_value_from_path(path: str, user_data: dict):
-    segments = extract_value_path_segments(path)
-    output = []
-    for segment in segments:
-        special_value_path_value = get_special_value_path_value(segment)
-        if special_value_path_value is not None:
-            return special_value_path_value
-        if segment.startswith("{"):
-            key = segment[1:-1]
-            value = get_dict_value_by_path(key, user_data)
+class LiteralSegment:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
 
+class LookupSegment:
+    """
+    A {path} in a value path, looked up in the flattened profile
+    """
+
+    __slots__ = ("prefixes",)
+
+    def __init__(self, path: str):
+        keys = compile_value_path(path)
+        # Like get_dict_value_by_path, the first value on the way down that isn't a dict is the result
+        self.prefixes = [keys[: idx + 1] for idx in range(len(keys))]
+
+    def get_value(self, profile_values: ProfileValues):
+        for prefix in self.prefixes:
+            value = profile_values.get(prefix)
+            if not isinstance(value, dict):
+                return value
+        return None
+
+
+class SpecialSegment:
+    __slots__ = ("value",)
+
+    def __init__(self, value: str | bool):
+        self.value = value
+
+
+class ValuePathTemplate:
+    """
+    A value path string parsed into its literal, lookup and special segments
+    """
+
+    __slots__ = ("segments",)
+
+    def __init__(self, segments: list):
+        self.segments = segments
+
+    def evaluate(self, profile_values: ProfileValues) -> str | bool:
+        output = []
+        for segment in self.segments:
+            if isinstance(segment, SpecialSegment):
+                return segment.value
+            if isinstance(segment, LiteralSegment):
+                output.append(segment.text)
+                continue
+
+            value = segment.get_value(profile_values)
             # If we have a boolean, we can return it directly
             # As this just indicates that a radio button or checkbox should be checked
             if isinstance(value, bool):
@@ -64,10 +115,69 @@ def get_value_from_path(path: str, user_data: dict):
                 continue
 
             output.append(str(value))
+
+        return "".join(output)
+
+
+class ConditionalTemplate:
+    """
+    An IfExpression, picks the truthy or falsy template by comparing the condition's value
+    """
+
+    __slots__ = ("condition", "expected_value", "truthy", "falsy")
+
+    def __init__(self, expression: IfExpression):
+        self.condition = compile_value_path_template(
+            expression.condition.valuePathString
+        )
+        self.expected_value = expression.condition.value
+        self.truthy = compile_value_path_template(expression.truthyValuePathString)
+        self.falsy = compile_value_path_template(expression.falsyValuePathString)
+
+    def evaluate(self, profile_values: ProfileValues) -> str | bool:
+        if self.condition.evaluate(profile_values) == self.expected_value:
+            return self.truthy.evaluate(profile_values)
+        return self.falsy.evaluate(profile_values)
+
+
+@lru_cache(maxsize=1024)
+def compile_value_path_template(path: str) -> ValuePathTemplate:
+    """
+    Parses a value path string once, the same paths come back for every form with the same inputs
+    """
+    segments = []
+    for segment in extract_value_path_segments(path):
+        special_value = get_special_value_path_value(segment)
+        if special_value is not None:
+            segments.append(SpecialSegment(special_value))
+        elif segment.startswith("{"):
+            segments.append(LookupSegment(segment[1:-1]))
         else:
-            output.append(segment)
+            segments.append(LiteralSegment(segment))
+    return ValuePathTemplate(segments)
+
 
-    return "".join(output)
+def compile_instruction_value(value_path_string: str | IfExpression):
+    if isinstance(value_path_string, str):
+        return compile_value_path_template(value_path_string)
+    if isinstance(value_path_string, IfExpression):
+        return ConditionalTemplate(value_path_string)
+
+    raise ValueError(f"Unknown instruction type: {type(value_path_string)}")
+
+
+def get_value_from_path(path: str, user_data: dict):
+    return compile_value_path_template(path).evaluate(
+        flatten_autofill_data(user_data)
+    )
+
+
+def get_input_labels_by_id(original_inputs: list | None) -> dict:
+    labels_by_id = {}
+    for input in original_inputs or []:
+        # The first input with an id wins, as it did when each instruction searched the list
+        labels_by_id.setdefault(input["id"], input["label"])
+    return labels_by_id
 
 
 def map_autofill_template_to_instructions(
@@ -75,50 +185,20 @@ def map_autofill_template_to_instructions(
     user_autofill_data: dict,
     original_inputs: list = None,
 ):
-    output_instructions = []
-    instructions = autofill_template_values.autofill_instructions
-    for instruction in instructions:
-        autofill_value = None
-        if isinstance(instruction.valuePathString, str):
-            autofill_value = get_value_from_path(
-                instruction.valuePathString, user_autofill_data
-            )
-        elif isinstance(instruction.valuePathString, IfExpression):
-            expression = instruction.valuePathString
-            condition = expression.condition
-            condition_check_value = get_value_from_path(
-                condition.valuePathString, user_autofill_data
-            )
-            if condition_check_value == condition.value:
-                autofill_value = get_value_from_path(
-                    expression.truthyValuePathString, user_autofill_data
-                )
-            else:
-                autofill_value = get_value_from_path(
-                    expression.falsyValuePathString, user_autofill_data
-                )
+    """
+    Evaluates every instruction's value path against the user's data, which is flattened once
+    """
+    profile_values = flatten_autofill_data(user_autofill_data)
+    labels_by_id = get_input_labels_by_id(original_inputs)
 
-        else:
-            raise ValueError(
-                f"Unknown instruction type: {type(instruction.valuePathString)}"
-            )
-
-        # if autofill_value == None:
-        #     autofill_value = ""
-        # find text text of the input with the same input_id as the instruction
-        initial_input_text = next(
-            (
-                input["label"]
-                for input in original_inputs
-                if input["id"] == instruction.input_id
-            ),
-            None,
-        )
+    output_instructions = []
+    for instruction in autofill_template_values.autofill_instructions:
+        template = compile_instruction_value(instruction.valuePathString)
         output_instructions.append(
             {
                 "input_id": instruction.input_id,
-                "value": autofill_value,
-                "input_text": initial_input_text,
+                "value": template.evaluate(profile_values),
+                "input_text": labels_by_id.get(instruction.input_id),
             }
         )
 
@@ -0,0 +1,34 @@
+from functools import lru_cache
+
+
+# Value path keys -> value, for every node in a user's autofill data
+ProfileValues = dict[tuple[str, ...], object]
+
+
+@lru_cache(maxsize=1024)
+def compile_value_path(path: str) -> tuple[str, ...]:
+    """
+    Splits a value path like "name/first_name" into its keys, ("name", "first_name")
+    """
+    return tuple(segment for segment in path.split("/") if segment)
+
+
+def flatten_autofill_data(user_autofill_data: dict | None) -> ProfileValues:
+    """
+    Flattens the user's autofill data once so that each value path is a single dict lookup
+    Nested dicts are kept under their own path as well as being flattened, missing paths are just absent
+    """
+    profile_values: ProfileValues = {}
+    if not isinstance(user_autofill_data, dict):
+        return profile_values
+
+    pending = [((), user_autofill_data)]
+    while pending:
+        prefix, node = pending.pop()
+        for key, value in node.items():
+            keys = prefix + (str(key),)
+            profile_values[keys] = value
+            if isinstance(value, dict):
+                pending.append((keys, value))
+
+    return profile_values
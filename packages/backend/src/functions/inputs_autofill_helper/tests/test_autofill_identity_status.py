@@ -1,3 +1,4 @@
+from firebase.realtime_db import get_user_autofill_data
 from functions.inputs_autofill_helper.autofill_schema import (
     InputList,
 )
@@ -361,6 +362,36 @@ def test_identity_status_save_critical_variations() -> None:
         ), f"Failed for Veteran input: {input_value}"
 
 
+def test_veteran_select_overwrites_saved_value() -> None:
+    """Test that a select answer replaces a previously saved veteran status"""
+
+    save_inputs = [
+        create_testing_input(
+            label="",
+            wholeQuestionLabel="Are you a veteran?",
+            fieldType="select",
+            value="Protected veteran",
+        ),
+    ]
+    save_input_values(get_testing_user(), InputList(save_inputs))
+    assert get_user_autofill_data(get_testing_user())["veteran"] == "protected_veteran"
+
+    save_inputs = [
+        create_testing_input(
+            label="",
+            wholeQuestionLabel="Are you a veteran?",
+            fieldType="select",
+            value="Not a veteran",
+        ),
+    ]
+    updated_autofill_data = save_input_values(
+        get_testing_user(), InputList(save_inputs)
+    )
+
+    assert updated_autofill_data["veteran"] == "not_veteran"
+    assert get_user_autofill_data(get_testing_user())["veteran"] == "not_veteran"
+
+
 def test_identity_status_select_autofill_vectorized() -> None:
     """Test select input autofill with multiple variations at once for efficiency"""
 
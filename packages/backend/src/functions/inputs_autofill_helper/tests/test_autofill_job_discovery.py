@@ -1,3 +1,4 @@
+from firebase.realtime_db import get_user_autofill_data
 from functions.inputs_autofill_helper.autofill_schema import (
     InputList,
 )
@@ -21,9 +22,8 @@ def test_job_discovery_never_saves_data() -> None:
             value="John",
         ),
     ]
-    baseline_autofill_data = save_input_values(
-        get_testing_user(), InputList(baseline_input)
-    )
+    save_input_values(get_testing_user(), InputList(baseline_input))
+    baseline_autofill_data = get_user_autofill_data(get_testing_user())
 
     # Try to save job discovery inputs
     save_inputs = [
@@ -42,9 +42,8 @@ def test_job_discovery_never_saves_data() -> None:
     ]
 
     # Save job discovery inputs - should not change autofill data
-    updated_autofill_data = save_input_values(
-        get_testing_user(), InputList(save_inputs)
-    )
+    save_input_values(get_testing_user(), InputList(save_inputs))
+    updated_autofill_data = get_user_autofill_data(get_testing_user())
 
     # Should be identical - no job discovery data saved
     assert updated_autofill_data == baseline_autofill_data
@@ -59,9 +58,8 @@ def test_job_discovery_never_saves_data() -> None:
         ),
     ]
 
-    final_autofill_data = save_input_values(
-        get_testing_user(), InputList(select_save_inputs)
-    )
+    save_input_values(get_testing_user(), InputList(select_save_inputs))
+    final_autofill_data = get_user_autofill_data(get_testing_user())
 
     # Still should be identical - no job discovery data saved
     assert final_autofill_data == baseline_autofill_data
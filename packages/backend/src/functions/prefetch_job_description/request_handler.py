@@ -0,0 +1,45 @@
+import json
+from firebase_functions import https_fn
+from functions.validation import validate_linkedin_url
+from linkedin_fetching.prefetch import prefetch_job_description
+
+
+def validate_inputs(job_description_link: str):
+    if not job_description_link:
+        raise ValueError(
+            "Missing jobDescriptionLink in the request. Please provide a valid LinkedIn job description link."
+        )
+    if not validate_linkedin_url(job_description_link):
+        raise ValueError(
+            "Invalid LinkedIn URL. Please provide a valid LinkedIn job description link."
+        )
+
+
+def handle_prefetch_job_description_request(job_description_link: str):
+    """
+    Called by the extension when a job page is opened, before the user asks for questions
+    """
+    try:
+        validate_inputs(job_description_link)
+
+        status = prefetch_job_description(job_description_link)
+
+        return https_fn.Response(
+            json.dumps(
+                {"message": "Job description prefetch started", "status": status.value}
+            ),
+            status=200,
+        )
+
+    except ValueError as e:
+        print(f"Invalid inputs: {e}")
+        return https_fn.Response(
+            json.dumps({"message": f"Invalid inputs, {e}"}),
+            status=400,
+        )
+    except Exception as e:
+        print(f"Error prefetching job description: {e}")
+        return https_fn.Response(
+            json.dumps({"message": f"Error prefetching job description, {e}"}),
+            status=500,
+        )
@@ -1,7 +1,11 @@
-from firebase.realtime_db import get_user_autofill_data, save_user_autofill_data
+from firebase.autofill_profile_cache import autofill_profile_cache
+from firebase.realtime_db import (
+    set_user_autofill_value_if_missing,
+    update_user_autofill_values,
+)
 from functions.inputs_autofill_helper.autofill_schema import InputList, SaveInstruction
 from functions.inputs_autofill_helper.category_handlers.get_handler import (
-    get_category_handler,
+    CategoryHandlers,
 )
 from functions.inputs_autofill_helper.embeddings import get_input_classifications
 
@@ -28,60 +32,88 @@ TYPE_CONVERSION_MAP = {
 }
 
 
-def get_updated_user_autofill_data_obj(
-    prev_user_autofill_data, save_values: list[SaveInstruction]
-):
-    # Start with the previous data or an empty dict if None
-    updated_data = prev_user_autofill_data.copy() if prev_user_autofill_data else {}
+def convert_save_value(save_path: str, value):
+    # Apply type conversion if path has a converter configured
+    if save_path in TYPE_CONVERSION_MAP:
+        return TYPE_CONVERSION_MAP[save_path](value)
+    return value
+
+
+def get_changed_paths(
+    save_values: list[SaveInstruction],
+) -> tuple[dict[str, object], dict[str, object]]:
+    """
+    Collapses the save instructions into the leaf paths they change
+    Returns the paths to overwrite and the paths to write only if nothing is stored there yet
+    (dont_overwrite_existing). Later instructions win, except that a dont_overwrite_existing
+    instruction never replaces a value set earlier in the same save
+    """
+    overwrites: dict[str, object] = {}
+    writes_if_missing: dict[str, object] = {}
 
-    # Iterate through each save value
     for save_input in save_values:
         save_path = save_input["path"]
-        path_parts = save_path.split("/")
-        value = save_input["value"]
+        value = convert_save_value(save_path, save_input["value"])
+
+        if save_input.get("dont_overwrite_existing", False):
+            if save_path not in overwrites and save_path not in writes_if_missing:
+                writes_if_missing[save_path] = value
+        else:
+            overwrites[save_path] = value
+            writes_if_missing.pop(save_path, None)
 
-        # Apply type conversion if path has a converter configured
-        if save_path in TYPE_CONVERSION_MAP:
-            converter_func = TYPE_CONVERSION_MAP[save_path]
-            value = converter_func(value)
+    return overwrites, writes_if_missing
+
+
+def get_nested_values(values: dict[str, object]) -> dict:
+    """
+    Turns {"name/first_name": "John"} into {"name": {"first_name": "John"}}
+    """
+    nested = {}
+    for save_path, value in values.items():
+        path_parts = save_path.split("/")
 
         # Navigate/create the nested structure
-        current_level = updated_data
-        for i, part in enumerate(path_parts[:-1]):  # All but the last part
-            if part not in current_level:
-                current_level[part] = {}
-            elif not isinstance(current_level[part], dict):
-                # If the existing value is not a dict, replace it with a dict
+        current_level = nested
+        for part in path_parts[:-1]:  # All but the last part
+            if not isinstance(current_level.get(part), dict):
                 current_level[part] = {}
             current_level = current_level[part]
 
-        # Set the final value
         current_level[path_parts[-1]] = value
 
-    return updated_data
+    return nested
 
 
 def save_input_values(user_id: str, inputs: InputList):
-    user_autofill_data = get_user_autofill_data(user_id)
-    if not user_autofill_data:
-        user_autofill_data = {}
-
+    """
+    Saves the filled inputs without reading or rewriting the rest of the user's autofill data
+    Returns the values now stored at the saved paths, nested like the autofill data
+    """
     classified_inputs = get_input_classifications(inputs)
     print("\n classifieds", classified_inputs.model_dump_json())
 
+    # Saving only needs the input, so the handlers aren't given the user's data
+    category_handlers = CategoryHandlers({})
     save_instructions: list[SaveInstruction] = []
     for classified_input in classified_inputs:
-        category_handler = get_category_handler(
-            classified_input.category, user_autofill_data
-        )
+        category_handler = category_handlers.get(classified_input.category)
         save_instruction = category_handler.save_filled_value(classified_input)
         if not isinstance(save_instruction, list):
             save_instruction = [save_instruction]
 
         save_instructions.extend(save_instruction)
 
-    updated_data = get_updated_user_autofill_data_obj(
-        user_autofill_data, save_instructions
-    )
-    save_user_autofill_data(user_id, updated_data)
-    return updated_data
+    overwrites, writes_if_missing = get_changed_paths(save_instructions)
+
+    saved_values = dict(overwrites)
+    if overwrites:
+        update_user_autofill_values(user_id, overwrites)
+    for save_path, value in writes_if_missing.items():
+        saved_values[save_path] = set_user_autofill_value_if_missing(
+            user_id, save_path, value
+        )
+
+    if saved_values:
+        autofill_profile_cache.refresh_after_save(user_id)
+    return get_nested_values(saved_values)
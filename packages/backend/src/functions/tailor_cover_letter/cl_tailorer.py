@@ -1,17 +1,11 @@
-import os
+import io
 from LLM_tailoring.cover_letter.cover_letter_prompt import generate_cover_letter_prompt
 from LLM_tailoring.cover_letter.execute_tailoring import tailor_cover_letter_with_llm
-from constants import COVER_LETTERS_PATH
+from docx_functions.docx_writer import save_docx_to_buffer
 from docx_functions.general import get_paragraphs, load_docx
 from docx_functions.marshaling.deserialization import update_resume_section
-from docx_functions.marshaling.serialization import (
-    json_serialize_paragraphs,
-    serialize_raw_docx,
-)
-from firebase.buckets import fetch_and_download_cover_letter, fetch_and_download_resume
-from firebase_functions import https_fn
-from linkedin_fetching.fetch_job_description import fetch_job_description_markdown
-from utils import get_time_string
+from docx_functions.marshaling.serialization import json_serialize_paragraphs
+from tailoring_context import gather_tailoring_context
 
 
 def tailor_cover_letter(
@@ -19,25 +13,26 @@ def tailor_cover_letter(
     cover_letter_name: str,
     resume_name: str,
     job_description_link: str,
-) -> https_fn.Response:
+) -> io.BytesIO:
     """
     Tailor a cover letter based on the provided job description link.
+    Returns the tailored .docx as an in memory buffer
     """
-    cover_letter_path = fetch_and_download_cover_letter(user_id, cover_letter_name)
-    resume_path = fetch_and_download_resume(user_id, resume_name)
-
-    resume_rawtext = serialize_raw_docx(resume_path)
-    cover_letter_rawtext = serialize_raw_docx(cover_letter_path)
+    context = gather_tailoring_context(
+        user_id,
+        job_description_link=job_description_link,
+        resume_name=resume_name,
+        cover_letter_name=cover_letter_name,
+    )
+    cover_letter_path = context.cover_letter_path
 
     doc = load_docx(cover_letter_path)
     paragraphs = get_paragraphs(doc)
 
-    job_description = fetch_job_description_markdown(job_description_link)
-
     prompt = generate_cover_letter_prompt(
-        job_description=job_description,
-        resume_rawtext=resume_rawtext,
-        cover_letter_rawtext=cover_letter_rawtext,
+        job_description=context.job_description,
+        resume_rawtext=context.resume_markdown,
+        cover_letter_rawtext=context.cover_letter_markdown,
         paragraphs=json_serialize_paragraphs(paragraphs),
     )
     tailored_cover_letter = tailor_cover_letter_with_llm(prompt)
@@ -48,6 +43,4 @@ def tailor_cover_letter(
         new_paragraphs=tailored_cover_letter.content,
     )
 
-    save_path = f"{COVER_LETTERS_PATH}/outputs/{user_id}/{cover_letter_name}-{get_time_string()}.docx"
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    doc.save(save_path)
+    return save_docx_to_buffer(doc, cover_letter_path)
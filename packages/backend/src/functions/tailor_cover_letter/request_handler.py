@@ -1,4 +1,5 @@
 import json
+from firebase.buckets import upload_tailored_cover_letter
 from firebase_functions import https_fn
 from functions.tailor_cover_letter.cl_tailorer import tailor_cover_letter
 from functions.validation import validate_file_name_and_userId, validate_linkedin_url
@@ -52,17 +53,21 @@ def handle_cover_letter_tailor_request(
             job_description_link=job_description_link,
         )
 
-        tailor_cover_letter(
+        cover_letter_buffer = tailor_cover_letter(
             user_id=user_id,
             cover_letter_name=cover_letter_name,
             resume_name=resume_name,
             job_description_link=job_description_link,
         )
+        download_url = upload_tailored_cover_letter(
+            cover_letter_buffer, user_id, cover_letter_name[:-5]
+        )
 
         return https_fn.Response(
             json.dumps(
                 {
-                    "message": "Hello world!",
+                    "message": "Tailored cover letter uploaded to firebase",
+                    "docx_download_url": download_url,
                 }
             ),
             status=200,
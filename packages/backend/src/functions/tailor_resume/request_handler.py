@@ -1,14 +1,29 @@
+import io
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from LLM_tailoring.resume.schema import AnsweredResumeTailoringQuestions
-from docx_to_pdf import convert_docx_to_pdf
-from firebase.buckets import upload_tailored_resume
+from firebase.buckets import (
+    get_signed_download_url,
+    get_tailored_resume_blob_path,
+    upload_resume_to_blob_path,
+)
 from functions.tailor_resume.tailorer import tailor_resume
 from functions.validation import (
     validate_file_name_and_userId,
 )
+from pdf_cache import get_or_convert_pdf_url
+from pdf_conversion_jobs import start_pdf_conversion
 
 from firebase_functions import https_fn
 from pydantic import ValidationError
+from utils import run_stages_concurrently
+
+
+# Bounds the response stage threads across concurrent requests, each request uses three
+RESPONSE_STAGE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=6, thread_name_prefix="tailor-response"
+)
 
 
 def validate_inputs(
@@ -41,12 +56,53 @@ def validate_inputs(
         raise ValueError(f"Validation failed for questionAnswers: {e.errors()}")
 
 
+def run_response_stages(
+    resume_bytes: bytes, user_id: str, file_name: str, async_pdf: bool
+) -> tuple[dict, dict[str, float]]:
+    """
+    Converts the PDF, uploads the DOCX and signs its download url concurrently,
+    so the response waits on the slowest of them rather than their sum
+    Returns the response fields and each stage's duration in ms
+    """
+    blob_path = get_tailored_resume_blob_path(user_id, file_name[:-5], ".docx")
+
+    convert_pdf = start_pdf_conversion if async_pdf else get_or_convert_pdf_url
+
+    start = time.perf_counter()
+    results, timings = run_stages_concurrently(
+        RESPONSE_STAGE_EXECUTOR,
+        # Every stage reads its own buffer, they can't share a file position
+        {
+            "pdf": lambda: convert_pdf(io.BytesIO(resume_bytes)),
+            "upload": lambda: upload_resume_to_blob_path(
+                io.BytesIO(resume_bytes), user_id, blob_path, public=True
+            ),
+            "signing": lambda: get_signed_download_url(blob_path),
+        },
+    )
+    timings["total"] = time.perf_counter() - start
+    stage_timings = {stage: round(seconds * 1000) for stage, seconds in timings.items()}
+    print("Tailor response stage timings (ms)", stage_timings)
+
+    response_fields = {
+        "docx_download_url": results["signing"],
+        "public_url": results["upload"],
+        "pdf_job_id" if async_pdf else "pdf_url": results["pdf"],
+    }
+    return response_fields, stage_timings
+
+
 def handle_resume_tailor_request(
-    user_id: str, file_name: str, chat_id: str, question_answers: str
+    user_id: str,
+    file_name: str,
+    chat_id: str,
+    question_answers: str,
+    async_pdf: bool = False,
 ):
     """
     This is only called after the questions request has been made, thus it has a chat to pull in the chat
     History object with the context of the resume, and job description
+    With async_pdf the PDF is converted in the background and the response carries its job id instead
     """
     try:
         validate_inputs(
@@ -58,26 +114,23 @@ def handle_resume_tailor_request(
 
         question_responses = json.loads(question_answers)
         question_responses = AnsweredResumeTailoringQuestions(**question_responses)
-        resume_path = tailor_resume(
+        resume_buffer = tailor_resume(
             user_id=user_id,
             resume_name=file_name,
             chat_id=chat_id,
             question_responses=question_responses,
         )
 
-        pdf_url = convert_docx_to_pdf(resume_path)
-
-        docx_download_url, public_url = upload_tailored_resume(
-            resume_path, user_id, file_name[:-5], extension=".docx", public=True
+        response_fields, stage_timings = run_response_stages(
+            resume_buffer.getvalue(), user_id, file_name, async_pdf
         )
 
         return https_fn.Response(
             json.dumps(
                 {
                     "message": "Tailored resume uploaded to firebase",
-                    "docx_download_url": docx_download_url,
-                    "public_url": public_url,
-                    "pdf_url": pdf_url,
+                    **response_fields,
+                    "stage_timings_ms": stage_timings,
                 }
             ),
             status=200,
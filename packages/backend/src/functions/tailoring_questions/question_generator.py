@@ -1,18 +1,16 @@
 from LLM_tailoring.resume.execute_tailoring import generate_questions_with_llm
 from LLM_tailoring.resume.resume_prompt import generate_questions_llm_prompt
-from firebase.buckets import fetch_and_download_resume
-from linkedin_fetching.fetch_job_description import fetch_job_description_markdown
-from docx_functions.marshaling.serialization import serialize_raw_docx
+from tailoring_context import gather_tailoring_context
 
 
 def get_tailoring_questions(user_id: str, resume_name: str, linkedin_url: str):
-    job_description = fetch_job_description_markdown(linkedin_url)
-    resume_path = fetch_and_download_resume(user_id, resume_name)
+    context = gather_tailoring_context(
+        user_id, job_description_link=linkedin_url, resume_name=resume_name
+    )
 
-    raw_resume_string = serialize_raw_docx(resume_path)
     questions_prompt = generate_questions_llm_prompt(
-        job_description=job_description,
-        resume=raw_resume_string,
+        job_description=context.job_description,
+        resume=context.resume_markdown,
     )
 
     questions_object, chat_history = generate_questions_with_llm(questions_prompt)
@@ -1,10 +1,7 @@
-import os
 import random
-from typing import Dict
 
-from constants import PROXY_URL
 from errors.data_fetching_errors import LinkedinError
-import requests
+from linkedin_fetching.http_client import get_http_client
 
 
 USER_AGENTS = [
@@ -49,16 +46,6 @@ USER_AGENTS = [
 ]
 
 
-def get_proxies() -> Dict:
-    if (PROXY_URL is None) or (PROXY_URL == ""):
-        return {}
-
-    return {
-        "http": PROXY_URL,
-        "https": PROXY_URL,
-    }
-
-
 def fetch_job_html(url: str) -> str:
     headers = {
         "User-Agent": random.choice(USER_AGENTS),
@@ -70,18 +57,16 @@ def fetch_job_html(url: str) -> str:
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     }
 
-    try:
-        proxies = get_proxies()
-        resp = requests.get(url, headers=headers, proxies=proxies)
-        resp.raise_for_status()
-    except requests.HTTPError as e:
-        if resp.status_code == 403 or resp.status_code == 429:
-            raise LinkedinError(
-                f"Status {resp.status_code}: LinkedIn may have blocked the request."
-            )
-        elif resp.status_code == 404:
-            raise LinkedinError("404 Not Found: The job listing may no longer exist.")
-        else:
-            raise RuntimeError(f"HTTP error: {e}")
+    # Transient failures (429/5xx, connection errors) are retried by the client
+    resp = get_http_client().get(url, headers=headers)
+
+    if resp.status_code == 403 or resp.status_code == 429:
+        raise LinkedinError(
+            f"Status {resp.status_code}: LinkedIn may have blocked the request."
+        )
+    elif resp.status_code == 404:
+        raise LinkedinError("404 Not Found: The job listing may no longer exist.")
+    elif not resp.ok:
+        raise RuntimeError(f"HTTP error: {resp.status_code} {resp.reason}")
 
     return resp.text
@@ -1,20 +1,152 @@
+from constants import LINKEDIN_BASE_URL
 from errors.data_fetching_errors import DescriptionNotFound, LinkedinError
 from linkedin_fetching.fetch_html import fetch_job_html
+from linkedin_fetching.job_description_cache import job_description_cache
 
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from typing import List, Tuple
 
 import re
 from urllib.parse import parse_qs, urlparse
 
 
+DESCRIPTION_CONTAINER_CLASS = "show-more-less-html__markup"
+DESCRIPTION_CONTAINER_OPEN_TAG = re.compile(
+    r"<div\b[^>]*\bclass\s*=\s*[\"'][^\"']*\b"
+    + DESCRIPTION_CONTAINER_CLASS
+    + r"\b[^\"']*[\"'][^>]*>",
+    re.IGNORECASE,
+)
+DIV_TAG = re.compile(r"<(/?)div\b[^>]*>", re.IGNORECASE)
+TAG = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)\b[^>]*?(/?)>")
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+def find_description_fragment(html: str) -> str | None:
+    """
+    Slices the description container's markup out of the page without parsing the page,
+    by matching its opening tag and counting nested divs to its closing tag
+    """
+    open_tag = DESCRIPTION_CONTAINER_OPEN_TAG.search(html)
+    if not open_tag:
+        return None
+
+    depth = 1
+    for tag in DIV_TAG.finditer(html, open_tag.end()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return html[open_tag.start() : tag.end()]
+    return None
+
+
+def get_element_text(el, separator: str) -> str:
+    """
+    Same as BeautifulSoup's get_text(strip=True, separator=separator)
+    """
+    strings = el.xpath(".//text()")
+    stripped = (string.strip() for string in strings)
+    return separator.join(string for string in stripped if string)
+
+
+def get_written_tags(fragment: str) -> List[Tuple[str, str]]:
+    """
+    The (event, tag) sequence of the fragment's tags as they are written, ignoring void tags
+    """
+    tags = []
+    for tag in TAG.finditer(fragment):
+        closing, name, self_closing = tag.groups()
+        name = name.lower()
+        if name in VOID_TAGS or self_closing:
+            continue
+        tags.append(("end" if closing else "start", name))
+    return tags
+
+
+def get_parsed_tags(markup) -> List[Tuple[str, str]]:
+    """
+    The (event, tag) sequence of an lxml tree, ignoring void tags and comments
+    """
+    return [
+        (event, el.tag)
+        for event, el in etree.iterwalk(markup, events=("start", "end"))
+        if isinstance(el.tag, str) and el.tag not in VOID_TAGS
+    ]
+
+
+def parse_job_description_fragment(fragment: str) -> List[Tuple[str, str]]:
+    """
+    Fast path for parse_job_description, parses only the description fragment with lxml
+
+    lxml closes tags the HTML spec says are implied (a <p> at a following <ul> or <p>), where
+    BeautifulSoup's html.parser keeps the markup's nesting as written, so the text of each block differs.
+    Fragments lxml had to restructure are parsed with BeautifulSoup instead
+    """
+    markup = lxml_html.fragment_fromstring(fragment)
+    if get_parsed_tags(markup) != get_written_tags(fragment):
+        return parse_job_description_with_soup(fragment)
+
+    blocks: List[Tuple[str, str]] = []
+    for el in markup.iter("p", "li", "strong"):
+        text = get_element_text(el, " ")
+        if not text:
+            continue
+
+        if el.tag == "strong" and text.endswith(":"):
+            blocks.append(("heading", text))
+
+        elif el.tag == "li":
+            blocks.append(("bullet", text))
+
+        elif el.tag == "p":
+            inner_strong = el.find(".//strong")
+            if inner_strong is not None and get_element_text(
+                inner_strong, ""
+            ).endswith(":"):
+                continue
+            blocks.append(("paragraph", text))
+
+    return blocks
+
+
 def parse_job_description(html: str) -> List[Tuple[str, str]]:
     """
     Returns a list of (kind, text) tuples in the order they appear:
       - kind == 'paragraph'
       - kind == 'bullet'
       - kind == 'heading'
+    The description fragment is sliced out and parsed with lxml, falling back to
+    parsing the whole page with BeautifulSoup if the fragment can't be found or parsed
     """
+    fragment = find_description_fragment(html)
+    if fragment is not None:
+        try:
+            return parse_job_description_fragment(fragment)
+        except (etree.ParserError, ValueError) as e:
+            print(f"Warning: Fast job description parse failed, falling back: {e}")
+
+    return parse_job_description_with_soup(html)
+
+
+def parse_job_description_with_soup(html: str) -> List[Tuple[str, str]]:
     soup = BeautifulSoup(html, "html.parser")
     markup = soup.select_one("div.show-more-less-html__markup")
     if not markup:
@@ -72,20 +204,31 @@ def extract_linkedin_job_id(url: str) -> str | None:
 def get_canonical_linkedin_job_url(url: str) -> str | None:
     job_id = extract_linkedin_job_id(url)
     if job_id:
-        return f"https://www.linkedin.com/jobs/view/{job_id}/"
+        return f"{LINKEDIN_BASE_URL}/jobs/view/{job_id}/"
     return None
 
 
+def fetch_and_parse_job_description(canonical_url: str) -> str:
+    html = fetch_job_html(canonical_url)
+    blocks = parse_job_description(html)
+    return to_markdown(blocks)
+
+
 def fetch_job_description_markdown(url: str) -> str:
-    canonical_url = get_canonical_linkedin_job_url(url)
-    if not canonical_url:
+    """
+    Returns the job description as markdown, cached by LinkedIn job id
+    so the questions, cover letter and free response requests for one job share a fetch
+    """
+    job_id = extract_linkedin_job_id(url)
+    if not job_id:
         raise LinkedinError(
             "Could not extract job ID from LinkedIn URL. Please provide a valid job link."
         )
 
-    html = fetch_job_html(canonical_url)
-    blocks = parse_job_description(html)
-    return to_markdown(blocks)
+    canonical_url = get_canonical_linkedin_job_url(url)
+    return job_description_cache.get_or_fetch(
+        job_id, lambda: fetch_and_parse_job_description(canonical_url)
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+import itertools
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants import PROXY_URLS
+
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8
+# (connect, read)
+TIMEOUT_SECONDS = (5, 15)
+MAX_CONCURRENT_REQUESTS_PER_HOST = 4
+
+
+class PooledHttpClient:
+    """
+    Shared keep-alive session for scraping requests
+
+    Connections (and the TLS handshakes through the proxy) are reused between requests.
+    429 and 5xx responses and connection errors are retried with exponential backoff and full
+    jitter, each attempt going out through the next proxy in the rotation. Concurrent requests
+    to one host are capped so a burst of users doesn't look like a burst to the host.
+    """
+
+    def __init__(
+        self,
+        proxy_urls: list[str] | None = None,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff_base_seconds: float = BACKOFF_BASE_SECONDS,
+        timeout=TIMEOUT_SECONDS,
+        max_concurrent_per_host: int = MAX_CONCURRENT_REQUESTS_PER_HOST,
+    ):
+        self.session = requests.Session()
+        # Retries are handled here rather than by urllib3 so they can switch proxies
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.proxies = itertools.cycle(proxy_urls or [None])
+        self.proxies_lock = threading.Lock()
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.timeout = timeout
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self.host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self.host_limits_lock = threading.Lock()
+
+    def next_proxies(self) -> dict:
+        with self.proxies_lock:
+            proxy_url = next(self.proxies)
+        if proxy_url is None:
+            return {}
+        return {"http": proxy_url, "https": proxy_url}
+
+    def get_host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self.host_limits_lock:
+            return self.host_limits.setdefault(
+                host, threading.BoundedSemaphore(self.max_concurrent_per_host)
+            )
+
+    def get_backoff_seconds(self, attempt: int, response: requests.Response | None):
+        """
+        Full jitter backoff, a Retry-After header (in seconds) is respected if it is longer
+        """
+        cap = min(BACKOFF_MAX_SECONDS, self.backoff_base_seconds * 2**attempt)
+        backoff = random.uniform(0, cap)
+
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            backoff = max(backoff, min(int(retry_after), BACKOFF_MAX_SECONDS))
+        return backoff
+
+    def get(self, url: str, headers: dict | None = None) -> requests.Response:
+        """
+        GETs the url, retrying transient failures
+        Returns the last response, which may still be an error status once retries run out
+        """
+        with self.get_host_limit(url):
+            for attempt in range(self.max_attempts):
+                is_last_attempt = attempt == self.max_attempts - 1
+                response = None
+                try:
+                    response = self.session.get(
+                        url,
+                        headers=headers,
+                        proxies=self.next_proxies(),
+                        timeout=self.timeout,
+                    )
+                    if response.status_code not in RETRY_STATUS_CODES or is_last_attempt:
+                        return response
+                    print(f"Retrying {url} after status {response.status_code}")
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if is_last_attempt:
+                        raise
+                    print(f"Retrying {url} after {type(e).__name__}: {e}")
+
+                time.sleep(self.get_backoff_seconds(attempt, response))
+
+
+_client: PooledHttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHttpClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = PooledHttpClient(proxy_urls=PROXY_URLS)
+        return _client
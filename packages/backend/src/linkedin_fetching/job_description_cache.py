@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from firebase.realtime_db import cache_get_object, cache_set_object
+from utils import SingleFlight
+
+
+JOB_DESCRIPTION_TTL_SECONDS = 6 * 60 * 60
+MAX_MEMORY_ENTRIES = 256
+
+
+def get_job_description_cache_id(job_id: str) -> str:
+    return f"job_description_{job_id}"
+
+
+class JobDescriptionCache:
+    """
+    Parsed job descriptions keyed by LinkedIn job id, in two tiers:
+    process memory (LRU) in front of the shared realtime db cache
+    Concurrent misses for the same job collapse into a single fetch
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = JOB_DESCRIPTION_TTL_SECONDS,
+        max_memory_entries: int = MAX_MEMORY_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        # job id -> (fetched at, markdown)
+        self.memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.fetches = SingleFlight()
+
+    def is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl_seconds
+
+    def get_from_memory(self, job_id: str) -> str | None:
+        with self.lock:
+            entry = self.memory.get(job_id)
+            if entry is None:
+                return None
+            if not self.is_fresh(entry[0]):
+                del self.memory[job_id]
+                return None
+            self.memory.move_to_end(job_id)
+            return entry[1]
+
+    def set_in_memory(self, job_id: str, fetched_at: float, markdown: str):
+        with self.lock:
+            self.memory[job_id] = (fetched_at, markdown)
+            self.memory.move_to_end(job_id)
+            while len(self.memory) > self.max_memory_entries:
+                self.memory.popitem(last=False)
+
+    def get_from_shared_cache(self, job_id: str) -> tuple[float, str] | None:
+        try:
+            entry = cache_get_object(get_job_description_cache_id(job_id))
+        except ValueError:
+            return None
+        except Exception as e:
+            print(f"Warning: Failed to read cached job description: {e}")
+            return None
+
+        if not self.is_fresh(entry["fetched_at"]):
+            return None
+        return entry["fetched_at"], entry["markdown"]
+
+    def set_in_shared_cache(self, job_id: str, fetched_at: float, markdown: str):
+        try:
+            cache_set_object(
+                get_job_description_cache_id(job_id),
+                {"fetched_at": fetched_at, "markdown": markdown},
+                int(self.ttl_seconds),
+            )
+        except Exception as e:
+            print(f"Warning: Failed to cache job description: {e}")
+
+    def load(self, job_id: str, fetch: Callable[[], str]) -> str:
+        shared_entry = self.get_from_shared_cache(job_id)
+        if shared_entry is not None:
+            self.set_in_memory(job_id, *shared_entry)
+            return shared_entry[1]
+
+        print("Job description cache miss - fetching", job_id)
+        markdown = fetch()
+        fetched_at = time.time()
+        self.set_in_memory(job_id, fetched_at, markdown)
+        self.set_in_shared_cache(job_id, fetched_at, markdown)
+        return markdown
+
+    def get_or_fetch(self, job_id: str, fetch: Callable[[], str]) -> str:
+        """
+        Returns the cached job description, calling fetch only if no tier has a fresh copy
+        Fetch errors aren't cached
+        """
+        markdown = self.get_from_memory(job_id)
+        if markdown is not None:
+            return markdown
+
+        return self.fetches.do(job_id, lambda: self.load(job_id, fetch))
+
+
+job_description_cache = JobDescriptionCache()
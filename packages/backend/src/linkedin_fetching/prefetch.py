@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from enum import Enum
+
+from linkedin_fetching.fetch_job_description import fetch_job_description_markdown
+
+
+# Bounded so a page full of job links opened at once can't starve the instance
+PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="job-prefetch")
+# Long enough for a normal fetch, so the request keeps the instance's CPU while it runs
+PREFETCH_WAIT_SECONDS = 10
+
+
+class PrefetchStatus(Enum):
+    CACHED = "cached"
+    PENDING = "pending"
+
+
+def prefetch_job_description(
+    url: str, wait_seconds: float = PREFETCH_WAIT_SECONDS
+) -> PrefetchStatus:
+    """
+    Fetches and parses the job description in the background, priming the job description cache
+    so a later request for the same job skips the LinkedIn fetch
+    Waits up to wait_seconds for the fetch, a request that arrives while it is still running
+    joins it rather than fetching again
+    Fetch errors within the wait are raised, later ones are only logged
+    """
+    future = PREFETCH_EXECUTOR.submit(fetch_job_description_markdown, url)
+    future.add_done_callback(log_prefetch_error)
+
+    try:
+        future.result(timeout=wait_seconds)
+    except TimeoutError:
+        return PrefetchStatus.PENDING
+    return PrefetchStatus.CACHED
+
+
+def log_prefetch_error(future):
+    if future.exception() is not None:
+        print(f"Job description prefetch failed: {future.exception()}")
@@ -0,0 +1,52 @@
+from io import IOBase
+from typing import Union
+
+from firebase.buckets import get_cached_pdf_url, upload_pdf_to_cache
+from pdf_converters.get_converter import get_pdf_converter
+from utils import SingleFlight, get_file_sha256, get_stream_sha256
+
+
+# Conversions running in this instance, keyed by docx hash
+_conversions = SingleFlight()
+
+
+def get_docx_hash(docx_input: Union[str, IOBase]) -> str:
+    if isinstance(docx_input, str):
+        return get_file_sha256(docx_input)
+    return get_stream_sha256(docx_input)
+
+
+def convert_and_cache_pdf(docx_input: Union[str, IOBase], docx_hash: str) -> str:
+    converted = get_pdf_converter().convert(docx_input)
+    try:
+        cached_pdf_url = upload_pdf_to_cache(
+            converted.data if converted.data is not None else converted.url, docx_hash
+        )
+        print(f"PDF cached successfully: {cached_pdf_url}")
+        return cached_pdf_url
+    except Exception as cache_error:
+        # Local converters have no URL to fall back on, so the error is raised
+        if converted.url is None:
+            raise
+        # The conversion's own URL still works, it just isn't cached
+        print(f"Warning: Failed to cache PDF: {str(cache_error)}")
+        return converted.url
+
+
+def get_or_convert_pdf_url(docx_input: Union[str, IOBase]) -> str:
+    """
+    Returns a URL to the PDF of the DOCX, converting it only if the same bytes haven't been
+    converted before (by any user or endpoint)
+    Concurrent requests for the same DOCX in this instance share a single conversion
+    """
+    docx_hash = get_docx_hash(docx_input)
+
+    cached_pdf_url = get_cached_pdf_url(docx_hash)
+    if cached_pdf_url:
+        print("PDF cache hit", docx_hash)
+        return cached_pdf_url
+
+    print("PDF cache miss - converting file", docx_hash)
+    return _conversions.do(
+        docx_hash, lambda: convert_and_cache_pdf(docx_input, docx_hash)
+    )
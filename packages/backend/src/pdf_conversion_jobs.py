@@ -0,0 +1,137 @@
+import io
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+from firebase.object_cache import get_expiry_string, sweep_expired_entries
+from firebase.realtime_db import (
+    PDF_CONVERSION_JOBS_PATH,
+    get_pdf_conversion_job,
+    set_pdf_conversion_job,
+)
+from pdf_cache import get_or_convert_pdf_url
+from pdf_converters.base_converter import DocxInput, read_docx_bytes
+from utils import generate_uuid
+
+
+MAX_WAIT_SECONDS = 25
+POLL_INTERVAL_SECONDS = 0.5
+# A pending job that hasn't finished in this long was lost with the instance running it, well past
+# a LibreOffice conversion (queue wait plus timeout) or a CloudConvert job
+STALE_PENDING_SECONDS = 300
+# How long finished jobs are kept for late pollers before the hourly sweep deletes them
+JOB_RETENTION_SECONDS = 3600
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pdf-conversion")
+# Jobs started by this instance, so their pollers are woken as soon as they finish
+_local_jobs: dict[str, Future] = {}
+_local_jobs_lock = threading.Lock()
+
+
+class ConversionStatus(Enum):
+    PENDING = "pending"
+    DONE = "done"
+    ERROR = "error"
+
+
+def save_job(job_id: str, job: dict, keep_seconds: float) -> dict:
+    now = datetime.now(timezone.utc)
+    job["updatedAt"] = now.isoformat()
+    job["expiresAt"] = get_expiry_string(now + timedelta(seconds=keep_seconds))
+    set_pdf_conversion_job(job_id, job)
+    return job
+
+
+def run_conversion(job_id: str, docx_bytes: bytes) -> dict:
+    try:
+        pdf_url = get_or_convert_pdf_url(io.BytesIO(docx_bytes))
+        job = {"status": ConversionStatus.DONE.value, "pdf_url": pdf_url}
+    except Exception as e:
+        print(f"PDF conversion job {job_id} failed: {e}")
+        job = {"status": ConversionStatus.ERROR.value, "message": str(e)}
+
+    return save_job(job_id, job, JOB_RETENTION_SECONDS)
+
+
+def is_stale_pending_job(job: dict) -> bool:
+    if job.get("status") != ConversionStatus.PENDING.value or "updatedAt" not in job:
+        return False
+    updated_at = datetime.fromisoformat(job["updatedAt"])
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    age = datetime.now(timezone.utc) - updated_at
+    return age.total_seconds() > STALE_PENDING_SECONDS
+
+
+def get_reported_job(job: dict | None) -> dict | None:
+    """
+    The job as pollers should see it, a job stuck pending is reported as failed
+    """
+    if job is None or not is_stale_pending_job(job):
+        return job
+    return {
+        "status": ConversionStatus.ERROR.value,
+        "message": "PDF conversion did not finish, the instance running it was likely stopped",
+        "updatedAt": job["updatedAt"],
+    }
+
+
+def forget_local_job(job_id: str):
+    with _local_jobs_lock:
+        _local_jobs.pop(job_id, None)
+
+
+def start_pdf_conversion(docx_input: DocxInput) -> str:
+    """
+    Starts converting the DOCX to PDF in the background and returns the job id
+    The DOCX is read up front, as request files are closed once the response is sent
+    Job status is stored in the realtime db so any instance can report it
+    """
+    job_id = generate_uuid()
+    docx_bytes = read_docx_bytes(docx_input)
+    # Kept until a stuck job has been reported as failed for as long as a finished one would be
+    save_job(
+        job_id,
+        {"status": ConversionStatus.PENDING.value},
+        STALE_PENDING_SECONDS + JOB_RETENTION_SECONDS,
+    )
+
+    conversion = _executor.submit(run_conversion, job_id, docx_bytes)
+    with _local_jobs_lock:
+        _local_jobs[job_id] = conversion
+    # Late pollers read the realtime db, so the local handle is only kept while running
+    conversion.add_done_callback(lambda _: forget_local_job(job_id))
+
+    return job_id
+
+
+def get_pdf_conversion_status(job_id: str, wait_seconds: float = 0) -> dict | None:
+    """
+    Returns the job's status, waiting up to wait_seconds (long poll) for a pending job to finish
+    Returns None for unknown job ids, pending jobs older than STALE_PENDING_SECONDS are reported as errors
+    """
+    wait_seconds = min(max(wait_seconds, 0), MAX_WAIT_SECONDS)
+
+    with _local_jobs_lock:
+        conversion = _local_jobs.get(job_id)
+    if conversion is not None:
+        try:
+            return conversion.result(timeout=wait_seconds)
+        except FutureTimeoutError:
+            return {"status": ConversionStatus.PENDING.value}
+
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        job = get_reported_job(get_pdf_conversion_job(job_id))
+        if job is None or job.get("status") != ConversionStatus.PENDING.value:
+            return job
+        if time.monotonic() + POLL_INTERVAL_SECONDS > deadline:
+            return job
+        time.sleep(POLL_INTERVAL_SECONDS)
+
+
+def sweep_expired_pdf_conversion_jobs() -> int:
+    return sweep_expired_entries(PDF_CONVERSION_JOBS_PATH)
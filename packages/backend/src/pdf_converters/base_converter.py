@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from io import IOBase
+from typing import Union
+
+
+DocxInput = Union[str, IOBase]
+
+
+class ConvertedPdf:
+    """
+    Result of a conversion, local converters return the PDF bytes
+    while remote converters return a URL the PDF can be downloaded from
+    """
+
+    __slots__ = ("data", "url")
+
+    def __init__(self, data: bytes | None = None, url: str | None = None):
+        if data is None and url is None:
+            raise ValueError("A converted PDF needs either its data or a URL")
+        self.data = data
+        self.url = url
+
+
+class PdfConverter(ABC):
+    @abstractmethod
+    def convert(self, docx_input: DocxInput) -> ConvertedPdf:
+        """
+        Converts a DOCX (file path or file object) to PDF
+        """
+        pass
+
+
+def read_docx_bytes(docx_input: DocxInput) -> bytes:
+    if isinstance(docx_input, str):
+        with open(docx_input, "rb") as f:
+            return f.read()
+
+    docx_input.seek(0)
+    docx_bytes = docx_input.read()
+    docx_input.seek(0)
+    return docx_bytes
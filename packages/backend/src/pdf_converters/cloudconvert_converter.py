@@ -0,0 +1,10 @@
+from typing import override
+
+from docx_to_pdf import convert_docx_to_pdf
+from pdf_converters.base_converter import ConvertedPdf, DocxInput, PdfConverter
+
+
+class CloudConvertConverter(PdfConverter):
+    @override
+    def convert(self, docx_input: DocxInput) -> ConvertedPdf:
+        return ConvertedPdf(url=convert_docx_to_pdf(docx_input))
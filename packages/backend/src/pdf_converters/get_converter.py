@@ -0,0 +1,45 @@
+import threading
+
+from constants import (
+    LIBREOFFICE_POOL_SIZE,
+    LIBREOFFICE_QUEUE_TIMEOUT_SECONDS,
+    LIBREOFFICE_TIMEOUT_SECONDS,
+    PDF_CONVERTER,
+    SOFFICE_PATH,
+    UNOSERVER_PATH,
+)
+from pdf_converters.base_converter import PdfConverter
+from pdf_converters.cloudconvert_converter import CloudConvertConverter
+from pdf_converters.libreoffice_converter import LibreOfficeConverter
+
+
+_converter: PdfConverter | None = None
+_converter_lock = threading.Lock()
+
+
+def create_pdf_converter(name: str) -> PdfConverter:
+    match name:
+        case "cloudconvert":
+            return CloudConvertConverter()
+        case "libreoffice":
+            return LibreOfficeConverter(
+                soffice_path=SOFFICE_PATH,
+                unoserver_path=UNOSERVER_PATH,
+                pool_size=LIBREOFFICE_POOL_SIZE,
+                timeout_seconds=LIBREOFFICE_TIMEOUT_SECONDS,
+                queue_timeout_seconds=LIBREOFFICE_QUEUE_TIMEOUT_SECONDS,
+            )
+        case _:
+            raise ValueError(f"Unknown PDF_CONVERTER: {name}")
+
+
+def get_pdf_converter() -> PdfConverter:
+    """
+    Returns the converter selected by the PDF_CONVERTER env var, shared across requests
+    so the LibreOffice pool stays warm
+    """
+    global _converter
+    with _converter_lock:
+        if _converter is None:
+            _converter = create_pdf_converter(PDF_CONVERTER)
+        return _converter
@@ -0,0 +1,266 @@
+import atexit
+import io
+import os
+import queue
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import xmlrpc.client
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import override
+
+from docx import Document
+
+from pdf_converters.base_converter import (
+    ConvertedPdf,
+    DocxInput,
+    PdfConverter,
+    read_docx_bytes,
+)
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TimeoutTransport(xmlrpc.client.Transport):
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        return connection
+
+
+class LibreOfficeListener:
+    """
+    One resident soffice, started through unoserver and listening on UNO, that documents are
+    converted through over unoserver's XML-RPC API instead of starting soffice per conversion
+    """
+
+    def __init__(
+        self,
+        unoserver_path: str,
+        soffice_path: str,
+        profile_dir: str,
+        timeout_seconds: float,
+        startup_timeout_seconds: float,
+    ):
+        self.unoserver_path = unoserver_path
+        self.soffice_path = soffice_path
+        self.profile_dir = profile_dir
+        self.timeout_seconds = timeout_seconds
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self.process: subprocess.Popen | None = None
+        self.port: int | None = None
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def get_proxy(self, timeout: float) -> xmlrpc.client.ServerProxy:
+        return xmlrpc.client.ServerProxy(
+            f"http://127.0.0.1:{self.port}",
+            transport=TimeoutTransport(timeout),
+            allow_none=True,
+        )
+
+    def start(self):
+        """
+        Starts unoserver (which starts soffice) and waits until it answers requests
+        """
+        self.stop()
+        self.port = get_free_port()
+        command = [
+            self.unoserver_path,
+            "--interface",
+            "127.0.0.1",
+            "--port",
+            str(self.port),
+            "--uno-port",
+            str(get_free_port()),
+            "--executable",
+            self.soffice_path,
+            "--user-installation",
+            Path(self.profile_dir).resolve().as_uri(),
+            "--conversion-timeout",
+            str(max(1, int(self.timeout_seconds))),
+        ]
+        # unoserver forks soffice.bin, a new session lets stop() kill both
+        self.process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        deadline = time.monotonic() + self.startup_timeout_seconds
+        while time.monotonic() < deadline:
+            if not self.is_running():
+                raise RuntimeError(
+                    f"LibreOffice listener exited on startup ({self.process.returncode})"
+                )
+            try:
+                self.get_proxy(timeout=1).info()
+                return
+            except (OSError, xmlrpc.client.ProtocolError):
+                time.sleep(0.1)
+
+        self.stop()
+        raise RuntimeError(
+            f"LibreOffice listener didn't start within {self.startup_timeout_seconds}s"
+        )
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            # The listener already exited
+            pass
+        self.process.wait()
+        self.process = None
+
+    def convert(self, docx_bytes: bytes) -> bytes:
+        """
+        Converts through the listener, restarting it first if it has exited
+        """
+        if not self.is_running():
+            self.start()
+
+        try:
+            pdf = self.get_proxy(self.timeout_seconds).convert(
+                None, xmlrpc.client.Binary(docx_bytes), None, "pdf"
+            )
+        except TimeoutError:
+            # A conversion stuck in soffice would block every later job on this listener
+            self.stop()
+            raise RuntimeError(
+                f"LibreOffice conversion timed out after {self.timeout_seconds}s"
+            )
+        except xmlrpc.client.Fault as e:
+            raise RuntimeError(f"LibreOffice conversion failed: {e.faultString}")
+        except (OSError, xmlrpc.client.ProtocolError) as e:
+            # The listener died mid conversion, the next job starts a new one
+            self.stop()
+            raise RuntimeError(f"LibreOffice listener failed: {e}")
+
+        return pdf.data
+
+
+class LibreOfficeConverter(PdfConverter):
+    """
+    Converts documents with a pool of warm, resident headless LibreOffice processes
+
+    Jobs are queued and picked up by pool_size worker threads. Each worker keeps one soffice
+    running behind unoserver, with its own user profile, and converts every job through it, so
+    conversions skip soffice's startup. Listeners are started and warmed up with a throwaway
+    conversion when the pool starts, and restarted when they exit. A conversion running past
+    timeout_seconds kills its listener. Callers give up after queue_timeout_seconds waiting for
+    a worker plus timeout_seconds for the conversion.
+    """
+
+    def __init__(
+        self,
+        soffice_path: str = "soffice",
+        pool_size: int = 2,
+        timeout_seconds: float = 30,
+        profile_root: str | None = None,
+        queue_timeout_seconds: float = 60,
+        unoserver_path: str = "unoserver",
+        startup_timeout_seconds: float = 60,
+    ):
+        self.soffice_path = soffice_path
+        self.unoserver_path = unoserver_path
+        self.pool_size = pool_size
+        self.timeout_seconds = timeout_seconds
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self.profile_root = profile_root or os.path.join(
+            tempfile.gettempdir(), "libreoffice_profiles"
+        )
+        self.jobs: queue.Queue[tuple[bytes, Future]] = queue.Queue()
+        self.workers: list[threading.Thread] = []
+        self.listeners: list[LibreOfficeListener] = []
+        self.start_lock = threading.Lock()
+
+    def start(self):
+        """
+        Starts the worker pool, called on the first conversion if not called earlier
+        """
+        with self.start_lock:
+            if self.workers:
+                return
+            for idx in range(self.pool_size):
+                listener = LibreOfficeListener(
+                    unoserver_path=self.unoserver_path,
+                    soffice_path=self.soffice_path,
+                    profile_dir=os.path.join(self.profile_root, f"worker_{idx}"),
+                    timeout_seconds=self.timeout_seconds,
+                    startup_timeout_seconds=self.startup_timeout_seconds,
+                )
+                worker = threading.Thread(
+                    target=self.run_worker,
+                    args=(listener,),
+                    name=f"libreoffice-worker-{idx}",
+                    daemon=True,
+                )
+                self.listeners.append(listener)
+                worker.start()
+                self.workers.append(worker)
+            # Daemon workers never exit, so their resident soffice processes are killed with the interpreter
+            atexit.register(self.close)
+
+    def close(self):
+        for listener in self.listeners:
+            listener.stop()
+
+    @override
+    def convert(self, docx_input: DocxInput) -> ConvertedPdf:
+        self.start()
+        result: Future = Future()
+        self.jobs.put((read_docx_bytes(docx_input), result))
+        wait_seconds = self.queue_timeout_seconds + self.timeout_seconds
+        try:
+            return ConvertedPdf(data=result.result(timeout=wait_seconds))
+        except FutureTimeoutError:
+            # Workers skip cancelled jobs, so a conversion still queued never runs
+            result.cancel()
+            raise RuntimeError(
+                f"LibreOffice conversion did not finish within {wait_seconds}s, the worker queue is backed up"
+            )
+
+    def run_worker(self, listener: LibreOfficeListener):
+        try:
+            self.warm_up(listener)
+        except Exception as e:
+            print(
+                f"Warning: LibreOffice warm up failed for {listener.profile_dir}: {e}"
+            )
+
+        while True:
+            docx_bytes, result = self.jobs.get()
+            if not result.set_running_or_notify_cancel():
+                continue
+            try:
+                result.set_result(listener.convert(docx_bytes))
+            except Exception as e:
+                result.set_exception(e)
+
+    def warm_up(self, listener: LibreOfficeListener):
+        """
+        Starts the listener and converts an empty document so the Writer and PDF filters are
+        loaded before real jobs arrive
+        """
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        listener.convert(buffer.getvalue())
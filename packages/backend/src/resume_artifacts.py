@@ -0,0 +1,141 @@
+import hashlib
+import io
+
+from docx import Document
+from docx.text.paragraph import Paragraph
+
+from docx_functions.general import iter_doc_paragraphs
+from docx_functions.marshaling.serialization import (
+    serialize_raw_docx,
+    serialize_sections,
+)
+from docx_functions.modifications import merge_identical_runs
+from docx_functions.segmentation.segment_resume import parse_resume_for_sections
+from firebase.realtime_db import cache_get_object, cache_set_object
+from utils import get_file_sha256
+
+
+# Bump when segmentation or serialization changes, so artifacts from older code are ignored
+RESUME_ARTIFACTS_VERSION = 2
+RESUME_ARTIFACTS_EXPIRY_SECONDS = 30 * 24 * 60 * 60
+
+
+def get_resume_artifact_cache_id(kind: str, docx_hash: str) -> str:
+    return f"resume_{kind}_v{RESUME_ARTIFACTS_VERSION}_{docx_hash}"
+
+
+def get_section_layout(
+    sections: dict[str, list[Paragraph]], doc: Document
+) -> dict[str, list[int]]:
+    """
+    Records each section's paragraphs as positions in iter_doc_paragraphs,
+    so the sections can be rebuilt from a freshly loaded document without segmenting it
+    """
+    positions = {para._p: idx for idx, para in enumerate(iter_doc_paragraphs(doc))}
+    return {
+        section: [positions[para._p] for para in paragraphs]
+        for section, paragraphs in sections.items()
+    }
+
+
+def build_sections_artifact(docx_bytes: bytes) -> dict:
+    """
+    The segmented sections the tailoring request patches
+    """
+    sections, doc = parse_resume_for_sections(io.BytesIO(docx_bytes))
+    return {
+        "section_layout": get_section_layout(sections, doc),
+        "sections_strings": serialize_sections(sections),
+    }
+
+
+def build_markdown_artifact(docx_bytes: bytes) -> dict:
+    """
+    The whole resume as markdown, which the questions and cover letter requests read
+    Doesn't need the resume segmented, so it is built and cached apart from the sections
+    """
+    return {"raw_markdown": serialize_raw_docx(io.BytesIO(docx_bytes))}
+
+
+ARTIFACT_BUILDERS = {
+    "sections": build_sections_artifact,
+    "markdown": build_markdown_artifact,
+}
+
+
+def get_cached_resume_artifact(kind: str, docx_hash: str) -> dict | None:
+    try:
+        return cache_get_object(get_resume_artifact_cache_id(kind, docx_hash))
+    except ValueError:
+        return None
+    except Exception as e:
+        print(f"Warning: Failed to read resume {kind} artifact: {e}")
+        return None
+
+
+def cache_resume_artifact(kind: str, docx_hash: str, docx_bytes: bytes) -> dict:
+    artifact = ARTIFACT_BUILDERS[kind](docx_bytes)
+    try:
+        cache_set_object(
+            get_resume_artifact_cache_id(kind, docx_hash),
+            artifact,
+            RESUME_ARTIFACTS_EXPIRY_SECONDS,
+        )
+    except Exception as e:
+        print(f"Warning: Failed to cache resume {kind} artifact: {e}")
+    return artifact
+
+
+def prewarm_resume_artifacts(docx_bytes: bytes) -> str:
+    """
+    Parses an uploaded resume and caches every artifact under the DOCX hash
+    Returns the hash
+    """
+    docx_hash = hashlib.sha256(docx_bytes).hexdigest()
+    for kind in ARTIFACT_BUILDERS:
+        if get_cached_resume_artifact(kind, docx_hash) is None:
+            cache_resume_artifact(kind, docx_hash, docx_bytes)
+    return docx_hash
+
+
+def get_resume_artifact(resume_path: str, kind: str) -> dict:
+    """
+    Returns one of the resume's artifacts, building (and caching) only that one if the resume
+    was never pre-warmed
+    """
+    docx_hash = get_file_sha256(resume_path)
+    artifact = get_cached_resume_artifact(kind, docx_hash)
+    if artifact is not None:
+        return artifact
+
+    print(f"Resume {kind} artifact cache miss", docx_hash)
+    with open(resume_path, "rb") as f:
+        return cache_resume_artifact(kind, docx_hash, f.read())
+
+
+def load_resume_sections(resume_path: str):
+    """
+    parse_resume_for_sections backed by the artifacts cache
+    Returns the critical sections, the document and the serialized sections
+    """
+    artifact = get_resume_artifact(resume_path, "sections")
+
+    doc = Document(resume_path)
+    paragraphs = list(iter_doc_paragraphs(doc))
+    sections = {
+        section: [paragraphs[idx] for idx in positions]
+        for section, positions in artifact["section_layout"].items()
+    }
+    # The same run merging parse_resume_for_sections does, so patches line up with the serialized runs
+    for section_paragraphs in sections.values():
+        for para in section_paragraphs:
+            merge_identical_runs(para)
+
+    return sections, doc, artifact["sections_strings"]
+
+
+def load_raw_resume_markdown(resume_path: str) -> str:
+    """
+    serialize_raw_docx backed by the artifacts cache
+    """
+    return get_resume_artifact(resume_path, "markdown")["raw_markdown"]
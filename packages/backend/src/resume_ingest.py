@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
+
+from pdf_cache import get_or_convert_pdf_url
+from pdf_conversion_jobs import start_pdf_conversion
+from resume_artifacts import prewarm_resume_artifacts
+from utils import run_stages_concurrently
+
+
+INGEST_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="resume-ingest")
+
+
+def prewarm_artifacts_safely(docx_bytes: bytes) -> str | None:
+    """
+    Artifacts are only an optimization, later requests parse the resume themselves if this fails
+    """
+    try:
+        return prewarm_resume_artifacts(docx_bytes)
+    except Exception as e:
+        print(f"Warning: Failed to pre-warm resume artifacts: {e}")
+        return None
+
+
+def ingest_resume(docx_bytes: bytes, async_pdf: bool = False) -> dict:
+    """
+    Pre-warms what later requests need from an uploaded resume, in parallel:
+    the rendered PDF in the conversion cache and the parsed section artifacts
+    Returns pdf_url, or pdf_job_id with async_pdf
+    With async_pdf nothing is waited on, the job id is returned once the conversion is queued
+    and the artifacts are parsed in the background
+    """
+    if async_pdf:
+        INGEST_EXECUTOR.submit(prewarm_artifacts_safely, docx_bytes)
+        return {"pdf_job_id": start_pdf_conversion(io.BytesIO(docx_bytes))}
+
+    results, timings = run_stages_concurrently(
+        INGEST_EXECUTOR,
+        {
+            "pdf": lambda: get_or_convert_pdf_url(io.BytesIO(docx_bytes)),
+            "artifacts": lambda: prewarm_artifacts_safely(docx_bytes),
+        },
+    )
+    print(
+        "Resume ingest timings (ms)",
+        {stage: round(seconds * 1000) for stage, seconds in timings.items()},
+    )
+
+    return {"pdf_url": results["pdf"]}
@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from docx_functions.marshaling.serialization import serialize_raw_docx
+from firebase.buckets import fetch_and_download_cover_letter, fetch_and_download_resume
+from firebase.realtime_db import cache_get_object
+from linkedin_fetching.fetch_job_description import fetch_job_description_markdown
+from resume_artifacts import load_raw_resume_markdown
+from utils import run_stages_concurrently
+
+
+CONTEXT_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tailoring-context")
+
+
+class TailoringContext:
+    """
+    Inputs gathered for a tailoring pipeline, fields that weren't requested are None
+    """
+
+    __slots__ = (
+        "job_description",
+        "resume_path",
+        "resume_markdown",
+        "cover_letter_path",
+        "cover_letter_markdown",
+        "chat_history",
+        "questions",
+        "stage_timings_ms",
+    )
+
+    def __init__(self):
+        self.job_description: str | None = None
+        self.resume_path: str | None = None
+        self.resume_markdown: str | None = None
+        self.cover_letter_path: str | None = None
+        self.cover_letter_markdown: str | None = None
+        self.chat_history: list | None = None
+        self.questions: dict | None = None
+        self.stage_timings_ms: dict[str, float] = {}
+
+
+def load_resume(user_id: str, resume_name: str, with_markdown: bool):
+    resume_path = fetch_and_download_resume(user_id, resume_name)
+    if not with_markdown:
+        return resume_path, None
+    return resume_path, load_raw_resume_markdown(resume_path)
+
+
+def load_cover_letter(user_id: str, cover_letter_name: str):
+    cover_letter_path = fetch_and_download_cover_letter(user_id, cover_letter_name)
+    return cover_letter_path, serialize_raw_docx(cover_letter_path)
+
+
+def gather_tailoring_context(
+    user_id: str,
+    job_description_link: str | None = None,
+    resume_name: str | None = None,
+    cover_letter_name: str | None = None,
+    chat_id: str | None = None,
+    with_resume_markdown: bool = True,
+) -> TailoringContext:
+    """
+    Fetches the job description, downloads and reads the resume and cover letter and loads the
+    questions chat, each only if asked for, all at once rather than one after another
+    If any of them fails its error is raised straight away and the ones not yet started are cancelled
+    """
+    stages = {}
+    if job_description_link:
+        stages["job_description"] = lambda: fetch_job_description_markdown(
+            job_description_link
+        )
+    if resume_name:
+        stages["resume"] = lambda: load_resume(
+            user_id, resume_name, with_resume_markdown
+        )
+    if cover_letter_name:
+        stages["cover_letter"] = lambda: load_cover_letter(user_id, cover_letter_name)
+    if chat_id:
+        stages["chat"] = lambda: cache_get_object(chat_id)
+
+    results, timings = run_stages_concurrently(CONTEXT_EXECUTOR, stages)
+
+    context = TailoringContext()
+    context.job_description = results.get("job_description")
+    if "resume" in results:
+        context.resume_path, context.resume_markdown = results["resume"]
+    if "cover_letter" in results:
+        context.cover_letter_path, context.cover_letter_markdown = results[
+            "cover_letter"
+        ]
+    if "chat" in results:
+        context.chat_history = results["chat"]["chat_history"]
+        context.questions = results["chat"]["questions"]
+    context.stage_timings_ms = {
+        name: round(seconds * 1000, 1) for name, seconds in timings.items()
+    }
+    print("Tailoring context gathered", context.stage_timings_ms)
+    return context
@@ -1,6 +1,9 @@
+import threading
 import time
 import base64
+from concurrent.futures import FIRST_EXCEPTION, Executor, Future, wait
 from datetime import datetime
+from typing import Callable
 import hashlib
 import os
 import pickle
@@ -36,6 +39,27 @@ def get_objects_hash(*args, digest_size=8) -> str:
     return hash_string
 
 
+def get_stream_sha256(stream, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hex SHA-256 of a file object's whole contents, read in chunks
+    The stream is rewound before and after hashing
+    """
+    file_hash = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        file_hash.update(chunk)
+    stream.seek(0)
+    return file_hash.hexdigest()
+
+
+def get_file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hex SHA-256 of a file's contents, read in chunks
+    """
+    with open(file_path, "rb") as f:
+        return get_stream_sha256(f, chunk_size)
+
+
 def delete_top_level_files(dir_path: str):
     for item in os.listdir(dir_path):
         item_path = os.path.join(dir_path, item)
@@ -43,6 +67,78 @@ def delete_top_level_files(dir_path: str):
             os.unlink(item_path)
 
 
+def run_stages_concurrently(
+    executor: Executor, stages: dict[str, Callable[[], object]]
+) -> tuple[dict[str, object], dict[str, float]]:
+    """
+    Runs every stage on the executor at once and waits for the slowest
+    Returns each stage's result and duration in seconds
+    As soon as a stage fails, stages that haven't started are cancelled and its error is raised
+    without waiting for the ones still running
+    """
+
+    def timed(fn):
+        start = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - start
+
+    futures = {name: executor.submit(timed, fn) for name, fn in stages.items()}
+
+    done, pending = wait(futures.values(), return_when=FIRST_EXCEPTION)
+    failed = [future for future in done if future.exception() is not None]
+    if failed:
+        for future in pending:
+            future.cancel()
+        raise failed[0].exception()
+
+    results = {}
+    timings = {}
+    for name, future in futures.items():
+        results[name], timings[name] = future.result()
+    return results, timings
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one, the other callers wait for its result
+    (or error) instead of repeating the work
+    """
+
+    def __init__(self):
+        self.in_flight: dict[str, Future] = {}
+        self.lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], object]):
+        with self.lock:
+            call = self.in_flight.get(key)
+            is_owner = call is None
+            if is_owner:
+                call = Future()
+                self.in_flight[key] = call
+
+        if not is_owner:
+            return call.result()
+
+        try:
+            result = fn()
+        except Exception as e:
+            call.set_exception(e)
+            raise
+        except BaseException as e:
+            # A timeout's SystemExit or an interrupt still has to release the waiters,
+            # who get an ordinary error rather than the leader's exit
+            error = RuntimeError(f"Shared call for {key} was interrupted: {e!r}")
+            error.__cause__ = e
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+
+
 def timer(fn):
     def wrapped(*args, **kwargs):
         start = time.perf_counter()
@@ -1,3 +1,4 @@
+import importlib
 import os
 import pytest
 from unittest.mock import Mock, patch
@@ -21,6 +22,14 @@ def mock_env_vars(monkeypatch):
     return _set_env
 
 
+@pytest.fixture
+def import_with_env(monkeypatch):
+    """Import modules that depend on constants.py, which requires GCP_AI_API_KEY."""
+    if not os.environ.get("GCP_AI_API_KEY"):
+        monkeypatch.setenv("GCP_AI_API_KEY", "test-key")
+    return importlib.import_module
+
+
 @pytest.fixture
 def test_user_id():
     """Consistent test user ID for tests."""
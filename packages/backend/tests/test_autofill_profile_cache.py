@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+
+
+class FakeProfileStore:
+    """Stands in for the realtime db's etag reads of users' autofill data."""
+
+    def __init__(self):
+        self.profiles = {}
+        self.versions = {}
+        self.full_reads = 0
+        self.conditional_reads = 0
+
+    def save(self, user_id, data):
+        self.profiles[user_id] = data
+        self.versions[user_id] = self.versions.get(user_id, 0) + 1
+
+    def etag(self, user_id):
+        return f"{user_id}-{self.versions.get(user_id, 0)}"
+
+    def get_with_etag(self, user_id):
+        self.full_reads += 1
+        return self.profiles.get(user_id), self.etag(user_id)
+
+    def get_if_changed(self, user_id, etag):
+        self.conditional_reads += 1
+        if etag == self.etag(user_id):
+            return False, None, None
+        return True, self.profiles.get(user_id), self.etag(user_id)
+
+
+@pytest.fixture
+def cache_module(import_with_env, monkeypatch):
+    module = import_with_env("firebase.autofill_profile_cache")
+    store = FakeProfileStore()
+    monkeypatch.setattr(
+        module, "get_user_autofill_data_with_etag", store.get_with_etag
+    )
+    monkeypatch.setattr(
+        module, "get_user_autofill_data_if_changed", store.get_if_changed
+    )
+    module.store = store
+    return module
+
+
+@pytest.mark.unit
+class TestAutofillProfileCache:
+    def test_unchanged_profile_is_not_downloaded_again(self, cache_module):
+        """Test that repeat reads of an unchanged profile only validate the etag."""
+        cache_module.store.save("user", {"name": {"first_name": "John"}})
+        cache = cache_module.AutofillProfileCache()
+
+        assert cache.get("user") == {"name": {"first_name": "John"}}
+        assert cache.get("user") == {"name": {"first_name": "John"}}
+        assert cache_module.store.full_reads == 1
+        assert cache_module.store.conditional_reads == 1
+
+    def test_changed_profile_is_reloaded(self, cache_module):
+        """Test that a save from anywhere is picked up on the next read."""
+        cache_module.store.save("user", {"veteran": "not_veteran"})
+        cache = cache_module.AutofillProfileCache()
+        cache.get("user")
+
+        cache_module.store.save("user", {"veteran": "protected_veteran"})
+
+        assert cache.get("user") == {"veteran": "protected_veteran"}
+
+    def test_missing_or_cleared_profiles_are_empty(self, cache_module):
+        """Test that users without data (None or a cleared []) get an empty dict."""
+        cache_module.store.save("cleared", [])
+        cache = cache_module.AutofillProfileCache()
+
+        assert cache.get("new") == {}
+        assert cache.get("cleared") == {}
+
+    def test_least_recently_used_profiles_are_evicted(self, cache_module):
+        """Test that the cache keeps at most max_entries profiles."""
+        cache = cache_module.AutofillProfileCache(max_entries=2)
+        cache.get("a")
+        cache.get("b")
+        cache.get("a")
+        cache.get("c")
+
+        assert list(cache.profiles) == ["a", "c"]
+
+    def test_concurrent_reads_share_one_download(self, cache_module, monkeypatch):
+        """Test that simultaneous requests for one user download the profile once."""
+        store = cache_module.store
+        store.save("user", {"website": "https://example.com"})
+
+        def slow_get_with_etag(user_id):
+            time.sleep(0.1)
+            return store.get_with_etag(user_id)
+
+        monkeypatch.setattr(
+            cache_module, "get_user_autofill_data_with_etag", slow_get_with_etag
+        )
+        cache = cache_module.AutofillProfileCache()
+
+        threads = [
+            threading.Thread(target=cache.get, args=("user",)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.full_reads == 1
+
+    def test_refresh_after_save_only_touches_cached_users(self, cache_module):
+        """Test that saves refresh cached profiles and leave other users uncached."""
+        store = cache_module.store
+        store.save("cached", {"disability": "enabled"})
+        cache = cache_module.AutofillProfileCache()
+        cache.get("cached")
+
+        store.save("cached", {"disability": "disabled"})
+        cache.refresh_after_save("cached").result()
+        assert cache.refresh_after_save("other") is None
+
+        assert cache.profiles["cached"].data == {"disability": "disabled"}
+        assert "other" not in cache.profiles
@@ -0,0 +1,133 @@
+import datetime
+import io
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def buckets(import_with_env, mock_storage_bucket):
+    """Import buckets with an empty listing cache."""
+    module = import_with_env("firebase.buckets")
+    module._resume_list_cache.clear()
+    yield module
+    module._resume_list_cache.clear()
+
+
+def make_blob(name, generation=1):
+    blob = Mock()
+    blob.name = name
+    blob.size = 1024
+    blob.updated = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    blob.generation = generation
+    blob.public_url = f"https://storage.googleapis.com/test-bucket/{name}"
+    return blob
+
+
+@pytest.mark.unit
+class TestListStoredResumeMetadata:
+    def test_lists_without_per_blob_requests(self, buckets, mock_storage_bucket, test_user_id):
+        """Test that listing returns metadata and never touches blob ACLs."""
+        blob = make_blob(f"resumes/{test_user_id}/resume.docx")
+        mock_storage_bucket.list_blobs.return_value = [
+            make_blob(f"resumes/{test_user_id}/"),
+            blob,
+        ]
+
+        resumes = buckets.list_stored_resume_metadata(test_user_id)
+
+        assert resumes == [
+            {
+                "name": "resume.docx",
+                "size": 1024,
+                "updated": "2025-01-01T00:00:00+00:00",
+                "generation": 1,
+                "url": blob.public_url,
+            }
+        ]
+        blob.make_public.assert_not_called()
+
+    def test_listing_is_cached_until_upload(self, buckets, mock_storage_bucket, test_user_id):
+        """Test that repeat listings hit the cache and uploads invalidate it."""
+        mock_storage_bucket.list_blobs.return_value = [
+            make_blob(f"resumes/{test_user_id}/resume.docx")
+        ]
+
+        buckets.list_stored_resume_metadata(test_user_id)
+        buckets.list_stored_resume_metadata(test_user_id)
+        assert mock_storage_bucket.list_blobs.call_count == 1
+
+        buckets.upload_resume_from_file(Mock(), test_user_id, "other.docx")
+        buckets.list_stored_resume_metadata(test_user_id)
+        assert mock_storage_bucket.list_blobs.call_count == 2
+
+    def test_stored_resumes_reuse_a_listing(self, buckets, mock_storage_bucket, test_user_id):
+        """Test that the name to url map is built from a listing passed in without listing again."""
+        metadata = [{"name": "resume.docx", "url": "https://a.docx"}]
+
+        assert buckets.get_stored_resumes(test_user_id, metadata) == {
+            "resume.docx": "https://a.docx"
+        }
+        mock_storage_bucket.list_blobs.assert_not_called()
+
+
+@pytest.mark.unit
+class TestResponseStreamReader:
+    def test_reads_fill_chunks_and_track_position(self, buckets):
+        """Test that reads return full chunks until the body ends."""
+        response = Mock()
+        response.iter_content.return_value = iter([b"abc", b"de", b"fghij"])
+        reader = buckets.ResponseStreamReader(response, chunk_size=4)
+
+        assert reader.read(4) == b"abcd"
+        assert reader.tell() == 4
+        assert reader.read(4) == b"efgh"
+        assert reader.read(4) == b"ij"
+        assert reader.read(4) == b""
+        assert reader.tell() == 10
+
+
+@pytest.mark.unit
+class TestPdfCache:
+    def test_upload_streams_into_hash_keyed_blob(
+        self, buckets, mock_storage_bucket, monkeypatch
+    ):
+        """Test that the PDF is streamed into the blob for the DOCX hash."""
+        response = Mock()
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+        response.iter_content.return_value = iter([b"%PDF-1.7"])
+        monkeypatch.setattr(buckets.requests, "get", Mock(return_value=response))
+        blob = mock_storage_bucket.blob.return_value
+
+        buckets.upload_pdf_to_cache("https://pdf", "abc123")
+
+        assert mock_storage_bucket.blob.call_args.args[0] == "pdf_cache/abc123.pdf"
+        assert blob.metadata == {buckets.SOURCE_DOCX_HASH_METADATA_KEY: "abc123"}
+        stream = blob.upload_from_file.call_args.args[0]
+        assert isinstance(stream, buckets.ResponseStreamReader)
+
+    def test_missing_pdf_is_a_miss(self, buckets, mock_storage_bucket):
+        """Test that no URL is returned when the hash has never been converted."""
+        mock_storage_bucket.get_blob.return_value = None
+
+        assert buckets.get_cached_pdf_url("abc123") is None
+
+
+@pytest.mark.unit
+class TestTailoredCoverLetterUpload:
+    def test_buffer_is_uploaded_and_signed(self, buckets, mock_storage_bucket, test_user_id):
+        """Test that the in memory cover letter is uploaded to storage and a download url returned."""
+        blob = mock_storage_bucket.blob.return_value
+        blob.generate_signed_url.return_value = "https://signed"
+        buffer = io.BytesIO(b"docx")
+
+        download_url = buckets.upload_tailored_cover_letter(buffer, test_user_id, "letter")
+
+        blob_path = mock_storage_bucket.blob.call_args.args[0]
+        assert blob_path.startswith(f"cover_letters/{test_user_id}/tailored/letter_")
+        assert blob_path.endswith(".docx")
+        blob.upload_from_file.assert_called_once_with(
+            buffer, rewind=True, content_type=buckets.DOCX_FILE_FORMAT
+        )
+        assert download_url == "https://signed"
@@ -0,0 +1,126 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+
+
+AUTHORIZATION_OPTIONS = {
+    "us_authorized": [
+        "I am authorized to work in the US",
+        "I have US work authorization",
+        "Legally authorized to work in US",
+    ],
+    "no_authorization": [
+        "I am not authorized to work in the US",
+        "I require sponsorship",
+        "No US work authorization",
+    ],
+}
+
+
+@pytest.fixture
+def get_handler(import_with_env):
+    return import_with_env(
+        "functions.inputs_autofill_helper.category_handlers.get_handler"
+    )
+
+
+@pytest.fixture
+def option_selection(import_with_env):
+    return import_with_env("functions.inputs_autofill_helper.option_selection")
+
+
+@pytest.mark.unit
+class TestCategoryHandlerRegistry:
+    def test_every_input_type_is_registered_or_unimplemented(self, get_handler):
+        """Test that each InputType has exactly one of a handler or a not implemented entry."""
+        from functions.inputs_autofill_helper.autofill_schema import InputType
+
+        for input_type in InputType:
+            registered = input_type in get_handler.CATEGORY_HANDLERS
+            unimplemented = input_type in get_handler.UNIMPLEMENTED_CATEGORIES
+            assert registered != unimplemented, input_type
+
+    def test_unimplemented_category_raises_not_implemented(self, get_handler):
+        """Test that a category without a handler raises NotImplementedError, which callers skip."""
+        from functions.inputs_autofill_helper.autofill_schema import InputType
+
+        with pytest.raises(NotImplementedError, match="Desired Salary"):
+            get_handler.get_category_handler(InputType.DESIRED_SALARY, {})
+
+    def test_unknown_category_raises_value_error(self, get_handler):
+        """Test that a category outside InputType raises ValueError."""
+        with pytest.raises(ValueError):
+            get_handler.get_category_handler("not_a_category", {})
+
+    def test_handlers_are_reused_within_a_request(self, get_handler):
+        """Test that CategoryHandlers builds each category's handler once and passes it the data."""
+        from functions.inputs_autofill_helper.autofill_schema import InputType
+
+        data = {"veteran": "not_veteran"}
+        handlers = get_handler.CategoryHandlers(data)
+
+        veteran = handlers.get(InputType.VETERAN)
+        assert handlers.get(InputType.VETERAN) is veteran
+        assert veteran.user_autofill_data is data
+        assert handlers.get(InputType.DISABILITY) is not veteran
+
+
+@pytest.mark.unit
+class TestCanonicalMatcher:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("I can legally work in United States", "us_authorized"),
+            ("Not authorized for US employment", "no_authorization"),
+            ("I do not have US work authorization", "no_authorization"),
+            ("Need visa sponsorship", "no_authorization"),
+            ("Favourite colour", None),
+        ],
+    )
+    def test_matches_like_get_most_similar_canonical_option(
+        self, option_selection, value, expected
+    ):
+        """Test that a compiled matcher picks the same option as matching from the raw dict."""
+        matcher = option_selection.CanonicalMatcher(AUTHORIZATION_OPTIONS)
+
+        assert matcher.get_most_similar(value) == expected
+        assert (
+            option_selection.get_most_similar_canonical_option(
+                value, AUTHORIZATION_OPTIONS
+            )
+            == expected
+        )
+
+    def test_invalid_options_are_rejected_when_compiled(self, option_selection):
+        """Test that malformed canonicals fail when the matcher is built, not on first use."""
+        with pytest.raises(ValidationError):
+            option_selection.CanonicalMatcher({"yes": "Yes"})
+
+    def test_enum_handlers_compile_their_canonicals_once(self, get_handler):
+        """Test that enum handlers share a class level matcher built from their CANONICALS."""
+        from functions.inputs_autofill_helper.category_handlers.base_category_handler import (
+            EnumBasedCategoryHandler,
+        )
+
+        enum_handlers = [
+            handler
+            for handler in get_handler.CATEGORY_HANDLERS.values()
+            if issubclass(handler, EnumBasedCategoryHandler)
+        ]
+        assert enum_handlers
+        for handler in enum_handlers:
+            assert isinstance(handler.__dict__["CANONICALS"], dict), handler
+            assert handler.CANONICAL_MATCHER.canonical_options is handler.CANONICALS
+            assert handler({}).CANONICAL_MATCHER is handler.CANONICAL_MATCHER
+
+    def test_enum_handler_radio_uses_the_matcher(self, get_handler):
+        """Test that a radio label is checked only when it matches the saved enum value."""
+        from functions.inputs_autofill_helper.autofill_schema import InputType
+
+        handler = get_handler.get_category_handler(
+            InputType.VETERAN, {"veteran": "not_veteran"}
+        )
+
+        assert handler.fill_radio_input(Mock(label="I am not a veteran"), []) is True
+        assert handler.fill_radio_input(Mock(label="I am a veteran"), []) is False
@@ -0,0 +1,155 @@
+import pytest
+from docx import Document
+from docx.shared import Pt
+
+from docx_functions.marshaling.deserialization import (
+    apply_section_patch,
+    build_next_non_anchor_table,
+    plan_section_update,
+    update_resume_section,
+)
+from LLM_tailoring.resume.schema import (
+    ParagraphPatchOperation,
+    PatchOperationType,
+    SerializedParagraph,
+    SerializedRun,
+)
+
+
+def make_paragraph(text, preserved=False, list_indent_level=None):
+    return SerializedParagraph(
+        runs=[SerializedRun(text=text, styles=[])],
+        preserved=preserved,
+        list_indent_level=list_indent_level,
+    )
+
+
+@pytest.mark.unit
+class TestNextNonAnchorTable:
+    def test_jumps_over_anchor_runs(self):
+        """Test that each entry points at the next non-anchor index."""
+        table = build_next_non_anchor_table([True, True, False, True, False])
+        assert table == [2, 2, 2, 4, 4, 5]
+
+    def test_trailing_anchors_point_past_end(self):
+        """Test that anchors at the end of the section point past the last paragraph."""
+        assert build_next_non_anchor_table([False, True]) == [0, 2, 2]
+
+
+@pytest.mark.unit
+class TestPlanSectionUpdate:
+    def test_inserts_after_preserved_headers(self):
+        """Test that new paragraphs are placed before the next non-anchor paragraph."""
+        source = ["Company A", "old a1", "old a2", "old a3", "Company B", "old b1"]
+        new = [
+            make_paragraph("Company A", preserved=True),
+            make_paragraph("new a1"),
+            make_paragraph("new a2"),
+            make_paragraph("Company B", preserved=True),
+            make_paragraph("new b1"),
+        ]
+
+        is_anchor, inserts = plan_section_update(source, new)
+
+        assert is_anchor == [True, False, False, False, True, False]
+        assert [(idx, p.get_text()) for idx, p in inserts] == [
+            (1, "new a1"),
+            (2, "new a2"),
+            (5, "new b1"),
+        ]
+
+
+@pytest.mark.unit
+class TestUpdateResumeSection:
+    def test_replaces_non_anchor_paragraphs(self):
+        """Test that anchors are kept in place and old bullets are replaced."""
+        doc = Document()
+        for text in ["Company A", "old a1", "Company B", "old b1"]:
+            doc.add_paragraph(text)
+
+        update_resume_section(
+            list(doc.paragraphs),
+            [
+                make_paragraph("Company A", preserved=True),
+                make_paragraph("new a1"),
+                make_paragraph("new a2"),
+                make_paragraph("Company B", preserved=True),
+                make_paragraph("new b1"),
+            ],
+        )
+
+        assert [p.text for p in doc.paragraphs] == [
+            "Company A",
+            "new a1",
+            "new a2",
+            "Company B",
+            "new b1",
+        ]
+
+
+def make_operation(op, paragraph_id, text=None):
+    return ParagraphPatchOperation(
+        op=op,
+        id=paragraph_id,
+        runs=[SerializedRun(text=text, styles=[])] if text is not None else None,
+    )
+
+
+@pytest.mark.unit
+class TestApplySectionPatch:
+    @pytest.fixture
+    def section_doc(self):
+        doc = Document()
+        doc.add_paragraph("Company A")
+        doc.add_paragraph("old a1").runs[0].font.size = Pt(9)
+        doc.add_paragraph("old a2")
+        return doc
+
+    def test_applies_operations(self, section_doc):
+        """Test replace, insert_after and delete against paragraph ids."""
+        apply_section_patch(
+            "experience",
+            list(section_doc.paragraphs),
+            [
+                make_operation(PatchOperationType.KEEP, "experience-0"),
+                make_operation(PatchOperationType.REPLACE, "experience-1", "new a1"),
+                make_operation(PatchOperationType.INSERT_AFTER, "experience-1", "new a2"),
+                make_operation(PatchOperationType.INSERT_AFTER, "experience-1", "new a3"),
+                make_operation(PatchOperationType.DELETE, "experience-2"),
+            ],
+        )
+
+        assert [p.text for p in section_doc.paragraphs] == [
+            "Company A",
+            "new a1",
+            "new a2",
+            "new a3",
+        ]
+
+    def test_keeps_run_formatting(self, section_doc):
+        """Test that replaced and inserted runs copy the original run formatting."""
+        apply_section_patch(
+            "experience",
+            list(section_doc.paragraphs),
+            [
+                make_operation(PatchOperationType.REPLACE, "experience-1", "new a1"),
+                make_operation(PatchOperationType.INSERT_AFTER, "experience-1", "new a2"),
+            ],
+        )
+
+        assert section_doc.paragraphs[1].runs[0].font.size == Pt(9)
+        assert section_doc.paragraphs[2].runs[0].font.size == Pt(9)
+
+    def test_unknown_ids_are_skipped(self, section_doc):
+        """Test that unmentioned paragraphs are kept and unknown ids ignored."""
+        apply_section_patch(
+            "experience",
+            list(section_doc.paragraphs),
+            [make_operation(PatchOperationType.DELETE, "skills-0")],
+        )
+
+        assert [p.text for p in section_doc.paragraphs] == [
+            "Company A",
+            "old a1",
+            "old a2",
+        ]
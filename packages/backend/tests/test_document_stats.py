@@ -0,0 +1,111 @@
+import copy
+
+import pytest
+from docx import Document
+from docx.shared import Pt
+
+from docx_functions.document_stats import get_document_stats
+from docx_functions.segmentation.heading_recognition import (
+    is_above_average_font_size,
+    is_likely_heading,
+    is_mostly_uppercase,
+    is_primarily_bold,
+)
+
+
+@pytest.fixture
+def sample_doc():
+    doc = Document()
+    doc.add_heading("Experience", level=1)
+    doc.add_paragraph("Built data pipelines for the analytics team")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].add_run("Table text").font.size = Pt(12)
+    return doc
+
+
+@pytest.mark.unit
+class TestDocumentStats:
+    def test_resolves_style_inheritance(self, sample_doc):
+        """Test that heading fonts are resolved through the style table."""
+        stats = get_document_stats(sample_doc)
+        heading, body = sample_doc.paragraphs[:2]
+
+        assert stats.paragraph_font(heading).size == 14.0
+        assert stats.paragraph_font(heading).bold is True
+        assert stats.paragraph_font(body).size == stats.default_size
+
+    def test_includes_table_paragraphs(self, sample_doc):
+        """Test that runs inside tables count towards the size distribution."""
+        stats = get_document_stats(sample_doc)
+        assert stats.font_size_counts[12.0] == 1
+        assert stats.average_font_size == pytest.approx((14 + 11 + 12) / 3)
+
+    def test_bold_and_caps_distributions(self, sample_doc):
+        """Test that the bold ratio counts inherited bold and the caps ratio counts mostly uppercase paragraphs."""
+        sample_doc.add_paragraph("SKILLS AND TOOLS")
+        stats = get_document_stats(sample_doc)
+        assert stats.bold_ratio == pytest.approx(1 / 4)
+        assert stats.caps_ratio == pytest.approx(1 / 4)
+
+    def test_paragraph_stats_from_single_pass(self, sample_doc):
+        """Test that each paragraph's run and letter counts are measured once in the document pass."""
+        stats = get_document_stats(sample_doc)
+        heading = sample_doc.paragraphs[0]
+
+        para_stats = stats.paragraph_stats(heading)
+        assert stats.paragraph_stats(sample_doc.paragraphs[0]) is para_stats
+        assert para_stats.run_count == 1
+        assert para_stats.bold_run_count == 1
+        assert para_stats.max_font_size == 14.0
+        assert (para_stats.letter_count, para_stats.uppercase_count) == (10, 1)
+
+    def test_stats_computed_once(self, sample_doc):
+        """Test that stats are shared by every Document over the same part."""
+        stats = get_document_stats(sample_doc)
+        paragraph = sample_doc.paragraphs[0]
+        assert get_document_stats(paragraph.part.document) is stats
+
+
+@pytest.mark.unit
+class TestHeadingSignals:
+    def test_inherited_font_size_is_above_average(self, sample_doc):
+        """Test that a heading sized only by its style counts as large."""
+        heading, body = sample_doc.paragraphs[:2]
+        assert is_above_average_font_size(heading, sample_doc)
+        assert not is_above_average_font_size(body, sample_doc)
+
+    def test_inherited_bold(self, sample_doc):
+        """Test that style level bold is only seen with doc stats."""
+        heading = sample_doc.paragraphs[0]
+        stats = get_document_stats(sample_doc)
+        assert not is_primarily_bold(heading)
+        assert is_primarily_bold(heading, doc_stats=stats)
+
+    def test_heading_check_copies_only_the_paragraph(self, sample_doc, monkeypatch):
+        """Test that whitespace cleaning runs on a copy of the paragraph element, not of the document."""
+        para = sample_doc.add_paragraph()
+        for text in ["S", " ", "K", " ", "I", " ", "L", " ", "L", " ", "S"]:
+            para.add_run(text)
+        copied = []
+        deepcopy = copy.deepcopy
+
+        def record_deepcopy(value, *args):
+            copied.append(type(value).__name__)
+            return deepcopy(value, *args)
+
+        monkeypatch.setattr(copy, "deepcopy", record_deepcopy)
+
+        is_likely_heading(para, sample_doc)
+        assert copied == ["CT_P"]
+        assert para.text == "S K I L L S"
+
+    def test_uppercase_reads_doc_stats(self, sample_doc):
+        """Test that the uppercase signal gives the same answer from the doc stats letter counts."""
+        caps = sample_doc.add_paragraph("EDUCATION and more")
+        stats = get_document_stats(sample_doc)
+        for caps_ratio in (0.5, 0.8):
+            assert is_mostly_uppercase(caps, caps_ratio) == is_mostly_uppercase(
+                caps, caps_ratio, doc_stats=stats
+            )
+        assert is_mostly_uppercase(caps, 0.5, doc_stats=stats)
+        assert not is_mostly_uppercase(caps, 0.8, doc_stats=stats)
@@ -0,0 +1,76 @@
+import zipfile
+
+import pytest
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from docx_functions.docx_writer import (
+    DOCUMENT_RELS_NAME,
+    get_relationship_targets,
+    save_docx_to_buffer,
+)
+
+
+@pytest.fixture
+def source_docx(tmp_path):
+    path = tmp_path / "source.docx"
+    doc = Document()
+    doc.add_paragraph("Original text")
+    doc.save(path)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestSaveDocxToBuffer:
+    def test_only_document_part_is_rewritten(self, source_docx):
+        """Test that untouched zip entries are copied byte for byte."""
+        doc = Document(source_docx)
+        doc.paragraphs[0].add_run(" and more")
+
+        output = save_docx_to_buffer(doc, source_docx)
+
+        with zipfile.ZipFile(source_docx) as source, zipfile.ZipFile(output) as written:
+            assert source.namelist() == written.namelist()
+            changed = [
+                name for name in source.namelist() if source.read(name) != written.read(name)
+            ]
+        assert changed == ["word/document.xml"]
+
+    def test_output_is_a_valid_document(self, source_docx):
+        """Test that the buffer opens with the edits applied."""
+        doc = Document(source_docx)
+        doc.paragraphs[0].add_run(" and more")
+
+        output = save_docx_to_buffer(doc, source_docx)
+
+        assert Document(output).paragraphs[0].text == "Original text and more"
+
+    def test_accepts_file_objects(self, source_docx):
+        """Test that the source can be an already opened file."""
+        doc = Document(source_docx)
+        with open(source_docx, "rb") as source_file:
+            source_file.read()
+            output = save_docx_to_buffer(doc, source_file)
+
+        assert Document(output).paragraphs[0].text == "Original text"
+
+    def test_retargeted_relationship_is_rewritten(self, tmp_path):
+        """Test that the rels part is rewritten when a relationship changes but the count doesn't."""
+        path = tmp_path / "linked.docx"
+        doc = Document()
+        doc.add_paragraph("Portfolio")
+        old_rId = doc.part.relate_to("https://old.example", RT.HYPERLINK, is_external=True)
+        doc.save(path)
+
+        doc = Document(path)
+        rel_count = len(doc.part.rels)
+        doc.part.drop_rel(old_rId)
+        new_rId = doc.part.relate_to("https://new.example", RT.HYPERLINK, is_external=True)
+        assert len(doc.part.rels) == rel_count
+
+        output = save_docx_to_buffer(doc, str(path))
+
+        with zipfile.ZipFile(output) as written:
+            targets = get_relationship_targets(written.read(DOCUMENT_RELS_NAME))
+        assert targets[new_rId] == "https://new.example"
+        assert "https://old.example" not in targets.values()
@@ -0,0 +1,134 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from google.api_core.exceptions import NotFound, NotModified
+
+from firebase.file_cache import LocalFileCache
+
+
+def make_blob(contents=b"docx bytes", generation="1"):
+    """Mock blob whose downloads write contents, or 304 on a matching generation, as google-cloud-storage does."""
+    blob = Mock()
+    blob.name = "resumes/user/resume.docx"
+    blob.generation = generation
+
+    def download_to_filename(filename, **kwargs):
+        if kwargs.get("if_generation_not_match") == int(generation):
+            raise NotModified("not modified")
+        with open(filename, "wb") as f:
+            f.write(contents)
+
+    blob.download_to_filename.side_effect = download_to_filename
+    return blob
+
+
+@pytest.mark.unit
+class TestLocalFileCache:
+    def test_reupload_under_the_same_name_is_downloaded(self, tmp_path):
+        """Test that a file overwritten by another instance is fetched again right away."""
+        cache = LocalFileCache()
+        output_path = str(tmp_path / "user" / "resume.docx")
+        cache.fetch(make_blob(b"old resume", generation="1"), output_path)
+
+        reuploaded = make_blob(b"new resume", generation="2")
+        cache.fetch(reuploaded, output_path)
+
+        assert reuploaded.download_to_filename.call_args.kwargs == {
+            "if_generation_not_match": 1
+        }
+        assert cache.entries[output_path].generation == "2"
+        with open(output_path, "rb") as f:
+            assert f.read() == b"new resume"
+
+    def test_cached_files_use_conditional_get(self, tmp_path):
+        """Test that every fetch of a cached file revalidates it against its generation."""
+        cache = LocalFileCache()
+        blob = make_blob(generation="7")
+        output_path = str(tmp_path / "resume.docx")
+        cache.fetch(blob, output_path)
+
+        blob.download_to_filename.side_effect = NotModified("not modified")
+        assert cache.fetch(blob, output_path) == output_path
+
+        assert blob.download_to_filename.call_args.kwargs == {
+            "if_generation_not_match": 7
+        }
+        with open(output_path, "rb") as f:
+            assert f.read() == b"docx bytes"
+
+    def test_missing_blob_raises_file_not_found(self, tmp_path):
+        """Test that a missing blob surfaces as FileNotFoundError."""
+        blob = make_blob()
+        blob.download_to_filename.side_effect = NotFound("missing")
+
+        with pytest.raises(FileNotFoundError):
+            LocalFileCache().fetch(blob, str(tmp_path / "resume.docx"))
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest file is evicted once the size cap is exceeded."""
+        # No in use window, so no file counts as still being read by its caller
+        cache = LocalFileCache(max_bytes=25, in_use_seconds=0)
+        paths = [str(tmp_path / f"resume_{idx}.docx") for idx in range(3)]
+
+        cache.fetch(make_blob(b"a" * 10), paths[0])
+        cache.fetch(make_blob(b"b" * 10), paths[1])
+        cache.fetch(make_blob(b"c" * 10), paths[0])
+        cache.fetch(make_blob(b"d" * 10), paths[2])
+
+        assert list(cache.entries) == [paths[0], paths[2]]
+        assert cache.total_bytes == 20
+        assert not (tmp_path / "resume_1.docx").exists()
+
+    def test_recently_returned_files_are_not_evicted(self, tmp_path):
+        """Test that a file handed out within the in use window survives going over the cap."""
+        cache = LocalFileCache(max_bytes=15)
+        paths = [str(tmp_path / f"resume_{idx}.docx") for idx in range(2)]
+
+        cache.fetch(make_blob(b"a" * 10), paths[0])
+        cache.fetch(make_blob(b"b" * 10), paths[1])
+
+        assert list(cache.entries) == paths
+        assert (tmp_path / "resume_0.docx").exists()
+
+        cache.entries[paths[0]].returned_at -= cache.in_use_seconds
+        cache.fetch(make_blob(b"c" * 10), str(tmp_path / "resume_2.docx"))
+        assert not (tmp_path / "resume_0.docx").exists()
+
+    def test_locks_do_not_grow_with_paths(self, tmp_path):
+        """Test that fetching many paths reuses the fixed pool of locks."""
+        cache = LocalFileCache(lock_stripes=4)
+
+        for idx in range(20):
+            cache.fetch(make_blob(), str(tmp_path / f"resume_{idx}.docx"))
+
+        assert len(cache.path_locks) == 4
+
+    def test_concurrent_fetches_download_once(self, tmp_path):
+        """Test that concurrent requests for one file download it once and revalidate after."""
+        cache = LocalFileCache()
+        blob = make_blob()
+        download = blob.download_to_filename.side_effect
+
+        def slow_download(filename, **kwargs):
+            time.sleep(0.05)
+            download(filename, **kwargs)
+
+        blob.download_to_filename.side_effect = slow_download
+        output_path = str(tmp_path / "resume.docx")
+        threads = [
+            threading.Thread(target=cache.fetch, args=(blob, output_path))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        full_downloads = [
+            call
+            for call in blob.download_to_filename.call_args_list
+            if "if_generation_not_match" not in call.kwargs
+        ]
+        assert len(full_downloads) == 1
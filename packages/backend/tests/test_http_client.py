@@ -0,0 +1,100 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+
+@pytest.fixture
+def http_client(import_with_env):
+    return import_with_env("linkedin_fetching.http_client")
+
+
+def make_response(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@pytest.mark.unit
+class TestPooledHttpClient:
+    def test_retries_through_the_next_proxy(self, http_client):
+        """Test that 429/5xx responses are retried, rotating proxies each attempt."""
+        client = http_client.PooledHttpClient(
+            proxy_urls=["http://proxy-a", "http://proxy-b"], backoff_base_seconds=0
+        )
+        client.session.get = Mock(
+            side_effect=[make_response(429), make_response(503), make_response(200)]
+        )
+
+        response = client.get("https://www.linkedin.com/jobs/view/1/")
+
+        assert response.status_code == 200
+        proxies = [call.kwargs["proxies"]["https"] for call in client.session.get.call_args_list]
+        assert proxies == ["http://proxy-a", "http://proxy-b", "http://proxy-a"]
+        assert client.session.get.call_args.kwargs["timeout"] == http_client.TIMEOUT_SECONDS
+
+    def test_returns_last_response_when_retries_run_out(self, http_client):
+        """Test that a persistent 429 is returned for the caller to handle."""
+        client = http_client.PooledHttpClient(max_attempts=2, backoff_base_seconds=0)
+        client.session.get = Mock(return_value=make_response(429))
+
+        assert client.get("https://www.linkedin.com/").status_code == 429
+        assert client.session.get.call_count == 2
+        assert client.session.get.call_args.kwargs["proxies"] == {}
+
+    def test_other_errors_are_not_retried(self, http_client):
+        """Test that a 404 is returned straight away."""
+        client = http_client.PooledHttpClient(backoff_base_seconds=0)
+        client.session.get = Mock(return_value=make_response(404))
+
+        assert client.get("https://www.linkedin.com/").status_code == 404
+        assert client.session.get.call_count == 1
+
+    def test_connection_errors_raise_after_retries(self, http_client):
+        """Test that connection errors are retried, then raised."""
+        client = http_client.PooledHttpClient(backoff_base_seconds=0)
+        client.session.get = Mock(side_effect=requests.ConnectionError("reset"))
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://www.linkedin.com/")
+        assert client.session.get.call_count == http_client.MAX_ATTEMPTS
+
+    def test_backoff_respects_retry_after(self, http_client):
+        """Test that a Retry-After header sets the minimum backoff."""
+        client = http_client.PooledHttpClient(backoff_base_seconds=0)
+
+        backoff = client.get_backoff_seconds(0, make_response(429, {"Retry-After": "3"}))
+
+        assert backoff == 3
+
+    def test_limits_concurrent_requests_per_host(self, http_client):
+        """Test that no more than the per host limit run at once."""
+        client = http_client.PooledHttpClient(max_concurrent_per_host=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return make_response(200)
+
+        client.session.get = slow_get
+        threads = [
+            threading.Thread(target=client.get, args=("https://www.linkedin.com/",))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
@@ -0,0 +1,196 @@
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def saver_module(import_with_env):
+    return import_with_env("functions.save_filled_values_helper.input_saver")
+
+
+class FakeClassifications(list):
+    def model_dump_json(self):
+        return "[]"
+
+
+@pytest.fixture
+def fake_db(saver_module, monkeypatch):
+    """Replace the realtime db writes with a dict of path -> value."""
+    stored = {}
+
+    def update(user_id, values):
+        stored.update(values)
+
+    def set_if_missing(user_id, path, value):
+        return stored.setdefault(path, value)
+
+    update_mock = Mock(side_effect=update)
+    monkeypatch.setattr(saver_module, "update_user_autofill_values", update_mock)
+    monkeypatch.setattr(
+        saver_module, "set_user_autofill_value_if_missing", set_if_missing
+    )
+    return stored, update_mock
+
+
+@pytest.fixture
+def save_with_instructions(saver_module, fake_db, monkeypatch):
+    """Run save_input_values with handlers returning the given instructions and a dict for the db."""
+    stored, update_mock = fake_db
+
+    def save(instructions):
+        classified = Mock(category="test")
+        monkeypatch.setattr(
+            saver_module,
+            "get_input_classifications",
+            lambda inputs: FakeClassifications([classified]),
+        )
+        handler = Mock()
+        handler.save_filled_value.return_value = instructions
+        monkeypatch.setattr(
+            saver_module, "CategoryHandlers", lambda data: {"test": handler}
+        )
+        return saver_module.save_input_values("user", [])
+
+    save.stored = stored
+    save.update_mock = update_mock
+    return save
+
+
+@pytest.fixture
+def save_answers(saver_module, fake_db, monkeypatch):
+    """Run save_input_values through the real category handlers for (category, type, label, value)."""
+    from functions.inputs_autofill_helper.autofill_schema import ClassifiedInput
+
+    stored, _ = fake_db
+
+    def save(answers):
+        classified = FakeClassifications(
+            ClassifiedInput(
+                id=str(idx),
+                label=label,
+                fieldType=field_type,
+                value=value,
+                category=category,
+                classification_score=1,
+            )
+            for idx, (category, field_type, label, value) in enumerate(answers)
+        )
+        monkeypatch.setattr(
+            saver_module, "get_input_classifications", lambda inputs: classified
+        )
+        return saver_module.save_input_values("user", [])
+
+    save.stored = stored
+    return save
+
+
+@pytest.mark.unit
+class TestGetChangedPaths:
+    def test_later_overwrites_win(self, saver_module):
+        """Test that the last plain write to a path is kept."""
+        overwrites, writes_if_missing = saver_module.get_changed_paths(
+            [
+                {"path": "name/first_name", "value": "Jo"},
+                {"path": "name/first_name", "value": "John"},
+            ]
+        )
+        assert overwrites == {"name/first_name": "John"}
+        assert writes_if_missing == {}
+
+    def test_dont_overwrite_existing_never_replaces_an_earlier_write(
+        self, saver_module
+    ):
+        """Test that a dont_overwrite_existing write loses to any earlier write to its path."""
+        def keep(path, value):
+            return {"path": path, "value": value, "dont_overwrite_existing": True}
+
+        overwrites, writes_if_missing = saver_module.get_changed_paths(
+            [
+                {"path": "veteran", "value": "protected_veteran"},
+                keep("veteran", "not_veteran"),
+                keep("disability", "enabled"),
+                keep("disability", "disabled"),
+            ]
+        )
+        assert overwrites == {"veteran": "protected_veteran"}
+        assert writes_if_missing == {"disability": "enabled"}
+
+    def test_values_are_converted(self, saver_module):
+        """Test that configured type conversions are applied to changed values."""
+        overwrites, _ = saver_module.get_changed_paths(
+            [{"path": "phone/phoneNum", "value": "5551234"}]
+        )
+        assert overwrites == {"phone/phoneNum": 5551234}
+
+
+@pytest.mark.unit
+class TestSaveInputValues:
+    def test_changed_leaves_are_written_in_one_update(self, save_with_instructions):
+        """Test that all plain writes go out as a single multi-path update."""
+        saved = save_with_instructions(
+            [
+                {"path": "name/first_name", "value": "John"},
+                {"path": "name/last_name", "value": "Doe"},
+            ]
+        )
+
+        save_with_instructions.update_mock.assert_called_once_with(
+            "user", {"name/first_name": "John", "name/last_name": "Doe"}
+        )
+        assert saved == {"name": {"first_name": "John", "last_name": "Doe"}}
+
+    def test_existing_values_are_kept_for_dont_overwrite_existing(
+        self, save_with_instructions
+    ):
+        """Test that a conditional write leaves a stored value alone and reports it."""
+        save_with_instructions.stored["disability"] = "disabled"
+
+        saved = save_with_instructions(
+            [
+                {
+                    "path": "disability",
+                    "value": "enabled",
+                    "dont_overwrite_existing": True,
+                }
+            ]
+        )
+
+        assert save_with_instructions.stored["disability"] == "disabled"
+        assert saved == {"disability": "disabled"}
+        save_with_instructions.update_mock.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSavedAnswers:
+    def test_changed_enum_answer_replaces_the_stored_one(self, save_answers):
+        """Test that picking a different option for an enum category updates the saved value."""
+        from functions.inputs_autofill_helper.autofill_schema import (
+            FieldType,
+            InputType,
+        )
+
+        save_answers.stored["veteran"] = "protected_veteran"
+
+        saved = save_answers(
+            [(InputType.VETERAN, FieldType.SELECT, "Veteran status", "I am not a veteran")]
+        )
+
+        assert save_answers.stored["veteran"] == "not_veteran"
+        assert saved == {"veteran": "not_veteran"}
+
+    def test_names_split_from_a_full_name_are_only_written_if_missing(
+        self, save_answers
+    ):
+        """Test that names inferred from a full name don't replace stored names."""
+        from functions.inputs_autofill_helper.autofill_schema import (
+            FieldType,
+            InputType,
+        )
+
+        save_answers.stored["name/first_name"] = "Johnny"
+
+        saved = save_answers(
+            [(InputType.FULL_NAME, FieldType.TEXT, "Full name", "John Doe")]
+        )
+
+        assert saved == {"name": {"first_name": "Johnny", "last_name": "Doe"}}
@@ -0,0 +1,79 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def cache_module(import_with_env, monkeypatch):
+    """Import job_description_cache with the realtime db cache replaced by a dict."""
+    module = import_with_env("linkedin_fetching.job_description_cache")
+    store = {}
+
+    def cache_get_object(cache_id):
+        if cache_id not in store:
+            raise ValueError("Object not found in cache")
+        return store[cache_id]
+
+    monkeypatch.setattr(module, "cache_get_object", cache_get_object)
+    monkeypatch.setattr(
+        module,
+        "cache_set_object",
+        lambda cache_id, obj, expiry: store.update({cache_id: obj}),
+    )
+    module.store = store
+    return module
+
+
+@pytest.mark.unit
+class TestJobDescriptionCache:
+    def test_memory_hits_skip_fetching(self, cache_module):
+        """Test that a cached job is returned without fetching again."""
+        cache = cache_module.JobDescriptionCache()
+        fetch = Mock(return_value="**Role**")
+
+        assert cache.get_or_fetch("123", fetch) == "**Role**"
+        assert cache.get_or_fetch("123", fetch) == "**Role**"
+        assert fetch.call_count == 1
+
+    def test_shared_tier_is_used_across_instances(self, cache_module):
+        """Test that another instance's fetch is read from the realtime db."""
+        cache_module.JobDescriptionCache().get_or_fetch("123", lambda: "**Role**")
+        fetch = Mock()
+
+        assert cache_module.JobDescriptionCache().get_or_fetch("123", fetch) == "**Role**"
+        fetch.assert_not_called()
+
+    def test_expired_entries_are_fetched_again(self, cache_module):
+        """Test that entries older than the TTL are ignored in both tiers."""
+        cache_module.store["job_description_123"] = {
+            "fetched_at": time.time() - 60,
+            "markdown": "old",
+        }
+        cache = cache_module.JobDescriptionCache(ttl_seconds=30)
+
+        assert cache.get_or_fetch("123", lambda: "new") == "new"
+
+    def test_concurrent_misses_collapse(self, cache_module):
+        """Test that concurrent requests for one job share a single fetch."""
+        cache = cache_module.JobDescriptionCache()
+        fetch = Mock(side_effect=lambda: time.sleep(0.05) or "**Role**")
+        threads = [
+            threading.Thread(target=cache.get_or_fetch, args=("123", fetch))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetch.call_count == 1
+
+    def test_memory_tier_is_bounded(self, cache_module):
+        """Test that the least recently used job is dropped from memory."""
+        cache = cache_module.JobDescriptionCache(max_memory_entries=2)
+        for job_id in ["1", "2", "3"]:
+            cache.get_or_fetch(job_id, lambda: job_id)
+
+        assert list(cache.memory) == ["2", "3"]
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "linkedin")
+
+
+@pytest.fixture
+def parsing(import_with_env):
+    return import_with_env("linkedin_fetching.fetch_job_description")
+
+
+@pytest.fixture
+def job_page():
+    with open(os.path.join(FIXTURES_PATH, "job_4189842654.html")) as f:
+        return f.read()
+
+
+@pytest.mark.unit
+class TestParseJobDescription:
+    def test_fast_path_matches_beautifulsoup(self, parsing, job_page):
+        """Test that the lxml fragment parse returns the same blocks as the full soup parse."""
+        blocks = parsing.parse_job_description(job_page)
+
+        assert blocks == parsing.parse_job_description_with_soup(job_page)
+        assert ("heading", "Responsibilities:") in blocks
+        assert ("bullet", "Experience with Firebase and Kubernetes") in blocks
+        assert ("paragraph", "Hybrid, 3 days in office") in blocks
+
+    def test_fragment_ends_at_the_matching_div(self, parsing, job_page):
+        """Test that nested divs don't cut the fragment short."""
+        fragment = parsing.find_description_fragment(job_page)
+
+        assert fragment.startswith('<div class="show-more-less-html__markup')
+        assert fragment.rstrip().endswith("</p>\n          </div>")
+        assert "Show more" not in fragment
+
+    def test_missing_container_falls_back(self, parsing, monkeypatch):
+        """Test that pages without the container go through BeautifulSoup."""
+        with pytest.raises(parsing.DescriptionNotFound):
+            parsing.parse_job_description("<html><body><p>Sign in</p></body></html>")
+
+    def test_unclosed_container_falls_back(self, parsing, job_page):
+        """Test that a truncated page still parses through the fallback."""
+        truncated = job_page[: job_page.index("<p>Benefits")]
+
+        assert parsing.find_description_fragment(truncated) is None
+        assert parsing.parse_job_description(truncated) == (
+            parsing.parse_job_description_with_soup(truncated)
+        )
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "<p>Intro<ul><li>a</li><li>b</li></ul></p>",
+            "<p>one<p>two",
+            "<ul><li>a<li>b</ul>",
+            "<p><strong>Requirements:</strong><ul><li>Python</li></ul></p>",
+            "<p>Benefits<br>Health &amp; dental&nbsp;</p><!-- <p> -->",
+        ],
+    )
+    def test_malformed_fragments_match_beautifulsoup(self, parsing, body):
+        """Test that markup lxml would restructure still gives BeautifulSoup's blocks."""
+        fragment = f'<div class="show-more-less-html__markup">{body}</div>'
+
+        assert parsing.parse_job_description_fragment(fragment) == (
+            parsing.parse_job_description_with_soup(fragment)
+        )
+
+    def test_well_formed_fragment_skips_beautifulsoup(
+        self, parsing, job_page, monkeypatch
+    ):
+        """Test that a fragment lxml parses as written doesn't go through BeautifulSoup."""
+        expected = parsing.parse_job_description_with_soup(job_page)
+        monkeypatch.setattr(parsing, "parse_job_description_with_soup", None)
+
+        fragment = parsing.find_description_fragment(job_page)
+        assert parsing.parse_job_description_fragment(fragment) == expected
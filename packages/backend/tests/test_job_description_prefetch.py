@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def prefetch_module(import_with_env):
+    return import_with_env("linkedin_fetching.prefetch")
+
+
+@pytest.mark.unit
+class TestPrefetchJobDescription:
+    def test_fetch_finishing_within_the_wait_is_cached(
+        self, prefetch_module, monkeypatch
+    ):
+        """Test that a quick fetch reports the description as cached."""
+        fetched = []
+        monkeypatch.setattr(
+            prefetch_module, "fetch_job_description_markdown", fetched.append
+        )
+
+        status = prefetch_module.prefetch_job_description("https://job")
+
+        assert status == prefetch_module.PrefetchStatus.CACHED
+        assert fetched == ["https://job"]
+
+    def test_slow_fetch_keeps_running_in_the_background(
+        self, prefetch_module, monkeypatch
+    ):
+        """Test that a fetch outliving the wait is reported pending and still completes."""
+        release = threading.Event()
+        done = threading.Event()
+
+        def slow_fetch(url):
+            release.wait(2)
+            done.set()
+
+        monkeypatch.setattr(prefetch_module, "fetch_job_description_markdown", slow_fetch)
+
+        status = prefetch_module.prefetch_job_description(
+            "https://job", wait_seconds=0.05
+        )
+        assert status == prefetch_module.PrefetchStatus.PENDING
+
+        release.set()
+        assert done.wait(2)
+
+    def test_fetch_errors_within_the_wait_are_raised(
+        self, prefetch_module, monkeypatch
+    ):
+        """Test that a failed fetch surfaces its error to the caller."""
+        def blocked(url):
+            raise RuntimeError("blocked")
+
+        monkeypatch.setattr(prefetch_module, "fetch_job_description_markdown", blocked)
+
+        with pytest.raises(RuntimeError, match="blocked"):
+            prefetch_module.prefetch_job_description("https://job")
@@ -0,0 +1,153 @@
+import io
+import os
+import stat
+import sys
+
+import pytest
+
+from pdf_converters.libreoffice_converter import LibreOfficeConverter
+
+
+def make_fake_unoserver(tmp_path, convert_body="return Binary(b'%PDF-' + indata.data)"):
+    """Write a script standing in for unoserver, an XML-RPC server started with unoserver's arguments."""
+    starts_path = tmp_path / "starts"
+    script = tmp_path / "unoserver"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import argparse, os, time\n"
+        "from xmlrpc.client import Binary\n"
+        "from xmlrpc.server import SimpleXMLRPCServer\n"
+        "parser = argparse.ArgumentParser()\n"
+        "parser.add_argument('--port', type=int)\n"
+        "args, _ = parser.parse_known_args()\n"
+        f"with open({str(starts_path)!r}, 'a') as f:\n"
+        "    f.write(f'{os.getpid()}\\n')\n"
+        "server = SimpleXMLRPCServer(('127.0.0.1', args.port), logRequests=False, allow_none=True)\n"
+        "server.register_function(lambda: {}, 'info')\n"
+        "def convert(inpath, indata, outpath, convert_to):\n"
+        f"    {convert_body}\n"
+        "server.register_function(convert, 'convert')\n"
+        "server.serve_forever()\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script), starts_path
+
+
+def make_converter(tmp_path, unoserver, **kwargs):
+    converter = LibreOfficeConverter(
+        unoserver_path=unoserver,
+        profile_root=str(tmp_path / "profiles"),
+        startup_timeout_seconds=10,
+        **{"pool_size": 1, **kwargs},
+    )
+    return converter
+
+
+def get_starts(starts_path) -> list[str]:
+    return starts_path.read_text().split()
+
+
+@pytest.mark.unit
+class TestLibreOfficeConverter:
+    def test_returns_pdf_bytes(self, tmp_path):
+        """Test that the converted file's bytes are returned directly."""
+        unoserver, _ = make_fake_unoserver(tmp_path)
+        converter = make_converter(tmp_path, unoserver, pool_size=2)
+
+        converted = converter.convert(io.BytesIO(b"docx"))
+        converter.close()
+
+        assert converted.data == b"%PDF-docx"
+        assert converted.url is None
+
+    def test_conversions_reuse_the_resident_process(self, tmp_path):
+        """Test that a worker converts every job through the one listener it started."""
+        unoserver, starts_path = make_fake_unoserver(tmp_path)
+        converter = make_converter(tmp_path, unoserver)
+
+        for idx in range(3):
+            assert converter.convert(io.BytesIO(b"%d" % idx)).data == b"%%PDF-%d" % idx
+        converter.close()
+
+        assert len(get_starts(starts_path)) == 1
+
+    def test_exited_listener_is_restarted(self, tmp_path):
+        """Test that a listener that died is started again for the next job."""
+        unoserver, starts_path = make_fake_unoserver(tmp_path)
+        converter = make_converter(tmp_path, unoserver)
+        converter.convert(io.BytesIO(b"docx"))
+
+        converter.listeners[0].process.kill()
+        converter.listeners[0].process.wait()
+
+        assert converter.convert(io.BytesIO(b"docx")).data == b"%PDF-docx"
+        converter.close()
+        assert len(get_starts(starts_path)) == 2
+
+    def test_timeout_kills_conversion(self, tmp_path):
+        """Test that conversions running past the timeout fail and stop their listener."""
+        unoserver, _ = make_fake_unoserver(
+            tmp_path,
+            "time.sleep(5) if indata.data == b'slow' else None; return Binary(b'%PDF-')",
+        )
+        converter = make_converter(tmp_path, unoserver, timeout_seconds=0.5)
+        converter.convert(io.BytesIO(b"docx"))
+        process = converter.listeners[0].process
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            converter.convert(io.BytesIO(b"slow"))
+
+        assert process.poll() is not None
+        assert converter.listeners[0].process is None
+
+    def test_failed_conversion_raises(self, tmp_path):
+        """Test that a conversion error in the listener surfaces its message."""
+        unoserver, _ = make_fake_unoserver(
+            tmp_path,
+            "raise ValueError('broken') if indata.data == b'bad' else None; return Binary(b'%PDF-')",
+        )
+        converter = make_converter(tmp_path, unoserver)
+
+        with pytest.raises(RuntimeError, match="broken"):
+            converter.convert(io.BytesIO(b"bad"))
+        converter.close()
+
+    def test_listener_failing_to_start_raises(self, tmp_path):
+        """Test that a listener exiting on startup fails the job instead of hanging."""
+        converter = make_converter(tmp_path, "/bin/false")
+
+        with pytest.raises(RuntimeError, match="exited on startup"):
+            converter.convert(io.BytesIO(b"docx"))
+
+    def test_backed_up_queue_fails_instead_of_blocking(self, tmp_path):
+        """Test that a request gives up once the queue wait plus the conversion timeout passes."""
+        converter = LibreOfficeConverter(
+            pool_size=1,
+            timeout_seconds=0.1,
+            queue_timeout_seconds=0.1,
+            profile_root=str(tmp_path / "profiles"),
+        )
+        # Every worker busy, so nothing picks up the job
+        converter.workers = [None]
+
+        with pytest.raises(RuntimeError, match="backed up"):
+            converter.convert(io.BytesIO(b"docx"))
+
+        _, result = converter.jobs.get_nowait()
+        assert result.cancelled()
+
+    def test_stop_tolerates_an_already_exited_listener(self, tmp_path, monkeypatch):
+        """Test that a listener gone before the kill still stops cleanly."""
+        unoserver, _ = make_fake_unoserver(tmp_path)
+        converter = make_converter(tmp_path, unoserver)
+        converter.convert(io.BytesIO(b"docx"))
+        kill_process_group = os.killpg
+
+        def killpg_after_exit(pid, sig):
+            kill_process_group(pid, sig)
+            raise ProcessLookupError()
+
+        monkeypatch.setattr(os, "killpg", killpg_after_exit)
+
+        converter.close()
+        assert converter.listeners[0].process is None
@@ -0,0 +1,59 @@
+import itertools
+
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+from docx_functions.modifications import merge_identical_runs
+
+
+@pytest.fixture
+def doc():
+    doc = Document()
+    doc.styles.add_style("Emphasis Run", WD_STYLE_TYPE.CHARACTER)
+    return doc
+
+
+@pytest.mark.unit
+class TestMergeIdenticalRuns:
+    def test_runs_with_the_same_style_merge(self, doc):
+        """Test that adjacent runs only merge when their character style and formatting match."""
+        para = doc.add_paragraph()
+        para.add_run("Built ")
+        para.add_run("data ")
+        para.add_run("pipelines", style="Emphasis Run")
+        para.add_run(" for", style="Emphasis Run")
+        para.add_run(" analytics").bold = True
+
+        merge_identical_runs(para)
+
+        assert [run.text for run in para.runs] == [
+            "Built data ",
+            "pipelines for",
+            " analytics",
+        ]
+
+    def test_groups_runs_like_run_style_names(self, doc):
+        """Test that keying runs on their style id merges the same runs as keying on run.style.name."""
+        default_style = doc.styles.default(WD_STYLE_TYPE.CHARACTER)
+        para = doc.add_paragraph()
+        para.add_run("no style ")
+        para.add_run("explicit default ")._r.style = default_style.style_id
+        para.add_run("explicit default again ")._r.style = default_style.style_id
+        para.add_run("unknown style ")._r.style = "MissingStyle"
+        para.add_run("emphasis ", style="Emphasis Run")
+        para.add_run("emphasis bold", style="Emphasis Run").bold = True
+
+        def style_name_key(run):
+            rPr = run._r.rPr
+            return (run.style.name or "", rPr.xml if rPr is not None else "")
+
+        expected = [
+            "".join(run.text for run in group)
+            for _, group in itertools.groupby(para.runs, key=style_name_key)
+        ]
+
+        merge_identical_runs(para)
+
+        assert [run.text for run in para.runs] == expected
+        assert len(expected) == 5
@@ -0,0 +1,154 @@
+import base64
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+class FakeReference:
+    """The slice of firebase_admin.db.Reference the object cache uses, over a dict."""
+
+    def __init__(self, store: dict, path: str):
+        self.store = store
+        self.path = path
+        self.params = {}
+
+    def set(self, value):
+        self.store[self.path] = value
+
+    def get(self):
+        if self.path in self.store:
+            return self.store[self.path]
+        prefix = f"{self.path}/"
+        children = {
+            key[len(prefix) :]: value
+            for key, value in self.store.items()
+            if key.startswith(prefix)
+        }
+        return self.query(children) if self.params else children or None
+
+    def update(self, values: dict):
+        for key, value in values.items():
+            if value is None:
+                self.store.pop(f"{self.path}/{key}", None)
+            else:
+                self.store[f"{self.path}/{key}"] = value
+
+    def order_by_child(self, child):
+        self.params["order_by"] = child
+        return self
+
+    def start_at(self, value):
+        self.params["start_at"] = value
+        return self
+
+    def end_at(self, value):
+        self.params["end_at"] = value
+        return self
+
+    def limit_to_first(self, limit):
+        self.params["limit"] = limit
+        return self
+
+    def query(self, children: dict) -> dict:
+        child = self.params["order_by"]
+        matching = [
+            (value[child], key)
+            for key, value in children.items()
+            if isinstance(value.get(child), str)
+            and self.params["start_at"] <= value[child] <= self.params["end_at"]
+        ]
+        first = sorted(matching)[: self.params["limit"]]
+        return {key: children[key] for _, key in first}
+
+
+class FakeDb:
+    def __init__(self):
+        self.store = {}
+        self.updates = 0
+
+    def reference(self, path):
+        reference = FakeReference(self.store, path)
+        original_update = reference.update
+
+        def counted_update(values):
+            self.updates += 1
+            original_update(values)
+
+        reference.update = counted_update
+        return reference
+
+
+@pytest.fixture
+def cache_module(import_with_env, monkeypatch):
+    module = import_with_env("firebase.object_cache")
+    fake_db = FakeDb()
+    monkeypatch.setattr(module, "db", fake_db)
+    module.fake_db = fake_db
+    return module
+
+
+def expiry_in(seconds: float) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return moment.replace(tzinfo=None).isoformat()
+
+
+@pytest.mark.unit
+class TestObjectCache:
+    def test_round_trip(self, cache_module):
+        """Test that a cached object is returned unchanged."""
+        cache_module.cache_set_object("chat", {"chat_history": ["hi"]}, 60)
+        assert cache_module.cache_get_object("chat") == {"chat_history": ["hi"]}
+
+    def test_payloads_are_compressed(self, cache_module):
+        """Test that repetitive payloads are stored compressed."""
+        obj = {"markdown": "Responsibilities " * 1000}
+        cache_module.cache_set_object("job", obj, 60)
+
+        stored = cache_module.fake_db.store["cache/job"]
+        assert stored["encoding"] == "zlib"
+        assert len(stored["object"]) < len(base64.b64encode(pickle.dumps(obj))) / 10
+
+    def test_uncompressed_entries_are_still_read(self, cache_module):
+        """Test that entries written before compression decode as plain pickles."""
+        cache_module.fake_db.store["cache/legacy"] = {
+            "object": base64.b64encode(pickle.dumps([1, 2])).decode("utf-8"),
+            "expiresAt": expiry_in(60),
+        }
+        assert cache_module.cache_get_object("legacy") == [1, 2]
+
+    def test_expired_entries_are_missing(self, cache_module):
+        """Test that reads enforce expiresAt."""
+        cache_module.cache_set_object("stale", "value", -1)
+        with pytest.raises(ValueError):
+            cache_module.cache_get_object("stale")
+
+    def test_missing_entries_raise(self, cache_module):
+        """Test that a missing id raises ValueError like it always has."""
+        with pytest.raises(ValueError):
+            cache_module.cache_get_object("missing")
+
+
+@pytest.mark.unit
+class TestSweepExpiredCacheEntries:
+    def test_only_expired_entries_are_deleted_in_batches(self, cache_module):
+        """Test that expired entries are deleted a batch per update and live ones kept."""
+        for idx in range(5):
+            cache_module.cache_set_object(f"expired_{idx}", idx, -10 - idx)
+        cache_module.cache_set_object("live", "value", 60)
+
+        deleted = cache_module.sweep_expired_cache_entries(batch_size=2)
+
+        assert deleted == 5
+        assert cache_module.fake_db.updates == 3
+        assert list(cache_module.fake_db.store) == ["cache/live"]
+
+    def test_max_batches_bounds_a_sweep(self, cache_module):
+        """Test that one sweep stops after max_batches."""
+        for idx in range(5):
+            cache_module.cache_set_object(f"expired_{idx}", idx, -10)
+
+        deleted = cache_module.sweep_expired_cache_entries(batch_size=2, max_batches=1)
+
+        assert deleted == 2
+        assert len(cache_module.fake_db.store) == 3
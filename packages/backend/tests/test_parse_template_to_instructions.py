@@ -0,0 +1,109 @@
+import pytest
+
+
+USER_DATA = {
+    "name": {"first_name": "Jo", "last_name": "Doe"},
+    "veteran": "not_veteran",
+    "website": False,
+    "graduation_year": 2026,
+}
+
+
+@pytest.fixture
+def templates(import_with_env):
+    return import_with_env(
+        "functions.inputs_autofill_helper.parse_template_to_instructions"
+    )
+
+
+def get_schema(instructions):
+    from functions.inputs_autofill_helper.gemini_generation import (
+        AutofillResponseSchema,
+    )
+
+    return AutofillResponseSchema.model_validate(
+        {
+            "autofill_instructions": [
+                {"initialLabel": "", "input_id": input_id, "valuePathString": value}
+                for input_id, value in instructions
+            ]
+        }
+    )
+
+
+def if_expression(path, value, truthy, falsy):
+    return {
+        "condition": {"valuePathString": path, "value": value},
+        "truthyValuePathString": truthy,
+        "falsyValuePathString": falsy,
+    }
+
+
+@pytest.mark.unit
+class TestValuePathTemplates:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("{name/first_name} {name/last_name}", "Jo Doe"),
+            ("Class of {graduation_year}", "Class of 2026"),
+            ("{name/middle_name}{name/first_name}", "Jo"),
+            ("{website}", False),
+            ("{name/first_name} {true}", True),
+            ("{FREE_RESPONSE}", "<FREE_RESPONSE>"),
+            ("gabaabagoo", ""),
+            ("{name}", ""),
+            ("{veteran/branch}", "not_veteran"),
+            ("", ""),
+        ],
+    )
+    def test_evaluates_like_nested_lookups(self, templates, path, expected):
+        """Test that compiled templates resolve lookups, literals and specials as before."""
+        assert templates.get_value_from_path(path, USER_DATA) == expected
+
+    def test_paths_are_parsed_once(self, templates):
+        """Test that the same value path string reuses its compiled template."""
+        first = templates.compile_value_path_template("{name/first_name}!")
+        assert templates.compile_value_path_template("{name/first_name}!") is first
+
+
+@pytest.mark.unit
+class TestMapAutofillTemplateToInstructions:
+    def test_instructions_are_evaluated_with_their_input_labels(self, templates):
+        """Test that each instruction gets its value and the label of the input with its id."""
+        schema = get_schema(
+            [
+                ("2", "{name/first_name}"),
+                ("1", if_expression("{veteran}", "not_veteran", "{false}", "{true}")),
+                ("3", if_expression("{veteran}", "protected", "Yes", "No")),
+                ("missing", "{name/last_name}"),
+            ]
+        )
+        inputs = [
+            {"id": "1", "label": "Are you a veteran?"},
+            {"id": "2", "label": "First name"},
+            {"id": "2", "label": "Duplicate id"},
+            {"id": "3", "label": "Veteran status"},
+        ]
+
+        instructions = templates.map_autofill_template_to_instructions(
+            schema, USER_DATA, inputs
+        )
+
+        assert instructions == [
+            {"input_id": "2", "value": "Jo", "input_text": "First name"},
+            {"input_id": "1", "value": False, "input_text": "Are you a veteran?"},
+            {"input_id": "3", "value": "No", "input_text": "Veteran status"},
+            {"input_id": "missing", "value": "Doe", "input_text": None},
+        ]
+
+    def test_missing_user_data_fills_nothing(self, templates):
+        """Test that a user without autofill data gets empty values rather than an error."""
+        schema = get_schema([("1", "{name/first_name}")])
+
+        instructions = templates.map_autofill_template_to_instructions(
+            schema, None, [{"id": "1", "label": "First name"}]
+        )
+
+        assert instructions == [
+            {"input_id": "1", "value": "", "input_text": "First name"}
+        ]
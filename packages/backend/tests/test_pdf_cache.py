@@ -0,0 +1,76 @@
+import io
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from pdf_converters.base_converter import ConvertedPdf
+
+
+@pytest.fixture
+def pdf_cache(import_with_env, monkeypatch):
+    """Import pdf_cache with conversion and storage mocked out."""
+    module = import_with_env("pdf_cache")
+    monkeypatch.setattr(module, "get_cached_pdf_url", Mock(return_value=None))
+    monkeypatch.setattr(
+        module, "upload_pdf_to_cache", Mock(side_effect=lambda url, h: f"cached/{h}")
+    )
+    converter = Mock()
+    converter.convert.return_value = ConvertedPdf(url="https://converted")
+    monkeypatch.setattr(module, "get_pdf_converter", Mock(return_value=converter))
+    module.converter = converter
+    return module
+
+
+@pytest.mark.unit
+class TestGetOrConvertPdfUrl:
+    def test_cache_hit_skips_conversion(self, pdf_cache):
+        """Test that a cached hash returns its URL without converting."""
+        pdf_cache.get_cached_pdf_url.return_value = "https://cached"
+
+        assert pdf_cache.get_or_convert_pdf_url(io.BytesIO(b"docx")) == "https://cached"
+        pdf_cache.converter.convert.assert_not_called()
+
+    def test_same_bytes_share_a_cache_key(self, pdf_cache, tmp_path):
+        """Test that files and buffers with the same bytes hash to the same key."""
+        path = tmp_path / "resume.docx"
+        path.write_bytes(b"docx")
+        buffer = io.BytesIO(b"docx")
+        buffer.read()
+
+        assert pdf_cache.get_docx_hash(str(path)) == pdf_cache.get_docx_hash(buffer)
+        assert buffer.tell() == 0
+
+    def test_concurrent_misses_convert_once(self, pdf_cache):
+        """Test that concurrent requests for one DOCX share a single conversion."""
+
+        def slow_convert(docx_input):
+            time.sleep(0.05)
+            return ConvertedPdf(url="https://converted")
+
+        pdf_cache.converter.convert.side_effect = slow_convert
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    pdf_cache.get_or_convert_pdf_url(io.BytesIO(b"docx"))
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pdf_cache.converter.convert.call_count == 1
+        assert len(set(results)) == 1 and results[0].startswith("cached/")
+
+    def test_local_pdf_bytes_are_uploaded(self, pdf_cache):
+        """Test that converters returning bytes have the bytes uploaded to the cache."""
+        pdf_cache.converter.convert.return_value = ConvertedPdf(data=b"%PDF")
+
+        pdf_cache.get_or_convert_pdf_url(io.BytesIO(b"docx"))
+
+        assert pdf_cache.upload_pdf_to_cache.call_args.args[0] == b"%PDF"
@@ -0,0 +1,96 @@
+import io
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def jobs(import_with_env, monkeypatch):
+    """Import pdf_conversion_jobs with the realtime db replaced by a dict."""
+    module = import_with_env("pdf_conversion_jobs")
+    store = {}
+    monkeypatch.setattr(
+        module, "set_pdf_conversion_job", lambda job_id, job: store.update({job_id: job})
+    )
+    monkeypatch.setattr(module, "get_pdf_conversion_job", store.get)
+    monkeypatch.setattr(module, "POLL_INTERVAL_SECONDS", 0.01)
+    module.store = store
+    return module
+
+
+@pytest.mark.unit
+class TestPdfConversionJobs:
+    def test_long_poll_returns_finished_job(self, jobs, monkeypatch):
+        """Test that a long poll waits for the background conversion."""
+        release = threading.Event()
+
+        def convert(docx_input):
+            release.wait(1)
+            return "https://cached.pdf"
+
+        monkeypatch.setattr(jobs, "get_or_convert_pdf_url", convert)
+        job_id = jobs.start_pdf_conversion(io.BytesIO(b"docx"))
+
+        assert jobs.get_pdf_conversion_status(job_id)["status"] == "pending"
+        release.set()
+        job = jobs.get_pdf_conversion_status(job_id, wait_seconds=5)
+
+        assert job["status"] == "done"
+        assert job["pdf_url"] == "https://cached.pdf"
+
+    def test_failed_conversion_is_reported(self, jobs, monkeypatch):
+        """Test that conversion errors are stored on the job."""
+        monkeypatch.setattr(
+            jobs, "get_or_convert_pdf_url", Mock(side_effect=RuntimeError("boom"))
+        )
+        job_id = jobs.start_pdf_conversion(io.BytesIO(b"docx"))
+
+        job = jobs.get_pdf_conversion_status(job_id, wait_seconds=5)
+
+        assert job["status"] == "error"
+        assert job["message"] == "boom"
+
+    def test_other_instances_poll_the_database(self, jobs):
+        """Test that jobs started elsewhere are read from the realtime db."""
+        jobs.store["remote"] = {"status": "done", "pdf_url": "https://remote.pdf"}
+
+        assert jobs.get_pdf_conversion_status("remote", wait_seconds=1)["pdf_url"] == (
+            "https://remote.pdf"
+        )
+        assert jobs.get_pdf_conversion_status("missing") is None
+
+    def test_stale_pending_job_is_reported_as_failed(self, jobs):
+        """Test that a job left pending by a stopped instance stops being pending."""
+        stale = datetime.now(timezone.utc) - timedelta(
+            seconds=jobs.STALE_PENDING_SECONDS + 1
+        )
+        jobs.store["stuck"] = {"status": "pending", "updatedAt": stale.isoformat()}
+        jobs.store["running"] = {
+            "status": "pending",
+            "updatedAt": datetime.now(timezone.utc).isoformat(),
+        }
+
+        assert jobs.get_pdf_conversion_status("stuck", wait_seconds=1)["status"] == (
+            "error"
+        )
+        assert jobs.get_pdf_conversion_status("running")["status"] == "pending"
+
+    def test_jobs_expire(self, jobs, monkeypatch):
+        """Test that pending and finished jobs are written with an expiry for the sweep."""
+        monkeypatch.setattr(jobs, "get_or_convert_pdf_url", lambda docx: "https://a.pdf")
+        job_id = jobs.start_pdf_conversion(io.BytesIO(b"docx"))
+        jobs.get_pdf_conversion_status(job_id, wait_seconds=5)
+
+        expires_at = datetime.fromisoformat(jobs.store[job_id]["expiresAt"])
+        retention = expires_at - datetime.now(timezone.utc).replace(tzinfo=None)
+        assert timedelta(0) < retention <= timedelta(seconds=jobs.JOB_RETENTION_SECONDS)
+
+    def test_sweep_deletes_from_the_jobs_node(self, jobs, monkeypatch):
+        """Test that the sweep targets the pdf_conversion_jobs node."""
+        sweep = Mock(return_value=3)
+        monkeypatch.setattr(jobs, "sweep_expired_entries", sweep)
+
+        assert jobs.sweep_expired_pdf_conversion_jobs() == 3
+        sweep.assert_called_once_with("pdf_conversion_jobs")
@@ -0,0 +1,84 @@
+import pytest
+
+
+PROFILE = {
+    "name": {"first_name": "Jo", "last_name": "Doe"},
+    "location": {"city": "seattle", "state": None},
+    "veteran": "not_veteran",
+    "website": False,
+}
+
+
+@pytest.fixture
+def profile_values(import_with_env):
+    return import_with_env("functions.inputs_autofill_helper.profile_values")
+
+
+@pytest.mark.unit
+class TestCompileValuePath:
+    def test_splits_into_keys(self, profile_values):
+        """Test that a value path becomes a tuple of its keys, ignoring stray slashes."""
+        assert profile_values.compile_value_path("name/first_name") == (
+            "name",
+            "first_name",
+        )
+        assert profile_values.compile_value_path("/veteran/") == ("veteran",)
+
+
+@pytest.mark.unit
+class TestFlattenAutofillData:
+    def test_leaves_and_nested_dicts_are_keyed_by_path(self, profile_values):
+        """Test that every leaf and nested dict is reachable with one lookup."""
+        flattened = profile_values.flatten_autofill_data(PROFILE)
+
+        assert flattened[("name", "first_name")] == "Jo"
+        assert flattened[("name",)] == PROFILE["name"]
+        assert flattened[("veteran",)] == "not_veteran"
+        assert flattened[("website",)] is False
+        assert flattened[("location", "state")] is None
+        assert ("location", "country") not in flattened
+
+    @pytest.mark.parametrize("data", [None, {}, "not a profile"])
+    def test_missing_profile_flattens_to_nothing(self, profile_values, data):
+        """Test that a user without autofill data has no values."""
+        assert profile_values.flatten_autofill_data(data) == {}
+
+
+@pytest.mark.unit
+class TestHandlersReadProfileValues:
+    def test_handlers_share_one_flattened_profile(self, import_with_env):
+        """Test that CategoryHandlers flattens the data once and hands it to each handler."""
+        get_handler = import_with_env(
+            "functions.inputs_autofill_helper.category_handlers.get_handler"
+        )
+        from functions.inputs_autofill_helper.autofill_schema import InputType
+
+        handlers = get_handler.CategoryHandlers(PROFILE)
+        first_name = handlers.get(InputType.FIRST_NAME)
+        veteran = handlers.get(InputType.VETERAN)
+
+        assert first_name.profile_values is handlers.profile_values
+        assert veteran.profile_values is handlers.profile_values
+        assert first_name._get_text() == "Jo"
+        assert veteran._autofill_value == "not_veteran"
+
+    def test_value_paths_are_compiled_per_class(self, import_with_env):
+        """Test that handlers reading one value have its keys compiled on the class."""
+        get_handler = import_with_env(
+            "functions.inputs_autofill_helper.category_handlers.get_handler"
+        )
+
+        for handler in get_handler.CATEGORY_HANDLERS.values():
+            if "VALUE_PATH" in vars(handler):
+                assert handler.VALUE_KEYS == tuple(handler.VALUE_PATH.split("/"))
+
+    def test_general_location_needs_city_and_state(self, import_with_env):
+        """Test that general location reads its parts from the flattened profile."""
+        get_handler = import_with_env(
+            "functions.inputs_autofill_helper.category_handlers.get_handler"
+        )
+        from functions.inputs_autofill_helper.autofill_schema import InputType
+
+        handler = get_handler.get_category_handler(InputType.GENERAL_LOCATION, PROFILE)
+        assert not handler.can_autofill_category()
+        assert handler._get_values()["city"] == "seattle"
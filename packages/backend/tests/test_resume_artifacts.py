@@ -0,0 +1,110 @@
+import pytest
+from docx import Document
+from docx.shared import Pt
+
+
+@pytest.fixture
+def artifacts(import_with_env, monkeypatch):
+    """Import resume_artifacts with the realtime db cache replaced by a dict."""
+    module = import_with_env("resume_artifacts")
+    store = {}
+
+    def cache_get_object(cache_id):
+        if cache_id not in store:
+            raise ValueError("Object not found in cache")
+        return store[cache_id]
+
+    monkeypatch.setattr(module, "cache_get_object", cache_get_object)
+    monkeypatch.setattr(
+        module,
+        "cache_set_object",
+        lambda cache_id, obj, expiry: store.update({cache_id: obj}),
+    )
+    module.store = store
+    return module
+
+
+@pytest.fixture
+def resume_path(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Jordan Example")
+    doc.add_heading("Experience", level=1)
+    company = doc.add_paragraph()
+    company.add_run("Company A").bold = True
+    company.add_run(" | Engineer")
+    for text in ["Built things", "Led things"]:
+        bullet = doc.add_paragraph(style="List Bullet")
+        bullet.add_run(text).font.size = Pt(10)
+        bullet.add_run(" quickly").font.size = Pt(10)
+    doc.add_heading("Skills", level=1)
+    doc.add_paragraph("Python, TypeScript")
+    path = tmp_path / "resume.docx"
+    doc.save(path)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestResumeArtifacts:
+    def test_cached_sections_match_a_full_parse(self, artifacts, resume_path):
+        """Test that sections rebuilt from the layout match parse_resume_for_sections."""
+        with open(resume_path, "rb") as f:
+            artifacts.prewarm_resume_artifacts(f.read())
+        assert len(artifacts.store) == 2
+
+        sections, _, sections_strings = artifacts.load_resume_sections(resume_path)
+        expected_sections, _ = artifacts.parse_resume_for_sections(resume_path)
+
+        assert sections_strings == artifacts.serialize_sections(expected_sections)
+        assert {
+            name: [(p.text, len(p.runs)) for p in paragraphs]
+            for name, paragraphs in sections.items()
+        } == {
+            name: [(p.text, len(p.runs)) for p in paragraphs]
+            for name, paragraphs in expected_sections.items()
+        }
+
+    def test_cache_miss_parses_and_caches(self, artifacts, resume_path, monkeypatch):
+        """Test that a resume that was never pre-warmed is parsed once, then cached."""
+        first = artifacts.load_raw_resume_markdown(resume_path)
+
+        monkeypatch.setitem(
+            artifacts.ARTIFACT_BUILDERS,
+            "markdown",
+            lambda docx_bytes: pytest.fail("artifacts should come from the cache"),
+        )
+        assert artifacts.load_raw_resume_markdown(resume_path) == first
+        assert "Built things" in first
+
+    def test_markdown_cache_miss_skips_segmentation(
+        self, artifacts, resume_path, monkeypatch
+    ):
+        """Test that a markdown-only cache miss builds and caches just the markdown."""
+        monkeypatch.setattr(
+            artifacts,
+            "parse_resume_for_sections",
+            lambda source: pytest.fail("markdown shouldn't segment the resume"),
+        )
+
+        markdown = artifacts.load_raw_resume_markdown(resume_path)
+
+        assert "Built things" in markdown
+        assert list(artifacts.store) == [
+            artifacts.get_resume_artifact_cache_id(
+                "markdown", artifacts.get_file_sha256(resume_path)
+            )
+        ]
+
+    def test_sections_cache_miss_leaves_markdown_unbuilt(
+        self, artifacts, resume_path, monkeypatch
+    ):
+        """Test that loading sections on a miss doesn't serialize the whole resume."""
+        monkeypatch.setattr(
+            artifacts,
+            "serialize_raw_docx",
+            lambda source: pytest.fail("sections shouldn't build the markdown"),
+        )
+
+        sections, _, _ = artifacts.load_resume_sections(resume_path)
+
+        assert "experience" in sections
+        assert len(artifacts.store) == 1
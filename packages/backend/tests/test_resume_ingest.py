@@ -0,0 +1,38 @@
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def ingest(import_with_env, monkeypatch):
+    module = import_with_env("resume_ingest")
+    module.artifacts_release = threading.Event()
+    module.artifacts_done = threading.Event()
+
+    def prewarm(docx_bytes):
+        module.artifacts_release.wait(5)
+        module.artifacts_done.set()
+        return "artifacts-id"
+
+    monkeypatch.setattr(module, "prewarm_resume_artifacts", prewarm)
+    monkeypatch.setattr(module, "start_pdf_conversion", lambda docx: "job-id")
+    monkeypatch.setattr(module, "get_or_convert_pdf_url", lambda docx: "https://a.pdf")
+    return module
+
+
+@pytest.mark.unit
+class TestIngestResume:
+    def test_async_pdf_returns_without_waiting_for_artifacts(self, ingest):
+        """Test that async ingest hands back the job id while artifacts are still parsing."""
+        assert ingest.ingest_resume(b"docx", async_pdf=True) == {"pdf_job_id": "job-id"}
+        assert not ingest.artifacts_done.is_set()
+
+        ingest.artifacts_release.set()
+        assert ingest.artifacts_done.wait(5)
+
+    def test_sync_ingest_waits_for_both_stages(self, ingest):
+        """Test that without async_pdf the PDF url is returned after artifacts are cached."""
+        ingest.artifacts_release.set()
+
+        assert ingest.ingest_resume(b"docx") == {"pdf_url": "https://a.pdf"}
+        assert ingest.artifacts_done.is_set()
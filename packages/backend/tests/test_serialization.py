@@ -0,0 +1,43 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from docx import Document
+
+
+@pytest.fixture
+def serialization(import_with_env):
+    return import_with_env("docx_functions.marshaling.serialization")
+
+
+def make_docx(directory, name: str) -> str:
+    doc = Document()
+    for idx in range(40):
+        doc.add_paragraph(f"{name} paragraph {idx}")
+    path = os.path.join(directory, f"{name}.docx")
+    doc.save(path)
+    return path
+
+
+@pytest.mark.unit
+class TestSerializeRawDocx:
+    def test_concurrent_calls_get_their_own_markdown(self, serialization, tmp_path):
+        """Test that documents serialized at the same time don't read each other's markdown."""
+        paths = [make_docx(tmp_path, f"doc{idx}") for idx in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            markdowns = list(executor.map(serialization.serialize_raw_docx, paths * 4))
+
+        for path, markdown in zip(paths * 4, markdowns):
+            name = os.path.basename(path)[: -len(".docx")]
+            assert markdown.count(f"{name} paragraph") == 40
+            assert markdown.count("paragraph") == 40
+
+    def test_temp_markdown_is_removed(self, serialization, tmp_path, monkeypatch):
+        """Test that the intermediate markdown file doesn't outlive the call."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        path = make_docx(tmp_path, "resume")
+
+        assert "resume paragraph 0" in serialization.serialize_raw_docx(path)
+        assert not list(tmp_path.glob("*.md"))
@@ -0,0 +1,130 @@
+import time
+
+import pytest
+from docx import Document
+
+
+@pytest.fixture
+def context_module(import_with_env, monkeypatch):
+    """Import tailoring_context with each input leg replaced by a slow fake."""
+    module = import_with_env("tailoring_context")
+
+    def slow(value):
+        time.sleep(0.1)
+        return value
+
+    monkeypatch.setattr(
+        module, "fetch_job_description_markdown", lambda link: slow("**Role**")
+    )
+    monkeypatch.setattr(
+        module,
+        "fetch_and_download_resume",
+        lambda user_id, name: slow(f"/tmp/{user_id}/{name}"),
+    )
+    monkeypatch.setattr(
+        module, "load_raw_resume_markdown", lambda path: f"resume at {path}"
+    )
+    monkeypatch.setattr(
+        module,
+        "fetch_and_download_cover_letter",
+        lambda user_id, name: slow(f"/tmp/{user_id}/cl/{name}"),
+    )
+    monkeypatch.setattr(module, "serialize_raw_docx", lambda path: f"letter at {path}")
+    monkeypatch.setattr(
+        module,
+        "cache_get_object",
+        lambda chat_id: slow({"chat_history": ["hi"], "questions": {"q": 1}}),
+    )
+    return module
+
+
+@pytest.mark.unit
+class TestGatherTailoringContext:
+    def test_legs_run_concurrently(self, context_module):
+        """Test that every requested input is gathered in about the time of the slowest."""
+        start = time.perf_counter()
+        context = context_module.gather_tailoring_context(
+            "user",
+            job_description_link="https://www.linkedin.com/jobs/view/1/",
+            resume_name="resume.docx",
+            cover_letter_name="letter.docx",
+            chat_id="chat",
+        )
+
+        assert time.perf_counter() - start < 0.3
+        assert context.job_description == "**Role**"
+        assert context.resume_path == "/tmp/user/resume.docx"
+        assert context.resume_markdown == "resume at /tmp/user/resume.docx"
+        assert context.cover_letter_markdown == "letter at /tmp/user/cl/letter.docx"
+        assert context.chat_history == ["hi"]
+        assert context.questions == {"q": 1}
+        assert set(context.stage_timings_ms) == {
+            "job_description",
+            "resume",
+            "cover_letter",
+            "chat",
+        }
+
+    def test_unrequested_inputs_are_skipped(self, context_module):
+        """Test that only the requested legs run and the rest are left as None."""
+        context = context_module.gather_tailoring_context(
+            "user", resume_name="resume.docx", with_resume_markdown=False
+        )
+
+        assert context.resume_path == "/tmp/user/resume.docx"
+        assert context.resume_markdown is None
+        assert context.job_description is None
+        assert list(context.stage_timings_ms) == ["resume"]
+
+    def test_failed_leg_raises_its_error(self, context_module, monkeypatch):
+        """Test that a failing fetch surfaces its own error."""
+        class BlockedError(Exception):
+            pass
+
+        def blocked(link):
+            raise BlockedError("blocked")
+
+        monkeypatch.setattr(context_module, "fetch_job_description_markdown", blocked)
+
+        with pytest.raises(BlockedError, match="blocked"):
+            context_module.gather_tailoring_context(
+                "user",
+                job_description_link="https://www.linkedin.com/jobs/view/1/",
+                resume_name="resume.docx",
+            )
+
+    def test_resume_markdown_miss_skips_segmentation(
+        self, context_module, import_with_env, monkeypatch, tmp_path
+    ):
+        """Test that reading an uncached resume's markdown doesn't segment it into sections."""
+        resume_artifacts = import_with_env("resume_artifacts")
+        doc = Document()
+        doc.add_heading("Experience", level=1)
+        doc.add_paragraph("Built things", style="List Bullet")
+        resume_path = str(tmp_path / "resume.docx")
+        doc.save(resume_path)
+
+        def cache_miss(cache_id):
+            raise ValueError("Object not found in cache")
+
+        monkeypatch.setattr(resume_artifacts, "cache_get_object", cache_miss)
+        monkeypatch.setattr(
+            resume_artifacts, "cache_set_object", lambda cache_id, obj, expiry: None
+        )
+        monkeypatch.setattr(
+            resume_artifacts,
+            "parse_resume_for_sections",
+            lambda source: pytest.fail("markdown shouldn't segment the resume"),
+        )
+        monkeypatch.setattr(
+            context_module,
+            "load_raw_resume_markdown",
+            resume_artifacts.load_raw_resume_markdown,
+        )
+        monkeypatch.setattr(
+            context_module, "fetch_and_download_resume", lambda user_id, name: resume_path
+        )
+
+        context = context_module.gather_tailoring_context("user", resume_name="resume.docx")
+
+        assert "Built things" in context.resume_markdown
@@ -1,3 +1,7 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from datetime import datetime
 from utils import (
@@ -5,6 +9,8 @@ from utils import (
     generate_uuid,
     pickle_object,
     get_objects_hash,
+    run_stages_concurrently,
+    SingleFlight,
 )
 
 
@@ -91,3 +97,108 @@ class TestHashing:
         hash_small = get_objects_hash("test", digest_size=4)
         hash_large = get_objects_hash("test", digest_size=16)
         assert len(hash_small) < len(hash_large)
+
+
+@pytest.mark.unit
+class TestRunStagesConcurrently:
+    def test_stages_overlap(self):
+        """Test that stages run at once, taking as long as the slowest."""
+        def stage(value):
+            time.sleep(0.1)
+            return value
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results, timings = run_stages_concurrently(
+                executor, {name: (lambda n=name: stage(n)) for name in "abc"}
+            )
+
+        assert time.perf_counter() - start < 0.25
+        assert results == {"a": "a", "b": "b", "c": "c"}
+        assert all(seconds >= 0.1 for seconds in timings.values())
+
+    def test_failed_stage_raises(self):
+        """Test that a failing stage's error is raised."""
+        def fail():
+            raise RuntimeError("upload failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(RuntimeError, match="upload failed"):
+                run_stages_concurrently(executor, {"ok": lambda: 1, "upload": fail})
+
+    def test_failed_stage_raises_without_waiting(self):
+        """Test that a failure is raised while slower stages are still running."""
+        def slow():
+            time.sleep(0.5)
+
+        def fail():
+            time.sleep(0.05)
+            raise RuntimeError("fetch failed")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(RuntimeError, match="fetch failed"):
+                run_stages_concurrently(executor, {"slow": slow, "fetch": fail})
+            raised_after = time.perf_counter() - start
+
+        assert raised_after < 0.3
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_result(self):
+        """Test that concurrent calls for a key run the function once."""
+        single_flight = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: single_flight.do("key", work), range(4))
+            )
+
+        assert results == ["result"] * 4
+        assert len(calls) == 1
+
+    def test_errors_reach_every_caller_and_are_not_kept(self):
+        """Test that a failure is raised and the next call runs again."""
+        single_flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("fetch failed")
+
+        with pytest.raises(RuntimeError):
+            single_flight.do("key", fail)
+        assert single_flight.do("key", lambda: "ok") == "ok"
+
+    def test_interrupted_leader_releases_waiters(self):
+        """Test that a leader stopped by a BaseException fails its waiters and frees the key."""
+        single_flight = SingleFlight()
+        leader_started = threading.Event()
+        release_leader = threading.Event()
+
+        def interrupted():
+            leader_started.set()
+            release_leader.wait(5)
+            raise KeyboardInterrupt()
+
+        def lead():
+            with pytest.raises(KeyboardInterrupt):
+                single_flight.do("key", interrupted)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        leader_started.wait(5)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiter = executor.submit(single_flight.do, "key", lambda: "unused")
+            time.sleep(0.05)
+            release_leader.set()
+            with pytest.raises(RuntimeError, match="interrupted"):
+                waiter.result(timeout=5)
+        leader.join(5)
+
+        assert single_flight.do("key", lambda: "ok") == "ok"